@@ -0,0 +1,120 @@
+"""Benchmark the serial and parallel evaluation of rules on a synthetic manifest.
+
+Rules are either I/O-bound, waiting for a simulated 1ms lookup, or CPU-bound,
+matching a regex. Threads only scale the latter on free-threaded builds of Python,
+e.g. `python3.13t`.
+
+Usage:
+    python benchmarks/bench_evaluation.py --models 2000 --jobs 1 2 4 8
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import Mock
+
+from bench_json_codec import synthetic_manifest
+
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.json_codec import StdlibCodec
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.rule import Rule, RuleViolation, rule
+from dbt_score.rule_registry import RuleRegistry
+
+
+def io_rule(latency: float) -> type[Rule]:
+    """A rule waiting for I/O for every model, e.g. a lookup in a catalog."""
+
+    @rule
+    def waits_for_io(model: Model) -> RuleViolation | None:
+        """Wait for I/O."""
+        time.sleep(latency)
+        return None
+
+    return waits_for_io
+
+
+def cpu_rule() -> type[Rule]:
+    """A rule matching a regex many times for every model."""
+    pattern = re.compile(r"(\w+)_(\d+)\s*$")
+
+    @rule
+    def matches_regex(model: Model) -> RuleViolation | None:
+        """Match a regex."""
+        for column in model.columns * 20:
+            pattern.match(column.name + " " * 50)
+        return None
+
+    return matches_regex
+
+
+def evaluate(
+    manifest_path: Path, rules: list[type[Rule]], jobs: int, executor: str
+) -> Callable[[], Any]:
+    """A function evaluating rules, with a loaded manifest."""
+    config = Config()
+    config.overload({"jobs": jobs, "executor": executor})
+    rule_registry = RuleRegistry(config)
+    for rule_class in rules:
+        rule_registry._add_rule(rule_class)
+    manifest_loader = ManifestLoader(manifest_path)
+
+    def run() -> None:
+        Evaluation(
+            rule_registry=rule_registry,
+            manifest_loader=manifest_loader,
+            formatter=Mock(),
+            scorer=Mock(),
+            config=config,
+        ).evaluate()
+
+    return run
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    """The best duration of a function over a few runs, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of durations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=30)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gil = "enabled" if getattr(sys, "_is_gil_enabled", lambda: True)() else "disabled"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = Path(directory) / "manifest.json"
+        manifest = synthetic_manifest(args.models, args.columns)
+        manifest_path.write_text(StdlibCodec().dumps(manifest, indent=False))
+        workloads = {"io": [io_rule(latency=0.001)], "cpu": [cpu_rule()]}
+        print(f"{'rules':<6}{'executor':<10}" + "".join(f"{j:>9}j" for j in args.jobs))
+        for workload, rules in workloads.items():
+            for executor in ("thread", "process"):
+                durations = [
+                    timed(evaluate(manifest_path, rules, jobs, executor), args.repeat)
+                    for jobs in args.jobs
+                ]
+                print(
+                    f"{workload:<6}{executor:<10}"
+                    + "".join(f"{duration:>9.3f}s" for duration in durations)
+                )
+
+
+if __name__ == "__main__":
+    main()
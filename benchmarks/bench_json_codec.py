@@ -0,0 +1,111 @@
+"""Benchmark the JSON backends on a synthetic large manifest.
+
+Usage:
+    python benchmarks/bench_json_codec.py --models 5000 --columns 30
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from dbt_score.json_codec import BACKENDS, JSONCodec, StdlibCodec, get_codec, read_json
+
+
+def synthetic_manifest(models: int, columns: int) -> dict[str, Any]:
+    """Generate a manifest with the shape of dbt's, with many models and columns."""
+    nodes: dict[str, Any] = {}
+    for i in range(models):
+        unique_id = f"model.package.model_{i}"
+        nodes[unique_id] = {
+            "unique_id": unique_id,
+            "name": f"model_{i}",
+            "resource_type": "model",
+            "package_name": "package",
+            "relation_name": f"db.schema.model_{i}",
+            "database": "db",
+            "schema": "schema",
+            "alias": f"model_{i}",
+            "original_file_path": f"models/model_{i}.sql",
+            "patch_path": "package://models/schema.yml",
+            "raw_code": f"select * from {{{{ ref('model_{max(0, i - 1)}') }}}}",
+            "language": "sql",
+            "access": "protected",
+            "group": None,
+            "description": f"Description of model {i}, with some unicode: é.",
+            "tags": ["daily", "finance"],
+            "meta": {"owner": "team"},
+            "constraints": [],
+            "config": {"materialized": "table", "meta": {"owner": "team"}},
+            "depends_on": {
+                "nodes": [f"model.package.model_{j}" for j in range(max(0, i - 3), i)]
+            },
+            "columns": {
+                f"column_{c}": {
+                    "name": f"column_{c}",
+                    "description": f"Column {c}.",
+                    "data_type": "varchar",
+                    "meta": {},
+                    "tags": [],
+                    "constraints": [],
+                }
+                for c in range(columns)
+            },
+        }
+    return {"metadata": {"project_name": "package"}, "nodes": nodes}
+
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    """The best duration of a function over a few runs, in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    """Run the benchmark and print a table of durations."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    manifest = synthetic_manifest(args.models, args.columns)
+    codecs: list[JSONCodec] = []
+    for name in BACKENDS:
+        try:
+            codecs.append(get_codec(name))
+        except ValueError:
+            print(f"{name}: not installed")
+
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = Path(directory) / "manifest.json"
+        manifest_path.write_text(StdlibCodec().dumps(manifest, indent=False))
+        size = manifest_path.stat().st_size / 1024 / 1024
+        print(f"Manifest of {size:.1f} MiB\n")
+
+        print(f"{'backend':<10}{'loads':>12}{'read_json':>12}{'dumps':>12}")
+        for codec in codecs:
+            loads = timed(
+                lambda codec=codec: codec.loads(  # type: ignore[misc]
+                    manifest_path.read_text(encoding="utf-8").encode("utf-8")
+                ),
+                args.repeat,
+            )
+            mmap_read = timed(
+                lambda codec=codec: read_json(manifest_path, codec),  # type: ignore[misc]
+                args.repeat,
+            )
+            dumps = timed(
+                lambda codec=codec: codec.dumps(manifest),  # type: ignore[misc]
+                args.repeat,
+            )
+            print(f"{codec.name:<10}{loads:>11.3f}s{mmap_read:>11.3f}s{dumps:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
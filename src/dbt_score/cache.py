@@ -0,0 +1,128 @@
+"""On-disk cache used to persist data between runs."""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Final
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME: Final[str] = ".dbt-score"
+MIB: Final[int] = 1024 * 1024
+DEFAULT_MAX_SIZE: Final[int] = 256 * MIB
+
+_ENTRY_SUFFIX: Final[str] = ".pickle"
+
+
+def dbt_score_version() -> str:
+    """Return the installed version of dbt-score."""
+    try:
+        return version("dbt-score")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def make_key(*parts: Any) -> str:
+    """Compute a cache key from the representation of some values."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def file_digest(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the content hash of a file."""
+    digest = hashlib.blake2b()
+    with file_path.open("rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """A size-capped key-value store of pickled values, with LRU eviction.
+
+    Every entry is stored in its own file, whose modification time is refreshed when
+    it's read. When the total size of the entries exceeds the cap, the least
+    recently used entries are evicted, except the entry just written, even if it's
+    larger than the cap. The cache is best effort: any I/O error is logged and
+    treated as a cache miss.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Instantiate a cache.
+
+        Args:
+            directory: The directory where entries are stored.
+            max_size: The maximum total size of the entries, in bytes.
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Any | None:
+        """Get the value of an entry, or None if it's not cached."""
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store the value of an entry, evicting old entries if needed."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write atomically, concurrent runs may read the same entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.debug(f"Could not write cache entry in {self.directory}: {e}")
+            return
+        self.evict(keep=self._path(key))
+
+    def delete(self, key: str) -> None:
+        """Remove an entry, if it's cached."""
+        self._path(key).unlink(missing_ok=True)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Remove the least recently used entries until the cache fits its cap.
+
+        Args:
+            keep: An entry which is never removed, e.g. the entry just written.
+        """
+        entries = []
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob(f"*{_ENTRY_SUFFIX}"):
+            path.unlink(missing_ok=True)
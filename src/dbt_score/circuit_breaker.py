@@ -0,0 +1,219 @@
+"""Limit the duration and failures of rules, disabling rules exceeding them.
+
+A rule is disabled after failing on a number of consecutive evaluables, or once the
+cumulative duration of its evaluations exceeds its time budget. All rules are
+disabled once the evaluation exceeds its maximum duration. The results of disabled
+rules are a `RuleDisabledException`, shared by all evaluables.
+
+Where possible, i.e. in the main thread of a process on platforms with `SIGALRM`,
+a rule running past its budget or the maximum duration is interrupted with a
+`RuleTimeoutException`. Asynchronous rules are cancelled instead. Otherwise,
+limits are only checked between evaluations.
+"""
+
+import asyncio
+import signal
+import threading
+from contextlib import contextmanager
+from time import monotonic, perf_counter
+from types import FrameType
+from typing import Awaitable, Callable, Iterable, Iterator, TypeVar
+
+from dbt_score.exceptions import RuleDisabledException, RuleTimeoutException
+from dbt_score.rule import Rule
+
+_T = TypeVar("_T")
+
+
+def _can_interrupt() -> bool:
+    """Whether running code can be interrupted by a timer signal."""
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+class _RuleInterrupted(BaseException):
+    """A rule was interrupted by the timer.
+
+    It isn't an `Exception`, so that rules catching exceptions can't swallow it.
+    """
+
+
+@contextmanager
+def _time_limit(seconds: float | None) -> Iterator[None]:
+    """Interrupt the block with `_RuleInterrupted` after some time."""
+    if seconds is None or not _can_interrupt():
+        yield
+        return
+
+    def interrupt(signum: int, frame: FrameType | None) -> None:
+        # Restore the handler first, so it's restored even if the timer fires
+        # while the block exits
+        signal.signal(signal.SIGALRM, previous_handler)
+        raise _RuleInterrupted
+
+    previous_handler = signal.signal(signal.SIGALRM, interrupt)
+    # A timer of 0 would be disarmed instead of firing immediately
+    signal.setitimer(signal.ITIMER_REAL, max(seconds, 1e-6))
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+class CircuitBreaker:
+    """Track the failures and durations of rules, and disable rules exceeding limits.
+
+    The breaker is shared by the threads evaluating rules. Worker processes use a
+    copy, so that failures and durations are tracked by process, and report the
+    rules they disabled.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        max_failures: int | None = None,
+        rule_budget: float | None = None,
+        max_duration: float | None = None,
+    ) -> None:
+        """Create a circuit breaker.
+
+        Args:
+            rules: The active rules. Their own `budget` overrides `rule_budget`.
+            max_failures: The number of consecutive failures disabling a rule.
+            rule_budget: The cumulative duration of a rule's evaluations, in
+                seconds, disabling it once exceeded.
+            max_duration: The duration of the evaluation, in seconds, from now,
+                disabling all rules once exceeded.
+        """
+        self._max_failures = max_failures
+        self._budgets = {
+            rule.source(): rule.budget if rule.budget is not None else rule_budget
+            for rule in rules
+        }
+        self._max_duration = max_duration
+        self._deadline = monotonic() + max_duration if max_duration else None
+        # Consecutive failures and timeouts, by rule source, counted apart
+        self._failures: dict[str, int] = {}
+        self._timeouts: dict[str, int] = {}
+        self._durations: dict[str, float] = {}
+        # For every disabled rule, by rule source, the result of its evaluations
+        self._disabled: dict[str, RuleDisabledException] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def disabled_rules(self) -> dict[str, str]:
+        """The reason why rules were disabled, by rule source."""
+        return {name: marker.reason for name, marker in self._disabled.items()}
+
+    def disable(self, rule_name: str, reason: str) -> RuleDisabledException:
+        """Disable a rule, unless it's already disabled, and get its result."""
+        with self._lock:
+            if rule_name not in self._disabled:
+                self._disabled[rule_name] = RuleDisabledException(rule_name, reason)
+            return self._disabled[rule_name]
+
+    def _time_left(self, rule_name: str) -> float | None:
+        """The time a rule can run before exceeding a limit, if any."""
+        limits = []
+        if (budget := self._budgets.get(rule_name)) is not None:
+            limits.append(budget - self._durations.get(rule_name, 0.0))
+        if self._deadline is not None:
+            limits.append(self._deadline - monotonic())
+        return min(limits) if limits else None
+
+    def _record(
+        self,
+        rule_name: str,
+        duration: float,
+        failed: bool = False,
+        timed_out: bool = False,
+    ) -> None:
+        """Record an evaluation of a rule, and disable it if it exceeds a limit.
+
+        Args:
+            rule_name: The source of the rule.
+            duration: The duration of the evaluation, in seconds.
+            failed: Whether the evaluation raised an exception.
+            timed_out: Whether the evaluation was interrupted, as it exceeded a limit.
+        """
+        with self._lock:
+            failures = self._failures[rule_name] = (
+                self._failures.get(rule_name, 0) + 1 if failed else 0
+            )
+            timeouts = self._timeouts[rule_name] = (
+                self._timeouts.get(rule_name, 0) + 1 if timed_out else 0
+            )
+            total_duration = self._durations[rule_name] = (
+                self._durations.get(rule_name, 0.0) + duration
+            )
+        budget = self._budgets.get(rule_name)
+        if self._max_failures is not None and failures >= self._max_failures:
+            self.disable(rule_name, f"it failed on {failures} consecutive evaluables")
+        elif timeouts and self._deadline is not None and monotonic() >= self._deadline:
+            self._disabled_result(rule_name)
+        elif budget is not None and (timeouts or total_duration >= budget):
+            self.disable(rule_name, f"it exceeded its time budget of {budget:g}s")
+
+    def _disabled_result(self, rule_name: str) -> RuleDisabledException | None:
+        """Get the result of a rule if it's disabled, or None."""
+        if (disabled := self._disabled.get(rule_name)) is not None:
+            return disabled
+        if self._deadline is not None and monotonic() >= self._deadline:
+            return self.disable(
+                rule_name,
+                f"the evaluation exceeded its maximum duration of "
+                f"{self._max_duration:g}s",
+            )
+        return None
+
+    def evaluate(self, rule: Rule, evaluate: Callable[[], _T]) -> _T | Exception:
+        """Evaluate a rule within its limits, or get its result if it's disabled.
+
+        Exceptions raised by the evaluation are recorded, and raised again.
+        """
+        rule_name = rule.source()
+        if (disabled := self._disabled_result(rule_name)) is not None:
+            return disabled
+
+        time_left = self._time_left(rule_name)
+        start = perf_counter()
+        try:
+            with _time_limit(time_left):
+                result = evaluate()
+        except _RuleInterrupted:
+            self._record(rule_name, perf_counter() - start, timed_out=True)
+            assert time_left is not None
+            raise RuleTimeoutException(rule_name, time_left) from None
+        except Exception:
+            self._record(rule_name, perf_counter() - start, failed=True)
+            raise
+        self._record(rule_name, perf_counter() - start)
+        return result
+
+    async def evaluate_async(
+        self, rule: Rule, evaluate: Callable[[], Awaitable[_T]]
+    ) -> _T | Exception:
+        """Evaluate an asynchronous rule within its limits, like `evaluate`.
+
+        The evaluation is cancelled when it exceeds a limit.
+        """
+        rule_name = rule.source()
+        if (disabled := self._disabled_result(rule_name)) is not None:
+            return disabled
+
+        time_left = self._time_left(rule_name)
+        start = perf_counter()
+        try:
+            result = await asyncio.wait_for(evaluate(), time_left)
+        except asyncio.TimeoutError:
+            self._record(rule_name, perf_counter() - start, timed_out=True)
+            assert time_left is not None
+            raise RuleTimeoutException(rule_name, time_left) from None
+        except Exception:
+            self._record(rule_name, perf_counter() - start, failed=True)
+            raise
+        self._record(rule_name, perf_counter() - start)
+        return result
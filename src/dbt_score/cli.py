@@ -1,20 +1,25 @@
 """CLI interface."""
 
+import cProfile
 import logging
 import traceback
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Final, Literal
+from typing import Final, Iterator, Literal
 
 import click
 from click.core import ParameterSource
 
+from dbt_score.collapsed_stacks import CollapsedStackProfiler
 from dbt_score.config import Config
 from dbt_score.dbt_utils import (
     DbtParseException,
     dbt_parse,
     get_default_manifest_path,
 )
+from dbt_score.json_codec import get_codec
 from dbt_score.lint import lint_dbt_project
+from dbt_score.profiling import Profile, phase, profiling
 from dbt_score.rule_catalog import display_catalog
 
 logger = logging.getLogger(__name__)
@@ -38,6 +43,32 @@ def cli() -> None:
     """CLI entrypoint."""
 
 
+@contextmanager
+def _deterministic_profiling(
+    cprofile: Path | None, collapsed_stacks: Path | None
+) -> Iterator[None]:
+    """Profile every call with cProfile or as collapsed stacks, and write the result.
+
+    The result is written even if linting fails.
+    """
+    if cprofile:
+        profiler = cProfile.Profile()
+        try:
+            with profiler:
+                yield
+        finally:
+            profiler.dump_stats(cprofile)
+    elif collapsed_stacks:
+        stack_profiler = CollapsedStackProfiler()
+        try:
+            with stack_profiler.profiling():
+                yield
+        finally:
+            stack_profiler.write(collapsed_stacks)
+    else:
+        yield
+
+
 @cli.command()
 @click.option(
     "--format",
@@ -86,6 +117,122 @@ def cli() -> None:
     is_flag=True,
     default=False,
 )
+@click.option(
+    "--no-write-json",
+    help="With `--run-dbt-parse`, don't write the parsed manifest to manifest.json.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--stream-manifest",
+    help="Read the manifest incrementally, keeping only the project's resources in "
+    "memory. Ignored with `--format manifest`.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--no-cache",
+    help="Don't use the cache of parsed manifests, stored next to the manifest.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--lean",
+    help="Drop the raw manifest values of evaluables once loaded, to reduce memory "
+    "usage. Rules reading `_raw_values` can't be used with this option.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--compact-results",
+    help="Store the results of the evaluation compactly, to reduce memory usage.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--compact",
+    help="Output compact JSON, without indentation, with `--format json` or "
+    "`--format manifest`.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--jobs",
+    "-j",
+    help="Number of processes evaluating rules in parallel.",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--executor",
+    help="Run parallel evaluations in processes, or in threads for I/O-bound rules "
+    "or free-threaded Python.",
+    type=click.Choice(["process", "thread"]),
+    default=None,
+)
+@click.option(
+    "--incremental",
+    help="Only evaluate what changed since the previous run, reusing its results for "
+    "the rest.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--max-duration",
+    help="Disable all rules not evaluated yet after this duration, in seconds.",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+)
+@click.option(
+    "--rule-budget",
+    help="Disable any rule after its evaluations took this duration, in seconds.",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+)
+@click.option(
+    "--max-rule-failures",
+    help="Disable any rule after it failed on this number of consecutive items.",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--async-concurrency",
+    help="Maximum number of asynchronous rules evaluated concurrently.",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--async-timeout",
+    help="Interrupt asynchronous rules after this duration, in seconds.",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+)
+@click.option(
+    "--profile",
+    help="Print the duration of linting phases, rules and filters to stderr.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--profile-output",
+    help="Write the profile as JSON to this file. Implies `--profile`.",
+    type=click.Path(path_type=Path, dir_okay=False, writable=True),
+    default=None,
+)
+@click.option(
+    "--cprofile",
+    help="Profile linting with cProfile, and write the statistics to this file, "
+    "e.g. to read with `pstats` or snakeviz.",
+    type=click.Path(path_type=Path, dir_okay=False, writable=True),
+    default=None,
+)
+@click.option(
+    "--collapsed-stacks",
+    help="Profile linting, and write the time spent in every call stack to this "
+    "file, grouped by rule, in the collapsed format of flame graphs.",
+    type=click.Path(path_type=Path, dir_okay=False, writable=True),
+    default=None,
+)
 @click.option(
     "--fail-project-under",
     help="Fail if the project score is under this value.",
@@ -100,6 +247,21 @@ def cli() -> None:
     is_flag=False,
     default=None,
 )
+@click.option(
+    "--rule-order",
+    help="Order in which rules are evaluated on every item. `registry` follows the "
+    "order of the rule registry. `cost` evaluates CRITICAL rules first, then the "
+    "cheapest rules, as declared or learned from previous runs.",
+    type=click.Choice(["registry", "cost"]),
+    default=None,
+)
+@click.option(
+    "--fail-fast",
+    help="Stop linting as soon as it fails, whatever the scores of the remaining "
+    "items, and report the items evaluated so far.",
+    is_flag=True,
+    default=False,
+)
 @click.option(
     "--show",
     help="Type of output which should be shown "
@@ -121,7 +283,7 @@ def cli() -> None:
     default=False,
 )
 @click.pass_context
-def lint(  # noqa: PLR0913, C901
+def lint(  # noqa: PLR0912, PLR0913, PLR0915, C901
     ctx: click.Context,
     format: Literal["plain", "manifest", "ascii", "json"],
     select: tuple[str, ...],
@@ -130,8 +292,28 @@ def lint(  # noqa: PLR0913, C901
     disabled_rule: list[str],
     manifest: Path,
     run_dbt_parse: bool,
+    no_write_json: bool,
+    stream_manifest: bool,
+    no_cache: bool,
+    lean: bool,
+    compact_results: bool,
+    compact: bool,
+    jobs: int | None,
+    executor: str | None,
+    incremental: bool,
+    max_duration: float | None,
+    rule_budget: float | None,
+    max_rule_failures: int | None,
+    async_concurrency: int | None,
+    async_timeout: float | None,
+    profile: bool,
+    profile_output: Path | None,
+    cprofile: Path | None,
+    collapsed_stacks: Path | None,
     fail_project_under: float | None,
     fail_any_item_under: float | None,
+    rule_order: str | None,
+    fail_fast: bool,
     show: Literal["all", "failing-items", "failing-rules"],
     debug: bool,
 ) -> None:
@@ -142,6 +324,10 @@ def lint(  # noqa: PLR0913, C901
     )
     if manifest_provided and run_dbt_parse:
         raise click.UsageError("--run-dbt-parse cannot be used with --manifest.")
+    if no_write_json and not run_dbt_parse:
+        raise click.UsageError("--no-write-json requires --run-dbt-parse.")
+    if cprofile and collapsed_stacks:
+        raise click.UsageError("--cprofile cannot be used with --collapsed-stacks.")
 
     config = Config()
     config.load()
@@ -153,21 +339,63 @@ def lint(  # noqa: PLR0913, C901
         config.overload({"fail_project_under": fail_project_under})
     if fail_any_item_under is not None:
         config.overload({"fail_any_item_under": fail_any_item_under})
+    if rule_order:
+        config.overload({"rule_order": rule_order})
+    if fail_fast:
+        config.overload({"fail_fast": fail_fast})
     if show:
         config.overload({"show": show})
     if debug:
         config.overload({"debug": debug})
+    if stream_manifest:
+        config.overload({"stream_manifest": stream_manifest})
+    if no_cache:
+        config.overload({"cache": False})
+    if lean:
+        config.overload({"lean": lean})
+    if compact_results:
+        config.overload({"compact_results": compact_results})
+    if compact:
+        config.overload({"compact_output": compact})
+    if jobs is not None:
+        config.overload({"jobs": jobs})
+    if executor:
+        config.overload({"executor": executor})
+    if incremental:
+        config.overload({"incremental": incremental})
+    if max_duration is not None:
+        config.overload({"max_duration": max_duration})
+    if rule_budget is not None:
+        config.overload({"rule_budget": rule_budget})
+    if max_rule_failures is not None:
+        config.overload({"max_rule_failures": max_rule_failures})
+    if async_concurrency is not None:
+        config.overload({"async_concurrency": async_concurrency})
+    if async_timeout is not None:
+        config.overload({"async_timeout": async_timeout})
+    if cprofile or collapsed_stacks:
+        # Only the current thread is profiled
+        config.overload({"jobs": 1})
 
+    lint_profile = Profile() if profile or profile_output else None
     try:
-        if run_dbt_parse:
-            dbt_parse()
-        evaluation = lint_dbt_project(
-            manifest_path=manifest,
-            config=config,
-            format=format,
-            select=select,
-            exclude=exclude,
-        )
+        with (
+            profiling(lint_profile),
+            _deterministic_profiling(cprofile, collapsed_stacks),
+        ):
+            # Lint the manifest parsed by dbt in memory, without reading it from disk
+            dbt_manifest = None
+            if run_dbt_parse:
+                with phase("parse"):
+                    dbt_manifest = dbt_parse(write_json=not no_write_json).result
+            evaluation = lint_dbt_project(
+                manifest_path=manifest,
+                config=config,
+                format=format,
+                select=select,
+                exclude=exclude,
+                dbt_manifest=dbt_manifest,
+            )
 
     except FileNotFoundError:
         logger.error(
@@ -184,9 +412,29 @@ def lint(  # noqa: PLR0913, C901
         logger.error(traceback.format_exc())
         ctx.exit(2)
 
+    if lint_profile:
+        click.echo(lint_profile.summary(), err=True)
+        if profile_output:
+            profile_output.write_text(
+                get_codec(config.json_backend).dumps(lint_profile.to_dict())
+            )
+
+    if evaluation.stopped_early:
+        click.echo(
+            f"Linting stopped after {len(evaluation.scores)} items, as it fails "
+            "whatever the scores of the remaining items.",
+            err=True,
+        )
+
+    if evaluation.incomplete:
+        click.echo(
+            "Linting is incomplete, as rules were interrupted or disabled.", err=True
+        )
+
     if (
         any(x.value < config.fail_any_item_under for x in evaluation.scores.values())
         or evaluation.project_score.value < config.fail_project_under
+        or evaluation.incomplete
     ):
         ctx.exit(1)
 
@@ -0,0 +1,95 @@
+"""Collapsed stacks of a lint run, grouped by rule, e.g. to draw flame graphs."""
+
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter_ns
+from types import CodeType, FrameType
+from typing import Any, Final, Iterator
+
+from dbt_score.rule import Rule
+
+ROOT: Final[str] = "dbt-score"
+
+
+def _label(code: CodeType) -> str:
+    """The label of a Python function in a stack."""
+    name = getattr(code, "co_qualname", code.co_name)  # Python 3.11+
+    return f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class CollapsedStackProfiler:
+    """A deterministic profiler, measuring the time spent in every call stack.
+
+    The time between two calls or returns is attributed to the stack running in
+    between. The stacks of rule evaluations start with the name of the rule instead
+    of the stack evaluating it, so that hot spots are grouped by the rule which
+    triggered them.
+
+    Only the thread which started the profiler is profiled.
+    """
+
+    def __init__(self) -> None:
+        """Create a profiler."""
+        # Time spent in every stack, in nanoseconds
+        self.stacks: Counter[str] = Counter()
+        self._keys = [ROOT]
+        self._last = 0
+        # Whether code objects are the evaluation of a rule
+        self._rule_codes: dict[CodeType, bool] = {}
+
+    def _rule(self, frame: FrameType) -> Rule | None:
+        """Get the rule evaluated by a frame, if it's the evaluation of a rule."""
+        code = frame.f_code
+        if not code.co_argcount or code.co_varnames[0] != "self":
+            return None
+        is_rule_code = self._rule_codes.get(code)
+        if is_rule_code is False:
+            return None
+        rule = frame.f_locals.get("self")
+        if is_rule_code is None:
+            is_rule_code = isinstance(rule, Rule) and (
+                getattr(type(rule).evaluate, "__code__", None) is code
+            )
+            self._rule_codes[code] = is_rule_code
+        return rule if is_rule_code else None
+
+    def _callback(self, frame: FrameType, event: str, arg: Any) -> None:
+        """Account for the time spent since the last event, and update the stack."""
+        self.stacks[self._keys[-1]] += perf_counter_ns() - self._last
+        if event == "call":
+            if rule := self._rule(frame):
+                self._keys.append(f"{rule.source()};{_label(frame.f_code)}")
+            else:
+                self._keys.append(f"{self._keys[-1]};{_label(frame.f_code)}")
+        elif event == "c_call":
+            name = getattr(arg, "__qualname__", getattr(arg, "__name__", repr(arg)))
+            self._keys.append(f"{self._keys[-1]};{name}")
+        elif len(self._keys) > 1:  # Returns from frames called before profiling
+            self._keys.pop()
+        # Exclude the time spent in the profiler itself
+        self._last = perf_counter_ns()
+
+    @contextmanager
+    def profiling(self) -> Iterator[None]:
+        """Profile the current thread."""
+        self._last = perf_counter_ns()
+        sys.setprofile(self._callback)
+        try:
+            yield
+        finally:
+            sys.setprofile(None)
+
+    def write(self, file_path: Path) -> None:
+        """Write the stacks in the collapsed format, with durations in microseconds.
+
+        Every line is a stack and its duration, e.g. `a;b;c 42`, as read by
+        `flamegraph.pl` or speedscope.
+        """
+        lines = [
+            f"{stack} {duration // 1000}"
+            for stack, duration in sorted(self.stacks.items())
+            if duration >= 1000  # noqa: PLR2004
+        ]
+        file_path.write_text("\n".join(lines) + "\n")
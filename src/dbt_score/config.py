@@ -59,6 +59,23 @@ class Config:
         "fail_any_item_under",
         "show",
         "debug",
+        "stream_manifest",
+        "cache",
+        "cache_max_size",
+        "lean",
+        "compact_results",
+        "json_backend",
+        "compact_output",
+        "jobs",
+        "executor",
+        "incremental",
+        "max_duration",
+        "rule_budget",
+        "max_rule_failures",
+        "async_concurrency",
+        "async_timeout",
+        "fail_fast",
+        "rule_order",
     ]
     _rules_section: Final[str] = "rules"
     _badges_section: Final[str] = "badges"
@@ -75,6 +92,23 @@ class Config:
         self.fail_any_item_under: float = 5.0
         self.show: str = "failing-rules"
         self.debug: bool = False
+        self.stream_manifest: bool = False
+        self.cache: bool = True
+        self.cache_max_size: int = 256
+        self.lean: bool = False
+        self.compact_results: bool = False
+        self.json_backend: str = "auto"
+        self.compact_output: bool = False
+        self.jobs: int = 1
+        self.executor: str = "process"
+        self.incremental: bool = False
+        self.max_duration: float | None = None
+        self.rule_budget: float | None = None
+        self.max_rule_failures: int | None = None
+        self.async_concurrency: int = 16
+        self.async_timeout: float | None = None
+        self.fail_fast: bool = False
+        self.rule_order: str = "registry"
 
     def set_option(self, option: str, value: Any) -> None:
         """Set an option in the config."""
@@ -0,0 +1,176 @@
+"""Index of the DAG of dbt resources, to compute graph metrics efficiently."""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+# Not an attribute of the index, which must be picklable to be cached
+_metrics_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class GraphMetrics:
+    """Metrics of a resource in the DAG.
+
+    Attributes:
+        downstream_count: The number of distinct models downstream.
+        upstream_count: The number of distinct resources upstream.
+        depth: The length of the longest path from a resource without parents.
+        fan_in: The number of direct parents.
+        fan_out: The number of direct children.
+        exposure_distance: The length of the longest path to a downstream exposure,
+            or None if no exposure is downstream.
+    """
+
+    downstream_count: int
+    upstream_count: int
+    depth: int
+    fan_in: int
+    fan_out: int
+    exposure_distance: int | None
+
+
+class DagIndex:
+    """An integer-indexed adjacency structure of the DAG.
+
+    Metrics of all resources are computed in a single topological pass when first
+    requested, and then looked up in constant time. Ancestors and descendants are
+    tracked as bitsets (Python integers), so shared resources in diamond-shaped
+    dependencies are only counted once.
+    """
+
+    def __init__(
+        self,
+        resource_types: Mapping[str, str],
+        parents: Mapping[str, Iterable[str]],
+    ) -> None:
+        """Build the index.
+
+        Args:
+            resource_types: The resource type of every resource, by unique id,
+                e.g. `model`.
+            parents: The unique ids of the parents of resources. Parents which are
+                not in `resource_types` are ignored.
+        """
+        self._ids = list(resource_types)
+        self._index = {unique_id: i for i, unique_id in enumerate(self._ids)}
+        self._parents: list[list[int]] = [[] for _ in self._ids]
+        self._children: list[list[int]] = [[] for _ in self._ids]
+        for unique_id, parent_ids in parents.items():
+            if (i := self._index.get(unique_id)) is None:
+                continue
+            for parent_id in dict.fromkeys(parent_ids):  # Deduplicate, keep order
+                if (p := self._index.get(parent_id)) is not None:
+                    self._parents[i].append(p)
+                    self._children[p].append(i)
+
+        self._model_mask = 0
+        self._is_exposure = [False] * len(self._ids)
+        for i, unique_id in enumerate(self._ids):
+            if resource_types[unique_id] == "model":
+                self._model_mask |= 1 << i
+            self._is_exposure[i] = resource_types[unique_id] == "exposure"
+
+        self._metrics: list[GraphMetrics] | None = None
+
+    def __contains__(self, unique_id: object) -> bool:
+        """Whether a resource is in the index."""
+        return unique_id in self._index
+
+    def __len__(self) -> int:
+        """The number of resources in the index."""
+        return len(self._ids)
+
+    def metrics(self, unique_id: str) -> GraphMetrics:
+        """Get the graph metrics of a resource."""
+        if self._metrics is None:
+            with _metrics_lock:
+                if self._metrics is None:
+                    self._metrics = self._compute_metrics()
+        return self._metrics[self._index[unique_id]]
+
+    def lineage(self, unique_ids: Iterable[str]) -> set[str]:
+        """Get the ancestors and descendants of resources, excluding themselves."""
+        start = [self._index[uid] for uid in unique_ids if uid in self._index]
+        lineage: set[int] = set()
+        for edges in (self._parents, self._children):
+            visited = set(start)
+            queue = deque(start)
+            while queue:
+                for neighbour in edges[queue.popleft()]:
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        queue.append(neighbour)
+            lineage |= visited
+        return {self._ids[i] for i in lineage.difference(start)}
+
+    def neighbours(self, unique_ids: Iterable[str]) -> set[str]:
+        """Get the direct parents and children of resources, excluding themselves."""
+        start = {self._index[uid] for uid in unique_ids if uid in self._index}
+        neighbours = {
+            neighbour
+            for i in start
+            for edges in (self._parents, self._children)
+            for neighbour in edges[i]
+        }
+        return {self._ids[i] for i in neighbours.difference(start)}
+
+    def _topological_order(self) -> list[int]:
+        """Sort the resources topologically, parents first."""
+        in_degree = [len(parents) for parents in self._parents]
+        queue = deque(i for i, degree in enumerate(in_degree) if degree == 0)
+        order: list[int] = []
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for child in self._children[i]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+
+        if len(order) < len(self._ids):
+            # Resources in a cycle, which dbt doesn't allow: append them as is
+            seen = set(order)
+            order.extend(i for i in range(len(self._ids)) if i not in seen)
+        return order
+
+    def _compute_metrics(self) -> list[GraphMetrics]:
+        """Compute the metrics of all resources."""
+        order = self._topological_order()
+        size = len(self._ids)
+
+        ancestors = [0] * size
+        depth = [0] * size
+        for i in order:
+            for parent in self._parents[i]:
+                ancestors[i] |= ancestors[parent] | (1 << parent)
+                depth[i] = max(depth[i], depth[parent] + 1)
+
+        descendants = [0] * size
+        exposure_distance: list[int | None] = [None] * size
+        for i in reversed(order):
+            for child in self._children[i]:
+                descendants[i] |= descendants[child] | (1 << child)
+                distance = exposure_distance[child]
+                if distance is not None:
+                    distance += 1
+                elif self._is_exposure[child]:
+                    distance = 1
+                if distance is not None:
+                    current = exposure_distance[i]
+                    exposure_distance[i] = (
+                        distance if current is None else max(current, distance)
+                    )
+
+        return [
+            GraphMetrics(
+                downstream_count=(descendants[i] & self._model_mask).bit_count(),
+                upstream_count=ancestors[i].bit_count(),
+                depth=depth[i],
+                fan_in=len(self._parents[i]),
+                fan_out=len(self._children[i]),
+                exposure_distance=exposure_distance[i],
+            )
+            for i in range(size)
+        ]
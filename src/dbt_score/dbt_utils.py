@@ -65,17 +65,22 @@ def _disable_dbt_stdout() -> Iterator[None]:
 
 
 @dbt_required
-def dbt_parse() -> "dbtRunnerResult":
+def dbt_parse(write_json: bool = True) -> "dbtRunnerResult":
     """Parse a dbt project.
 
+    Args:
+        write_json: Write the manifest to `manifest.json`. It's otherwise only
+            available in memory, as the result of the run.
+
     Returns:
         The dbt parse run result.
 
     Raises:
         DbtParseException: dbt parse failed.
     """
+    cmd = ["parse"] if write_json else ["parse", "--no-write-json"]
     with _disable_dbt_stdout():
-        result: "dbtRunnerResult" = dbtRunner().invoke(["parse"])
+        result: "dbtRunnerResult" = dbtRunner().invoke(cmd)
 
     if not result.success:
         raise DbtParseException(root_cause=result.exception)
@@ -85,9 +90,18 @@ def dbt_parse() -> "dbtRunnerResult":
 
 @dbt_required
 def dbt_ls(
-    select: Iterable[str] | None, exclude: Iterable[str] | None = None
+    select: Iterable[str] | None,
+    exclude: Iterable[str] | None = None,
+    manifest: Any = None,
 ) -> Iterable[str]:
-    """Run dbt ls."""
+    """Run dbt ls.
+
+    Args:
+        select: An optional dbt selection.
+        exclude: An optional dbt exclusion.
+        manifest: An optional dbt `Manifest` object, e.g. from `dbt_parse`, to
+            avoid parsing the project again.
+    """
     cmd = [
         "ls",
         "--resource-types",
@@ -105,7 +119,7 @@ def dbt_ls(
         cmd += ["--exclude", *exclude]
 
     with _disable_dbt_stdout():
-        result: "dbtRunnerResult" = dbtRunner().invoke(cmd)
+        result: "dbtRunnerResult" = dbtRunner(manifest=manifest).invoke(cmd)
 
     if not result.success:
         raise DbtLsException("dbt ls failed.") from result.exception
@@ -114,6 +128,11 @@ def dbt_ls(
     return selected
 
 
+def manifest_to_dict(manifest: Any) -> dict[str, Any]:
+    """Convert a dbt `Manifest` object to the content of `manifest.json`."""
+    return cast(dict[str, Any], manifest.writable_manifest().to_dict(omit_none=False))
+
+
 def get_default_manifest_path() -> Path:
     """Get the manifest path."""
     return (
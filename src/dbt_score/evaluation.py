@@ -2,15 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
 import pdb
+import pickle
 import traceback
-from itertools import chain
-from typing import Type, cast
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Generator,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Type,
+    cast,
+)
 
+from dbt_score.circuit_breaker import CircuitBreaker
 from dbt_score.config import Config
+from dbt_score.exceptions import (
+    RuleDisabledException,
+    RuleFailedException,
+    RuleTimeoutException,
+)
 from dbt_score.formatters import Formatter
+from dbt_score.incremental import IncrementalState, evaluable_fingerprint
 from dbt_score.models import Evaluable, ManifestLoader
-from dbt_score.rule import Rule, RuleViolation
+from dbt_score.profiling import Profile, Timing, active_profile, phase
+from dbt_score.result_store import ResultStore
+from dbt_score.rule import Rule, RuleViolation, Severity
+from dbt_score.rule_cache import MISSING, RuleResultCache
+from dbt_score.rule_costs import RuleCosts
 from dbt_score.rule_registry import RuleRegistry
 from dbt_score.scoring import Score, Scorer
 
@@ -20,6 +48,72 @@ from dbt_score.scoring import Score, Scorer
 # - An Exception if the rule failed to run
 EvaluableResultsType = dict[Type[Rule], None | RuleViolation | Exception]
 
+# The results of a chunk of evaluables, as sent back by a worker process: for each
+# evaluable, the index of every evaluated rule among the rules of its resource type,
+# and its result
+ChunkResultsType = list[list[tuple[int, None | RuleViolation | Exception]]]
+
+# The reason why rules were disabled, by rule source
+DisabledRulesType = dict[str, str]
+
+# The results of rules evaluated separately, e.g. batch rules, by rule and
+# evaluable. Evaluables excluded by the filters of a rule are missing.
+RuleResultsType = dict[Type[Rule], dict[Evaluable, None | RuleViolation | Exception]]
+
+# The rules applying to each resource type
+DispatchType = Mapping[type[Evaluable], Sequence[Rule]]
+
+# Executors of parallel evaluations
+PROCESS_EXECUTOR = "process"
+THREAD_EXECUTOR = "thread"
+
+# Orders of evaluation of the rules of an evaluable
+REGISTRY_ORDER = "registry"
+COST_ORDER = "cost"
+
+# Number of chunks per worker, to balance uneven evaluation durations
+CHUNKS_PER_JOB = 4
+
+
+@dataclass(frozen=True)
+class _RuleContext:
+    """How rules are evaluated, and the state they share across evaluables."""
+
+    debug: bool = False
+    rule_cache: RuleResultCache | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    rule_costs: RuleCosts | None = None
+    # Whether to skip the remaining rules of an evaluable once its score is
+    # decided by a CRITICAL violation
+    short_circuit: bool = False
+
+
+# The evaluables and rules of the evaluation running in the parent process, which
+# forked worker processes inherit without pickling them
+_worker_state: tuple[Sequence[Evaluable], DispatchType, _RuleContext] | None = None
+
+
+@dataclass
+class EvaluationStats:
+    """Statistics of an evaluation, counting pairs of rules and evaluables.
+
+    Attributes:
+        pairs: All pairs of rules and evaluables.
+        skipped: The pairs never considered, as the rule targets another resource
+            type.
+        filtered: The pairs not evaluated, as a filter of the rule excluded the
+            evaluable, or as a CRITICAL violation already decided its score.
+        evaluated: The pairs evaluated, including the rules which failed to run.
+        reused: The pairs not evaluated, as the evaluable didn't change since the
+            previous evaluation, in incremental mode.
+    """
+
+    pairs: int = 0
+    skipped: int = 0
+    filtered: int = 0
+    evaluated: int = 0
+    reused: int = 0
+
 
 class Evaluation:
     """Evaluate a set of rules on a set of nodes."""
@@ -31,6 +125,9 @@ class Evaluation:
         formatter: Formatter,
         scorer: Scorer,
         config: Config,
+        incremental_state: IncrementalState | None = None,
+        rule_cache: RuleResultCache | None = None,
+        rule_costs: RuleCosts | None = None,
     ) -> None:
         """Create an Evaluation object.
 
@@ -40,68 +137,754 @@ class Evaluation:
             formatter: A formatter to display results.
             scorer: A scorer to compute scores.
             config: A configuration.
+            incremental_state: Optional results of previous evaluations, reused for
+                the evaluables which didn't change, and updated.
+            rule_cache: Optional cache of the results of cacheable rules.
+            rule_costs: Optional costs of rules, updated with the measured
+                durations. Rules are evaluated by cost with the `cost` rule order,
+                using declared costs only if not provided.
         """
         self._rule_registry = rule_registry
         self._manifest_loader = manifest_loader
         self._formatter = formatter
         self._scorer = scorer
         self._config = config
+        self._incremental_state = incremental_state
+        self._rule_cache = rule_cache
+        self._rule_costs = rule_costs or (
+            RuleCosts() if config.rule_order == COST_ORDER else None
+        )
 
-        # For each evaluable, its results
-        self.results: dict[Evaluable, EvaluableResultsType] = {}
+        # For each evaluable, its results, unless streamed with `iter_evaluate`,
+        # stored compactly with `compact_results`
+        self.results: MutableMapping[Evaluable, EvaluableResultsType] = (
+            ResultStore(rule.__class__ for rule in self._rule_registry.rules.values())
+            if config.compact_results
+            else {}
+        )
 
-        # For each evaluable, its computed score
+        # For each evaluable, its computed score, unless streamed with `iter_evaluate`
         self.scores: dict[Evaluable, Score] = {}
 
         # The aggregated project score
         self.project_score: Score
 
+        # Statistics of the evaluation
+        self.stats = EvaluationStats()
+
+        # The rules disabled during the evaluation, with the reason why
+        self.disabled_rules: dict[Type[Rule], str] = {}
+
+        self._context = _RuleContext()
+
+        # Whether the evaluation stopped before evaluating all evaluables, as its
+        # outcome was already decided, with `fail_fast`
+        self.stopped_early = False
+        # Whether rules were interrupted or disabled, so that scores are incomplete
+        self.incomplete = False
+        # The running aggregate of the scores of evaluables
+        self._aggregate = scorer.aggregate()
+
     def evaluate(self) -> None:
-        """Evaluate all rules."""
-        rules = self._rule_registry.rules.values()
+        """Evaluate all rules, keeping the results and scores of all evaluables.
 
-        for evaluable in chain(
-            self._manifest_loader.models.values(),
-            self._manifest_loader.sources.values(),
-            self._manifest_loader.snapshots.values(),
-            self._manifest_loader.exposures.values(),
-            self._manifest_loader.seeds.values(),
-            self._manifest_loader.macros.values(),
+        With the `cost` rule order, the remaining rules of an evaluable are skipped
+        once a CRITICAL violation decides its score, if the formatter only reports
+        scores.
+        """
+        for evaluable, evaluable_results, score in self._iter_evaluate(
+            short_circuit=not self._formatter.requires_results
         ):
-            # type inference on elements from `chain` is wonky
-            # and resolves to superclass HasColumnsMixin
-            evaluable = cast(Evaluable, evaluable)
-            self.results[evaluable] = {}
-            for rule in rules:
-                try:
-                    if rule.should_evaluate(evaluable):
-                        result = rule.evaluate(evaluable, **rule.config)
-                        self.results[evaluable][rule.__class__] = result
-                except Exception as e:
-                    if self._config.debug:
-                        traceback.print_exc()
-                        pdb.post_mortem()
-                    self.results[evaluable][rule.__class__] = e
-
-            self.scores[evaluable] = self._scorer.score_evaluable(
-                self.results[evaluable]
+            self.results[evaluable] = evaluable_results
+            self.scores[evaluable] = score
+
+    def iter_evaluate(
+        self,
+    ) -> Generator[tuple[Evaluable, EvaluableResultsType, Score], None, None]:
+        """Evaluate all rules, yielding the results of evaluables one at a time.
+
+        Results and scores aren't kept by the evaluation, only their aggregate. Rules
+        are evaluated one evaluable at a time, except batch and asynchronous rules,
+        whose results are computed for all evaluables before the first one is
+        yielded. Formatters may also keep results, e.g. `json` and `plain`. The
+        project score is computed once all evaluables have been yielded.
+
+        Yields:
+            Every evaluable, with its results and score, as soon as it's evaluated.
+        """
+        yield from self._iter_evaluate(short_circuit=False)
+
+    def _iter_evaluate(
+        self, short_circuit: bool
+    ) -> Generator[tuple[Evaluable, EvaluableResultsType, Score], None, None]:
+        """Evaluate all rules, yielding the results of evaluables one at a time.
+
+        Args:
+            short_circuit: Whether only scores are needed, so that the remaining
+                rules of an evaluable can be skipped once a CRITICAL violation
+                decides its score, with the `cost` rule order.
+        """
+        dispatch = self._rule_registry.rules_by_resource_type
+        cost_ordered = self._config.rule_order == COST_ORDER and bool(self._rule_costs)
+        self._context = _RuleContext(
+            debug=self._config.debug,
+            rule_cache=self._rule_cache,
+            circuit_breaker=self._create_circuit_breaker(),
+            rule_costs=self._rule_costs,
+            short_circuit=short_circuit and cost_ordered,
+        )
+
+        evaluables = self._manifest_loader.evaluables
+        fingerprints = self._fingerprints(evaluables, dispatch)
+        reused = self._reused_results(evaluables, fingerprints)
+        evaluated = [e for i, e in enumerate(evaluables) if i not in reused]
+        # Batch rules read all evaluables of their resource type, so they're never
+        # reused. They're evaluated first, as well as asynchronous rules, on an
+        # event loop. Other rules are evaluated one evaluable at a time.
+        batch_results = self._evaluate_batch_rules(evaluables, dispatch)
+        async_results = self._evaluate_async_rules(evaluated, dispatch)
+        item_dispatch = {
+            resource_type: [
+                rule for rule in rules if not rule.batch and not rule.asynchronous
+            ]
+            for resource_type, rules in dispatch.items()
+        }
+        if cost_ordered and self._rule_costs:
+            item_dispatch = {
+                resource_type: self._rule_costs.order(rules)
+                for resource_type, rules in item_dispatch.items()
+            }
+        results = self._evaluate_all(evaluated, item_dispatch)
+
+        rule_count = len(self._rule_registry.rules)
+        # Results are consumed in order by this thread only, so formatter callbacks
+        # are serialized, whatever the executor
+        try:
+            for i, evaluable in enumerate(evaluables):
+                rules = dispatch.get(type(evaluable), ())
+                self.stats.pairs += rule_count
+                self.stats.skipped += rule_count - len(rules)
+                if i in reused:
+                    evaluable_results = reused[i]
+                else:
+                    # Results are reported in registry order, whatever the rule order
+                    evaluable_results = _with_results(
+                        evaluable, next(results), rules, async_results, cost_ordered
+                    )
+                    self._store_results(
+                        evaluable,
+                        evaluable_results,
+                        fingerprints[i] if fingerprints else None,
+                    )
+                evaluable_results = _with_results(
+                    evaluable, evaluable_results, rules, batch_results
+                )
+                self._count(rules, evaluable_results, reused=i in reused)
+                self.incomplete = self.incomplete or any(
+                    isinstance(result, (RuleDisabledException, RuleTimeoutException))
+                    for result in evaluable_results.values()
+                )
+
+                with phase("score"):
+                    score = self._scorer.score_evaluable(evaluable_results)
+                    self._aggregate.add(score)
+                with phase("format"):
+                    self._formatter.evaluable_evaluated(
+                        evaluable, evaluable_results, score
+                    )
+                yield evaluable, evaluable_results, score
+
+                if self._config.fail_fast and self._fails_anyway(
+                    score, remaining=len(evaluables) - i - 1
+                ):
+                    self.stopped_early = i < len(evaluables) - 1
+                    break
+        finally:
+            # Stop evaluating the remaining evaluables, if any
+            results.close()
+
+        self._project_evaluated(has_evaluables=bool(evaluables))
+
+    def _project_evaluated(self, has_evaluables: bool) -> None:
+        """Persist what was learned by the evaluation, and score the project."""
+        if self._incremental_state:
+            # Unselected resources of the project keep their results
+            self._incremental_state.save(known_ids=self._manifest_loader.dag)
+        if self._rule_cache:
+            self._rule_cache.save()
+        if self._rule_costs:
+            self._rule_costs.save()
+
+        if self._context.circuit_breaker:
+            self._report_disabled_rules(self._context.circuit_breaker)
+
+        # Compute score for project
+        with phase("score"):
+            self.project_score = self._scorer.score_aggregate_evaluables(
+                self._aggregate
             )
-            self._formatter.evaluable_evaluated(
-                evaluable, self.results[evaluable], self.scores[evaluable]
+
+        # Add null check before calling project_evaluated
+        if has_evaluables:
+            with phase("format"):
+                self._formatter.project_evaluated(self.project_score)
+
+    def _evaluate_batch_rules(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> RuleResultsType:
+        """Evaluate batch rules, on all evaluables of their resource type at once."""
+        evaluables_by_type: defaultdict[type[Evaluable], list[Evaluable]] = defaultdict(
+            list
+        )
+        for evaluable in evaluables:
+            evaluables_by_type[type(evaluable)].append(evaluable)
+
+        return {
+            rule.__class__: _evaluate_batch_rule(
+                rule,
+                evaluables_by_type[resource_type],
+                self._config.debug,
+                self._context.circuit_breaker,
             )
+            for resource_type, rules in dispatch.items()
+            for rule in rules
+            if rule.batch
+        }
 
-        # Compute score for project
-        self.project_score = self._scorer.score_aggregate_evaluables(
-            list(self.scores.values())
+    def _evaluate_async_rules(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> RuleResultsType:
+        """Evaluate asynchronous rules concurrently, on an event loop.
+
+        When an event loop is already running in this thread, e.g. in a notebook,
+        rules are evaluated on a new event loop in a worker thread.
+        """
+        pairs = [
+            (rule, evaluable)
+            for evaluable in evaluables
+            for rule in dispatch.get(type(evaluable), ())
+            if rule.asynchronous
+        ]
+        if not pairs:
+            return {}
+        coroutine = _evaluate_async_rules(
+            pairs,
+            concurrency=self._config.async_concurrency,
+            timeout=self._config.async_timeout,
+            context=self._context,
         )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
 
-        # Add null check before calling project_evaluated
+    def _count(
+        self,
+        rules: Sequence[Rule],
+        evaluable_results: EvaluableResultsType,
+        reused: bool,
+    ) -> None:
+        """Count the pairs of rules and an evaluable in the statistics."""
+        if not reused:
+            self.stats.evaluated += len(evaluable_results)
+            self.stats.filtered += len(rules) - len(evaluable_results)
+            return
+        # Batch rules are evaluated again
+        batch_rule_count = sum(rule.batch for rule in rules)
+        batch_evaluated = sum(rule_class.batch for rule_class in evaluable_results)
+        self.stats.reused += len(rules) - batch_rule_count
+        self.stats.evaluated += batch_evaluated
+        self.stats.filtered += batch_rule_count - batch_evaluated
+
+    def _store_results(
+        self,
+        evaluable: Evaluable,
+        evaluable_results: EvaluableResultsType,
+        fingerprint: str | None,
+    ) -> None:
+        """Store new results in the rule cache and the incremental state."""
+        if self._rule_cache:
+            for rule, result in evaluable_results.items():
+                # Failures may be transient, they're not cached
+                if not isinstance(result, Exception):
+                    self._rule_cache.set(rule, evaluable, result)
+        if self._incremental_state:
+            interrupted = any(
+                isinstance(result, (RuleDisabledException, RuleTimeoutException))
+                or (
+                    # The remaining rules were skipped
+                    self._context.short_circuit
+                    and rule.severity == Severity.CRITICAL
+                    and isinstance(result, RuleViolation)
+                )
+                for rule, result in evaluable_results.items()
+            )
+            self._incremental_state.set(
+                evaluable.unique_id,
+                # Interrupted evaluations are evaluated again next time
+                None if interrupted else fingerprint,
+                {
+                    rule.source(): _picklable(result)
+                    for rule, result in evaluable_results.items()
+                },
+            )
+
+    def _report_disabled_rules(self, circuit_breaker: CircuitBreaker) -> None:
+        """Report the rules disabled by the circuit breaker, if any."""
+        rules = self._rule_registry.rules
+        self.disabled_rules = {
+            rules[name].__class__: reason
+            for name, reason in circuit_breaker.disabled_rules.items()
+        }
+        if self.disabled_rules:
+            with phase("format"):
+                self._formatter.rules_disabled(self.disabled_rules)
+
+    def _fails_anyway(self, score: Score, remaining: int) -> bool:
+        """Whether linting fails, whatever the scores of the remaining evaluables.
+
+        Linting fails when an evaluable scores under `fail_any_item_under`, or when
+        the project score is under `fail_project_under` even if all remaining
+        evaluables get the maximum score. The project score is the minimum score as
+        soon as any evaluable has it, e.g. with a CRITICAL violation.
+        """
+        if score.value < self._config.fail_any_item_under:
+            return True
+        if self._aggregate.min_score_reached:
+            max_project_score = self._scorer.min_score
+        else:
+            max_project_score = (
+                self._aggregate.total + remaining * self._scorer.max_score
+            ) / (self._aggregate.count + remaining)
+        return max_project_score < self._config.fail_project_under
+
+    def _create_circuit_breaker(self) -> CircuitBreaker | None:
+        """Create a circuit breaker, if rules have any limit."""
+        rules = self._rule_registry.rules.values()
+        if (
+            self._config.max_rule_failures is None
+            and self._config.rule_budget is None
+            and self._config.max_duration is None
+            and all(rule.budget is None for rule in rules)
+        ):
+            return None
+        return CircuitBreaker(
+            rules,
+            max_failures=self._config.max_rule_failures,
+            rule_budget=self._config.rule_budget,
+            max_duration=self._config.max_duration,
+        )
+
+    def _fingerprints(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> list[str | None]:
+        """Compute the fingerprints of evaluables, in incremental mode.
+
+        Evaluables without any rule aren't fingerprinted, as they're never evaluated.
+        """
+        if self._incremental_state is None:
+            return []
+        graph_sensitive_types = {
+            resource_type
+            for resource_type, rules in dispatch.items()
+            if any(rule.graph_sensitive for rule in rules)
+        }
+        return [
+            evaluable_fingerprint(
+                evaluable, graph_sensitive=type(evaluable) in graph_sensitive_types
+            )
+            if dispatch.get(type(evaluable))
+            else None
+            for evaluable in evaluables
+        ]
+
+    def _reused_results(
+        self, evaluables: Sequence[Evaluable], fingerprints: Sequence[str | None]
+    ) -> dict[int, EvaluableResultsType]:
+        """Get the results of unchanged evaluables, by index, in incremental mode."""
+        if self._incremental_state is None:
+            return {}
+        rules = self._rule_registry.rules
+        reused: dict[int, EvaluableResultsType] = {}
+        for i, (evaluable, fingerprint) in enumerate(
+            zip(evaluables, fingerprints, strict=True)
+        ):
+            results = self._incremental_state.get(evaluable.unique_id, fingerprint)
+            if results is not None and all(name in rules for name in results):
+                reused[i] = {
+                    rules[name].__class__: result for name, result in results.items()
+                }
+        return reused
+
+    def _evaluate_all(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> Generator[EvaluableResultsType, None, None]:
+        """Evaluate rules on evaluables, serially or in parallel."""
+        if not self._parallel(evaluables):
+            return (
+                _evaluate_rules(
+                    evaluable, dispatch.get(type(evaluable), ()), self._context
+                )
+                for evaluable in evaluables
+            )
+        if self._config.executor == THREAD_EXECUTOR:
+            return self._evaluate_threads(evaluables, dispatch)
+        return self._evaluate_processes(evaluables, dispatch)
+
+    def _parallel(self, evaluables: Sequence[Evaluable]) -> bool:
+        """Whether to evaluate rules in parallel.
+
+        Worker processes are forked, to inherit the loaded manifest and rules. When
+        forking isn't supported, e.g. on Windows, rules are evaluated serially.
+        Debugging requires the terminal, so it's only possible serially. Rules are
+        also evaluated serially when profiling, for durations not to overlap.
+        """
+        return (
+            self._config.jobs > 1
+            and len(evaluables) > 1
+            and not self._config.debug
+            and active_profile() is None
+            and (
+                self._config.executor == THREAD_EXECUTOR
+                or "fork" in multiprocessing.get_all_start_methods()
+            )
+        )
+
+    def _chunks(self, evaluables: Sequence[Evaluable]) -> list[range]:
+        """Split the indices of evaluables in contiguous chunks, for workers."""
+        chunk_size = -(-len(evaluables) // (self._config.jobs * CHUNKS_PER_JOB))
+        return [
+            range(start, min(start + chunk_size, len(evaluables)))
+            for start in range(0, len(evaluables), chunk_size)
+        ]
+
+    def _evaluate_threads(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> Generator[EvaluableResultsType, None, None]:
+        """Evaluate rules in a pool of threads.
+
+        Threads only run concurrently while rules wait for I/O, or on free-threaded
+        builds of Python. Results are yielded in the original order as soon as
+        they're available.
+        """
+        context = replace(self._context, debug=False)
+
+        def evaluate_chunk(indices: range) -> list[EvaluableResultsType]:
+            return [
+                _evaluate_rules(
+                    evaluables[i], dispatch.get(type(evaluables[i]), ()), context
+                )
+                for i in indices
+            ]
+
+        executor = ThreadPoolExecutor(self._config.jobs)
+        try:
+            for chunk_results in executor.map(evaluate_chunk, self._chunks(evaluables)):
+                yield from chunk_results
+        finally:
+            # Chunks not started yet are cancelled when evaluation stops early
+            executor.shutdown(cancel_futures=True)
+
+    def _evaluate_processes(
+        self, evaluables: Sequence[Evaluable], dispatch: DispatchType
+    ) -> Generator[EvaluableResultsType, None, None]:
+        """Evaluate rules in a pool of worker processes.
+
+        Results are yielded in the original order as soon as they're available.
+        """
+        global _worker_state  # noqa: PLW0603
+
+        _worker_state = (evaluables, dispatch, replace(self._context, debug=False))
+        circuit_breaker = self._context.circuit_breaker
+        try:
+            jobs = min(self._config.jobs, len(evaluables))
+            chunks = self._chunks(evaluables)
+            with multiprocessing.get_context("fork").Pool(jobs) as pool:
+                for indices, (chunk_results, disabled_rules, durations) in zip(
+                    chunks, pool.imap(_evaluate_chunk, chunks), strict=True
+                ):
+                    # Worker processes disable rules and measure costs on their own
+                    if circuit_breaker:
+                        for name, reason in disabled_rules.items():
+                            circuit_breaker.disable(name, reason)
+                    if self._rule_costs:
+                        self._rule_costs.merge(durations)
+                    for i, evaluable_results in zip(
+                        indices, chunk_results, strict=True
+                    ):
+                        rules = dispatch.get(type(evaluables[i]), ())
+                        yield {
+                            rules[j].__class__: (
+                                # The parent shares the result of a disabled rule
+                                circuit_breaker.disable(result.rule_name, result.reason)
+                                if circuit_breaker
+                                and isinstance(result, RuleDisabledException)
+                                else result
+                            )
+                            for j, result in evaluable_results
+                        }
+        finally:
+            _worker_state = None
+
+
+def _evaluate_rules(
+    evaluable: Evaluable, rules: Iterable[Rule], context: _RuleContext
+) -> EvaluableResultsType:
+    """Evaluate rules on an evaluable, reusing the cached results of rules."""
+    results: EvaluableResultsType = {}
+    # Filters shared by several rules are evaluated once
+    filter_results: dict[str, bool] = {}
+    profile = active_profile()
+    rule_cache, circuit_breaker = context.rule_cache, context.circuit_breaker
+    for rule in rules:
+        try:
+            if not rule.should_evaluate(evaluable, filter_results):
+                continue
+            result = (
+                rule_cache.get(rule.__class__, evaluable) if rule_cache else MISSING
+            )
+            if result is MISSING:
+                result = (
+                    circuit_breaker.evaluate(
+                        rule,
+                        partial(
+                            _evaluate_rule, rule, evaluable, profile, context.rule_costs
+                        ),
+                    )
+                    if circuit_breaker
+                    else _evaluate_rule(rule, evaluable, profile, context.rule_costs)
+                )
+            results[rule.__class__] = result
+        except Exception as e:
+            results[rule.__class__] = _failure(e, context.debug)
+            continue
         if (
-            self._manifest_loader.models
-            or self._manifest_loader.sources
-            or self._manifest_loader.snapshots
-            or self._manifest_loader.exposures
-            or self._manifest_loader.seeds
-            or self._manifest_loader.macros
+            context.short_circuit
+            and rule.severity == Severity.CRITICAL
+            and isinstance(result, RuleViolation)
         ):
-            self._formatter.project_evaluated(self.project_score)
+            break
+    return results
+
+
+def _with_results(
+    evaluable: Evaluable,
+    evaluable_results: EvaluableResultsType,
+    rules: Sequence[Rule],
+    rule_results: RuleResultsType,
+    reorder: bool = False,
+) -> EvaluableResultsType:
+    """Add the results of rules evaluated separately to those of an evaluable.
+
+    Results are in rule order, as if all rules were evaluated together. With
+    `reorder`, the results of the evaluable are also put in rule order.
+    """
+    if not rule_results and not reorder:
+        return evaluable_results
+    results: EvaluableResultsType = {}
+    for rule in rules:
+        rule_class = rule.__class__
+        if rule_class in rule_results:
+            if evaluable in rule_results[rule_class]:
+                results[rule_class] = rule_results[rule_class][evaluable]
+        elif rule_class in evaluable_results:
+            results[rule_class] = evaluable_results[rule_class]
+    return results
+
+
+async def _evaluate_async_rules(
+    pairs: Sequence[tuple[Rule, Evaluable]],
+    concurrency: int,
+    timeout: float | None,
+    context: _RuleContext,
+) -> RuleResultsType:
+    """Evaluate asynchronous rules on evaluables, with bounded concurrency."""
+    semaphore = asyncio.Semaphore(concurrency)
+    results: RuleResultsType = defaultdict(dict)
+    # Filters shared by several rules are evaluated once per evaluable
+    filter_results: defaultdict[Evaluable, dict[str, bool]] = defaultdict(dict)
+    profile = active_profile()
+    rule_cache, circuit_breaker = context.rule_cache, context.circuit_breaker
+
+    async def evaluate(rule: Rule, evaluable: Evaluable) -> None:
+        rule_results = results[rule.__class__]
+        try:
+            if not rule.should_evaluate(evaluable, filter_results[evaluable]):
+                return
+            result = (
+                rule_cache.get(rule.__class__, evaluable) if rule_cache else MISSING
+            )
+            if result is MISSING:
+                call = partial(_evaluate_async_rule, rule, evaluable, timeout, profile)
+                async with semaphore:
+                    result = (
+                        await circuit_breaker.evaluate_async(rule, call)
+                        if circuit_breaker
+                        else await call()
+                    )
+            rule_results[evaluable] = result
+        except Exception as e:
+            rule_results[evaluable] = _failure(e, context.debug)
+
+    await asyncio.gather(*(evaluate(rule, evaluable) for rule, evaluable in pairs))
+    return results
+
+
+async def _evaluate_async_rule(
+    rule: Rule, evaluable: Evaluable, timeout: float | None, profile: Profile | None
+) -> RuleViolation | None:
+    """Evaluate an asynchronous rule, recording its duration when profiling."""
+    start = perf_counter()
+    try:
+        return await asyncio.wait_for(
+            cast(
+                Awaitable[RuleViolation | None],
+                rule.evaluate(evaluable, **rule.config),
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        assert timeout is not None
+        raise RuleTimeoutException(rule.source(), timeout) from None
+    finally:
+        if profile is not None:
+            profile.record_rule(
+                rule.source(),
+                type(evaluable).__name__,
+                evaluable.unique_id,
+                perf_counter() - start,
+            )
+
+
+def _evaluate_batch_rule(
+    rule: Rule,
+    evaluables: Sequence[Evaluable],
+    debug: bool,
+    circuit_breaker: CircuitBreaker | None = None,
+) -> dict[Evaluable, None | RuleViolation | Exception]:
+    """Evaluate a batch rule on the evaluables which its filters allow."""
+    results: dict[Evaluable, None | RuleViolation | Exception] = {}
+    selected = []
+    for evaluable in evaluables:
+        try:
+            if rule.should_evaluate(evaluable):
+                selected.append(evaluable)
+        except Exception as e:
+            results[evaluable] = _failure(e, debug)
+    if not selected:
+        return results
+
+    evaluate = partial(_evaluate_batch, rule, selected, active_profile())
+    violations: Mapping[Evaluable, RuleViolation | None] | Exception
+    try:
+        violations = (
+            circuit_breaker.evaluate(rule, evaluate) if circuit_breaker else evaluate()
+        )
+    except Exception as e:
+        violations = _failure(e, debug)
+    for evaluable in selected:
+        results[evaluable] = (
+            violations
+            if isinstance(violations, Exception)
+            else violations.get(evaluable)
+        )
+    return results
+
+
+def _failure(e: Exception, debug: bool) -> Exception:
+    """Get the result of a failed evaluation, debugging it if enabled."""
+    if debug:
+        traceback.print_exc()
+        pdb.post_mortem()
+    # Tracebacks would keep the frames of every failure in memory
+    return e.with_traceback(None)
+
+
+def _evaluate_rule(
+    rule: Rule,
+    evaluable: Evaluable,
+    profile: Profile | None,
+    rule_costs: RuleCosts | None = None,
+) -> RuleViolation | None:
+    """Evaluate a rule on an evaluable, recording its duration when needed."""
+    if profile is None and rule_costs is None:
+        return rule.evaluate(evaluable, **rule.config)
+    start = perf_counter()
+    try:
+        return rule.evaluate(evaluable, **rule.config)
+    finally:
+        duration = perf_counter() - start
+        if profile:
+            profile.record_rule(
+                rule.source(), type(evaluable).__name__, evaluable.unique_id, duration
+            )
+        if rule_costs:
+            rule_costs.record(rule.source(), duration)
+
+
+def _evaluate_batch(
+    rule: Rule, evaluables: Sequence[Evaluable], profile: Profile | None
+) -> Mapping[Evaluable, RuleViolation | None]:
+    """Evaluate a batch rule, recording its duration when profiling."""
+    if profile is None:
+        return rule.evaluate_batch(evaluables, **rule.config)
+    start = perf_counter()
+    try:
+        return rule.evaluate_batch(evaluables, **rule.config)
+    finally:
+        resource_type = rule.resource_type.__name__
+        profile.record_rule(
+            rule.source(),
+            resource_type,
+            f"all {len(evaluables)} {resource_type.lower()}s",
+            perf_counter() - start,
+        )
+
+
+def _picklable(result: Any) -> Any:
+    """Make sure a result can be sent back to the parent process.
+
+    Exceptions raised by rules may hold arbitrary objects, or have constructors
+    which can't rebuild them: they're replaced by their type and message if they
+    can't be pickled and unpickled. An exception failing to unpickle in the parent
+    process would otherwise never be received.
+    """
+    if isinstance(result, Exception):
+        try:
+            pickle.loads(pickle.dumps(result))
+        except Exception:
+            return RuleFailedException(type(result).__name__, str(result))
+    return result
+
+
+def _evaluate_chunk(
+    indices: range,
+) -> tuple[ChunkResultsType, DisabledRulesType, dict[str, Timing]]:
+    """Evaluate rules on a chunk of evaluables, in a worker process.
+
+    Returns:
+        The results of the chunk, the rules disabled by the worker so far, and the
+        durations of rules measured on the chunk.
+    """
+    assert _worker_state is not None
+    evaluables, dispatch, context = _worker_state
+    chunk_results: ChunkResultsType = []
+    for i in indices:
+        rules = dispatch.get(type(evaluables[i]), ())
+        rule_indices = {rule.__class__: j for j, rule in enumerate(rules)}
+        chunk_results.append(
+            [
+                (rule_indices[rule_class], _picklable(result))
+                for rule_class, result in _evaluate_rules(
+                    evaluables[i], rules, context
+                ).items()
+            ]
+        )
+    circuit_breaker, rule_costs = context.circuit_breaker, context.rule_costs
+    return (
+        chunk_results,
+        circuit_breaker.disabled_rules if circuit_breaker else {},
+        rule_costs.pop_measurements() if rule_costs else {},
+    )
@@ -9,3 +9,47 @@ class DuplicatedRuleException(Exception):
         super().__init__(
             f"Rule {rule_name} is defined twice. Rules must have unique names."
         )
+
+
+class RuleTimeoutException(Exception):
+    """A rule was interrupted, as it exceeded its time limit."""
+
+    def __init__(self, rule_name: str, seconds: float):
+        """Instantiate exception."""
+        super().__init__(
+            f"Rule {rule_name} was interrupted after {seconds:.3g}s, as it exceeded "
+            f"its time limit."
+        )
+        self.rule_name = rule_name
+        self.seconds = seconds
+
+    def __reduce__(self) -> tuple[type, tuple[str, float]]:
+        """Pickle exception, e.g. to send it from a worker process."""
+        return self.__class__, (self.rule_name, self.seconds)
+
+
+class RuleDisabledException(Exception):
+    """A rule was not evaluated, as it was disabled during the evaluation."""
+
+    def __init__(self, rule_name: str, reason: str):
+        """Instantiate exception."""
+        super().__init__(f"Rule {rule_name} was disabled: {reason}.")
+        self.rule_name = rule_name
+        self.reason = reason
+
+    def __reduce__(self) -> tuple[type, tuple[str, str]]:
+        """Pickle exception, e.g. to send it from a worker process."""
+        return self.__class__, (self.rule_name, self.reason)
+
+
+class RuleFailedException(Exception):
+    """A rule failed to run, as stored compactly, without the original exception."""
+
+    def __init__(self, type_name: str, message: str):
+        """Instantiate exception."""
+        super().__init__(message)
+        self.type_name = type_name
+
+    def __reduce__(self) -> tuple[type, tuple[str, str]]:
+        """Pickle exception."""
+        return self.__class__, (self.type_name, str(self))
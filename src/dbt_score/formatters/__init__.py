@@ -2,25 +2,44 @@
 
 from __future__ import annotations
 
+import sys
 import typing
 from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Type
 
 from dbt_score.config import Config
+from dbt_score.json_codec import get_codec
 from dbt_score.scoring import Score
 
 if typing.TYPE_CHECKING:
     from dbt_score.evaluation import EvaluableResultsType
+    from dbt_score.rule import Rule
 from dbt_score.models import Evaluable, ManifestLoader
 
 
 class Formatter(ABC):
     """Abstract class to define a formatter."""
 
+    # Whether the formatter reads `ManifestLoader.raw_manifest`, which is otherwise
+    # released once evaluables are loaded
+    requires_raw_manifest: ClassVar[bool] = False
+    # Whether the formatter reads the results of every rule, and not only scores.
+    # Otherwise, the remaining rules of an evaluable are skipped once a CRITICAL
+    # violation decides its score.
+    requires_results: ClassVar[bool] = True
+
     def __init__(self, manifest_loader: ManifestLoader, config: Config):
         """Instantiate a formatter."""
         self._manifest_loader = manifest_loader
         self._config = config
 
+    def dumps(self, obj: Any, ensure_ascii: bool = True) -> str:
+        """Encode an object as JSON, compact if configured so."""
+        codec = get_codec(self._config.json_backend)
+        return codec.dumps(
+            obj, indent=not self._config.compact_output, ensure_ascii=ensure_ascii
+        )
+
     @abstractmethod
     def evaluable_evaluated(
         self, evaluable: Evaluable, results: EvaluableResultsType, score: Score
@@ -28,6 +47,15 @@ class Formatter(ABC):
         """Callback when an evaluable item has been evaluated."""
         raise NotImplementedError
 
+    def rules_disabled(self, disabled_rules: dict[Type[Rule], str]) -> None:
+        """Callback when rules were disabled during the evaluation.
+
+        Args:
+            disabled_rules: The reason why rules were disabled, by rule.
+        """
+        for rule, reason in disabled_rules.items():
+            print(f"Rule {rule.source()} was disabled: {reason}.", file=sys.stderr)
+
     @abstractmethod
     def project_evaluated(self, score: Score) -> None:
         """Callback when a project has been evaluated."""
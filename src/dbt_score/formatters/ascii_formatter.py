@@ -65,6 +65,8 @@ wip = """
 class ASCIIFormatter(Formatter):
     """Formatter for ASCII medals in the terminal."""
 
+    requires_results = False
+
     def evaluable_evaluated(
         self, evaluable: Evaluable, results: EvaluableResultsType, score: Score
     ) -> None:
@@ -1,11 +1,11 @@
 """Human readable formatter."""
 
-from typing import Any
+from typing import Any, Type
 
 from dbt_score.evaluation import EvaluableResultsType
 from dbt_score.formatters import Formatter
 from dbt_score.models import Evaluable, Exposure, Macro, Model, Seed, Snapshot, Source
-from dbt_score.rule import RuleViolation
+from dbt_score.rule import Rule, RuleViolation
 from dbt_score.scoring import Score
 
 
@@ -21,6 +21,7 @@ class HumanReadableFormatter(Formatter):
         """Instantiate formatter."""
         super().__init__(*args, **kwargs)
         self._failed_evaluables: list[tuple[Evaluable, Score]] = []
+        self._disabled_rules: dict[Type[Rule], str] = {}
 
     @staticmethod
     def bold(text: str) -> str:
@@ -84,8 +85,18 @@ class HumanReadableFormatter(Formatter):
                     )
             print()
 
+    def rules_disabled(self, disabled_rules: dict[Type[Rule], str]) -> None:
+        """Callback when rules were disabled during the evaluation."""
+        self._disabled_rules = disabled_rules
+
     def project_evaluated(self, score: Score) -> None:
         """Callback when a project has been evaluated."""
+        if self._disabled_rules:
+            print("Disabled rules:")
+            for rule, reason in self._disabled_rules.items():
+                print(f"{self.indent}{self.label_error} {rule.source()}: {reason}")
+            print()
+
         print(f"Project score: {self.bold(str(score.rounded_value))} {score.badge}")
 
         if len(self._failed_evaluables) > 0:
@@ -52,18 +52,22 @@ Shape of the JSON output:
         "score": 5.0,
         "badge": "🥈",
         "pass": false
+    },
+    "disabled_rules": {
+        "rule1": "it failed on 10 consecutive evaluables"
     }
 }
 ```
+
+`disabled_rules` is only present if rules were disabled during the evaluation.
 """
 
-import json
-from typing import Any
+from typing import Any, Type
 
 from dbt_score.evaluation import EvaluableResultsType
 from dbt_score.formatters import Formatter
 from dbt_score.models import Evaluable
-from dbt_score.rule import RuleViolation
+from dbt_score.rule import Rule, RuleViolation
 from dbt_score.scoring import Score
 
 
@@ -75,6 +79,7 @@ class JSONFormatter(Formatter):
         super().__init__(*args, **kwargs)
         self.evaluable_results: dict[str, dict[str, Any]] = {}
         self._project_results: dict[str, Any]
+        self._disabled_rules: dict[str, str] = {}
 
     def evaluable_evaluated(
         self, evaluable: Evaluable, results: EvaluableResultsType, score: Score
@@ -114,6 +119,12 @@ class JSONFormatter(Formatter):
                     "message": str(result),
                 }
 
+    def rules_disabled(self, disabled_rules: dict[Type[Rule], str]) -> None:
+        """Callback when rules were disabled during the evaluation."""
+        self._disabled_rules = {
+            rule.source(): reason for rule, reason in disabled_rules.items()
+        }
+
     def project_evaluated(self, score: Score) -> None:
         """Callback when a project has been evaluated."""
         self._project_results = {
@@ -121,8 +132,10 @@ class JSONFormatter(Formatter):
             "badge": score.badge,
             "pass": score.value >= self._config.fail_project_under,
         }
-        document = {
+        document: dict[str, Any] = {
             "evaluables": self.evaluable_results,
             "project": self._project_results,
         }
-        print(json.dumps(document, indent=2, ensure_ascii=False))
+        if self._disabled_rules:
+            document["disabled_rules"] = self._disabled_rules
+        print(self.dumps(document, ensure_ascii=False))
@@ -1,18 +1,23 @@
 """Formatter for a manifest.json."""
 
 import copy
-import json
+import logging
 from typing import Any
 
 from dbt_score.evaluation import EvaluableResultsType
 from dbt_score.formatters import Formatter
-from dbt_score.models import Evaluable
+from dbt_score.models import RESOURCE_LOADERS, Evaluable
 from dbt_score.scoring import Score
 
+logger = logging.getLogger(__name__)
+
 
 class ManifestFormatter(Formatter):
     """Formatter to generate manifest.json with score metadata."""
 
+    requires_raw_manifest = True
+    requires_results = False
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Instantiate a manifest formatter."""
         self._evaluable_scores: dict[str, Score] = {}
@@ -27,17 +32,30 @@ class ManifestFormatter(Formatter):
     def project_evaluated(self, score: Score) -> None:
         """Callback when a project has been evaluated."""
         manifest = copy.copy(self._manifest_loader.raw_manifest)
+        # Evaluables are found in the sections read by registered loaders, whatever
+        # their class
+        sections = [
+            manifest[section]
+            for section in dict.fromkeys(
+                loader.section for loader in RESOURCE_LOADERS.values()
+            )
+            if section in manifest
+        ]
         for evaluable_id, evaluable_score in self._evaluable_scores.items():
-            if evaluable_id.startswith("model") or evaluable_id.startswith("snapshot"):
-                nodes_manifest = manifest["nodes"][evaluable_id]
-                nodes_manifest["meta"]["score"] = evaluable_score.value
-                nodes_manifest["meta"]["badge"] = evaluable_score.badge
-            if evaluable_id.startswith("source"):
-                source_manifest = manifest["sources"][evaluable_id]
-                source_manifest["meta"]["score"] = evaluable_score.value
-                source_manifest["meta"]["badge"] = evaluable_score.badge
-            if evaluable_id.startswith("exposure"):
-                exposure_manifest = manifest["exposures"][evaluable_id]
-                exposure_manifest["meta"]["score"] = evaluable_score.value
-                exposure_manifest["meta"]["badge"] = evaluable_score.badge
-        print(json.dumps(manifest, indent=2))
+            evaluable_manifest = next(
+                (
+                    entries[evaluable_id]
+                    for entries in sections
+                    if evaluable_id in entries
+                ),
+                None,
+            )
+            if evaluable_manifest is None:
+                logger.warning(
+                    f"{evaluable_id} isn't in the manifest, it's not scored."
+                )
+                continue
+            meta = evaluable_manifest.setdefault("meta", {})
+            meta["score"] = evaluable_score.value
+            meta["badge"] = evaluable_score.badge
+        print(self.dumps(manifest))
@@ -0,0 +1,165 @@
+"""Results of previous evaluations, to only evaluate what changed since then.
+
+The results of every evaluable are stored with a fingerprint of the evaluable. When
+linting again, evaluables with the same fingerprint reuse their results instead of
+being evaluated. All results are discarded when rules change, and the results of
+evaluables which are gone from the project are dropped.
+"""
+
+import inspect
+from typing import Any, Container, Final, Iterable
+
+from dbt_score.cache import DiskCache, dbt_score_version, make_key
+from dbt_score.models import Evaluable, HasGraphMetricsMixin
+from dbt_score.rule import Rule
+from dbt_score.rule_filter import RuleFilter
+
+# Keys of manifest entries which change on every parse, without any actual change
+VOLATILE_KEYS: Final[frozenset[str]] = frozenset({"created_at"})
+# The key of the cache entry holding the key of the latest results
+_LATEST_KEY: Final[str] = make_key("incremental", "latest")
+
+
+def _source_code(obj: Rule | RuleFilter) -> str:
+    """Get the source code of a rule or filter, or its name if it's not available."""
+    # Decorated rules and filters are defined by their function
+    definition = getattr(type(obj), "_orig_evaluate", type(obj))
+    try:
+        return inspect.getsource(definition)
+    except (OSError, TypeError):
+        return obj.source()
+
+
+def rule_fingerprint(rule: Rule) -> str:
+    """Compute the fingerprint of a rule, changing with its code or configuration.
+
+    Severities only affect scores, which are always computed again: they're not part
+    of the fingerprint.
+    """
+    return make_key(
+        dbt_score_version(),
+        rule.source(),
+        _source_code(rule),
+        sorted(rule.config.items()),
+        rule.graph_sensitive,
+        sorted(
+            (rule_filter.source(), _source_code(rule_filter))
+            for rule_filter in rule.rule_filters
+        ),
+    )
+
+
+def rules_fingerprint(rules: Iterable[Rule]) -> str:
+    """Compute the fingerprint of a set of rules."""
+    return make_key([rule_fingerprint(rule) for rule in rules])
+
+
+def _stable_values(values: dict[str, Any]) -> dict[str, Any]:
+    """Drop the volatile values of a manifest entry."""
+    return {key: value for key, value in values.items() if key not in VOLATILE_KEYS}
+
+
+def _own_fingerprint(evaluable: Evaluable) -> str | None:
+    """Compute the fingerprint of an evaluable and its tests, from the manifest.
+
+    Returns None if the raw values of the evaluable were dropped, in lean mode.
+    """
+    raw_values = getattr(evaluable, "_raw_values", None)
+    if not raw_values:
+        return None
+    return make_key(
+        _stable_values(raw_values),
+        [
+            _stable_values(test_values)
+            for test_values in getattr(evaluable, "_raw_test_values", [])
+        ],
+    )
+
+
+def evaluable_fingerprint(evaluable: Evaluable, graph_sensitive: bool) -> str | None:
+    """Compute the fingerprint of an evaluable, changing when its results may change.
+
+    Args:
+        evaluable: The evaluable.
+        graph_sensitive: Whether rules of the evaluable read its relatives. The
+            fingerprint then also changes with the direct parents and children of
+            the evaluable, and its graph metrics.
+
+    Returns:
+        The fingerprint, or None if it can't be computed, in lean mode.
+    """
+    fingerprint = _own_fingerprint(evaluable)
+    if fingerprint is None or not graph_sensitive:
+        return fingerprint
+
+    relatives = [
+        *getattr(evaluable, "parents", []),
+        *getattr(evaluable, "children", []),
+    ]
+    relative_fingerprints = [_own_fingerprint(relative) for relative in relatives]
+    if None in relative_fingerprints:
+        return None
+    graph_metrics = (
+        evaluable.graph_metrics if isinstance(evaluable, HasGraphMetricsMixin) else None
+    )
+    return make_key(fingerprint, relative_fingerprints, graph_metrics)
+
+
+class IncrementalState:
+    """The results of previous evaluations with the same rules, by evaluable.
+
+    Results are stored compactly, as the result of every rule by rule source.
+    """
+
+    def __init__(self, cache: DiskCache, rules: Iterable[Rule]) -> None:
+        """Load the results of previous evaluations.
+
+        Args:
+            cache: The cache where results are stored.
+            rules: The active rules.
+        """
+        self._cache = cache
+        self._key = make_key("incremental", rules_fingerprint(rules))
+        # For each evaluable, by unique id, its fingerprint and results
+        self._entries: dict[str, tuple[str, dict[str, Any]]] = (
+            cache.get(self._key) or {}
+        )
+        # The evaluables of the current run, by unique id
+        self._seen: set[str] = set()
+
+    def get(self, unique_id: str, fingerprint: str | None) -> dict[str, Any] | None:
+        """Get the results of an evaluable, or None if it changed."""
+        self._seen.add(unique_id)
+        if fingerprint is None or (entry := self._entries.get(unique_id)) is None:
+            return None
+        previous_fingerprint, results = entry
+        return results if previous_fingerprint == fingerprint else None
+
+    def set(
+        self, unique_id: str, fingerprint: str | None, results: dict[str, Any]
+    ) -> None:
+        """Set the results of an evaluable."""
+        self._seen.add(unique_id)
+        if fingerprint is None:
+            self._entries.pop(unique_id, None)
+        else:
+            self._entries[unique_id] = (fingerprint, results)
+
+    def save(self, known_ids: Container[str] = frozenset()) -> None:
+        """Persist the results, and drop the results of previous rules.
+
+        Args:
+            known_ids: The unique ids of the project's resources. The results of
+                evaluables which weren't evaluated now are only kept if they're
+                known, e.g. as they weren't selected.
+        """
+        self._entries = {
+            unique_id: entry
+            for unique_id, entry in self._entries.items()
+            if unique_id in self._seen or unique_id in known_ids
+        }
+        self._cache.set(self._key, self._entries)
+        latest_key = self._cache.get(_LATEST_KEY)
+        if latest_key is not None and latest_key != self._key:
+            self._cache.delete(latest_key)
+        self._cache.set(_LATEST_KEY, self._key)
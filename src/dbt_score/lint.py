@@ -1,15 +1,20 @@
 """Lint dbt metadata."""
 
 from pathlib import Path
-from typing import Iterable, Literal
+from typing import Any, Iterable, Literal
 
+from dbt_score.cache import CACHE_DIR_NAME, MIB, DiskCache
 from dbt_score.config import Config
 from dbt_score.evaluation import Evaluation
 from dbt_score.formatters.ascii_formatter import ASCIIFormatter
 from dbt_score.formatters.human_readable_formatter import HumanReadableFormatter
 from dbt_score.formatters.json_formatter import JSONFormatter
 from dbt_score.formatters.manifest_formatter import ManifestFormatter
+from dbt_score.incremental import IncrementalState
 from dbt_score.models import ManifestLoader
+from dbt_score.profiling import phase
+from dbt_score.rule_cache import RuleResultCache
+from dbt_score.rule_costs import RuleCosts
 from dbt_score.rule_registry import RuleRegistry
 from dbt_score.scoring import Scorer
 
@@ -20,15 +25,24 @@ def lint_dbt_project(
     format: Literal["plain", "manifest", "ascii", "json"],
     select: Iterable[str] | None = None,
     exclude: Iterable[str] | None = None,
+    dbt_manifest: Any = None,
+    stream: bool = False,
 ) -> Evaluation:
-    """Lint dbt manifest."""
-    if not manifest_path.exists():
-        raise FileNotFoundError(f"Manifest not found at {manifest_path}.")
+    """Lint dbt manifest.
+
+    The manifest is read from `manifest_path`, unless a dbt `Manifest` object is
+    provided, e.g. the result of `dbt parse`.
 
-    rule_registry = RuleRegistry(config)
-    rule_registry.load_all()
+    With `stream`, the evaluation isn't run: iterate over
+    `Evaluation.iter_evaluate()` to get the results of evaluables one at a time,
+    without keeping them all in memory.
+    """
+    if dbt_manifest is None and not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found at {manifest_path}.")
 
-    manifest_loader = ManifestLoader(manifest_path, select=select, exclude=exclude)
+    with phase("registry"):
+        rule_registry = RuleRegistry(config)
+        rule_registry.load_all()
 
     formatters = {
         "plain": HumanReadableFormatter,
@@ -36,17 +50,58 @@ def lint_dbt_project(
         "ascii": ASCIIFormatter,
         "json": JSONFormatter,
     }
-    formatter = formatters[format](manifest_loader=manifest_loader, config=config)
+    formatter_class = formatters[format]
+
+    with phase("load"):
+        manifest_loader = ManifestLoader(
+            manifest_path,
+            select=select,
+            exclude=exclude,
+            # A formatter reading the full manifest prevents streaming it
+            streaming=config.stream_manifest
+            and not formatter_class.requires_raw_manifest,
+            cache_dir=manifest_path.parent / CACHE_DIR_NAME if config.cache else None,
+            lean=config.lean,
+            keep_raw_manifest=formatter_class.requires_raw_manifest,
+            json_backend=config.json_backend,
+            dbt_manifest=dbt_manifest,
+            cache_max_size=config.cache_max_size * MIB,
+        )
+
+    formatter = formatter_class(manifest_loader=manifest_loader, config=config)
 
     scorer = Scorer(config)
 
+    cache = DiskCache(
+        manifest_path.parent / CACHE_DIR_NAME, config.cache_max_size * MIB
+    )
+    incremental_state = (
+        IncrementalState(cache, rule_registry.rules.values())
+        if config.incremental and config.cache
+        else None
+    )
+    rule_cache = (
+        RuleResultCache(cache, rule_registry.rules.values()) if config.cache else None
+    )
+    # Costs of rules are learned from previous runs, when caching is enabled
+    rule_costs = (
+        RuleCosts(cache if config.cache else None)
+        if config.rule_order == "cost"
+        else None
+    )
+
     evaluation = Evaluation(
         rule_registry=rule_registry,
         manifest_loader=manifest_loader,
         formatter=formatter,
         scorer=scorer,
         config=config,
+        incremental_state=incremental_state,
+        rule_cache=rule_cache,
+        rule_costs=rule_costs,
     )
-    evaluation.evaluate()
+    if not stream:
+        with phase("evaluate"):
+            evaluation.evaluate()
 
     return evaluation
@@ -0,0 +1,177 @@
+"""Streaming reader for dbt manifests.
+
+The streaming reader walks the manifest incrementally instead of decoding the whole
+document at once. Only the metadata and the `nodes`, `sources`, `exposures` and
+`macros` entries belonging to the project package are materialized, everything else
+is decoded entry by entry and discarded right away. Peak memory therefore scales
+with the project's own nodes rather than with the whole manifest.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Final, Iterable, Iterator, TextIO, cast
+
+PROJECT_SECTIONS: Final[tuple[str, ...]] = ("nodes", "sources", "exposures", "macros")
+DEFAULT_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStream:
+    """Incremental tokenizer over a JSON text file.
+
+    Values are decoded with the C-accelerated `raw_decode` of the standard library.
+    The buffer only holds the value being decoded, and is grown geometrically when a
+    value spans multiple chunks to keep decoding linear.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        """Initialize the stream."""
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more data into the buffer, dropping what has been consumed."""
+        pending = self._buffer[self._pos :]
+        chunk = self._fp.read(max(self._chunk_size, len(pending)))
+        if not chunk:
+            return False
+        self._buffer = pending + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at the end of the file."""
+        while True:
+            # The pattern matches the empty string, so there's always a match
+            match = cast(re.Match[str], _WHITESPACE.match(self._buffer, self._pos))
+            self._pos = match.end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be `char`."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Invalid manifest: expected {char!r} but found {found!r} "
+                f"at position {self._pos}."
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode and consume the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A scalar ending at the buffer boundary might be truncated, e.g. `12|34`
+            if (
+                end == len(self._buffer)
+                and not isinstance(value, (dict, list, str))
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over the key/value pairs of the next JSON object."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.expect("}")
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self.value()
+            if self.peek() == ",":
+                self.expect(",")
+            else:
+                self.expect("}")
+                return
+
+    def skip(self) -> None:
+        """Consume the next JSON value without retaining it as a whole."""
+        if self.peek() == "{":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+
+def stream_manifest(
+    file_path: Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    sections: Iterable[str] = PROJECT_SECTIONS,
+) -> dict[str, Any]:
+    """Read the project's own resources from a manifest, incrementally.
+
+    Args:
+        file_path: The file path of the JSON manifest.
+        chunk_size: The number of characters read from the file at once.
+        sections: The sections to read, by default `nodes`, `sources`, `exposures`
+            and `macros`.
+
+    Returns:
+        A manifest containing only `metadata`, and the entries of `sections` which
+        belong to the project package.
+    """
+    manifest: dict[str, Any] = {section: {} for section in sections}
+    project_name: str | None = None
+    # Sections read before the metadata can't be filtered on the fly
+    unfiltered_sections: list[str] = []
+    with file_path.open(encoding="utf-8") as fp:
+        stream = _JSONStream(fp, chunk_size)
+        for key in _top_level_keys(stream):
+            if key == "metadata":
+                manifest["metadata"] = stream.value()
+                project_name = manifest["metadata"].get("project_name")
+            elif key in manifest:
+                if project_name is None:
+                    unfiltered_sections.append(key)
+                section = manifest[key]
+                for unique_id, values in stream.items():
+                    if project_name is None or values["package_name"] == project_name:
+                        section[unique_id] = values
+            else:
+                stream.skip()
+
+    if project_name is None:
+        raise ValueError("Invalid manifest: missing `metadata.project_name`.")
+
+    for section in unfiltered_sections:
+        manifest[section] = {
+            unique_id: values
+            for unique_id, values in manifest[section].items()
+            if values["package_name"] == project_name
+        }
+
+    return manifest
+
+
+def _top_level_keys(stream: _JSONStream) -> Iterator[str]:
+    """Iterate over the top-level keys, letting the caller consume each value."""
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.expect("}")
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        yield key
+        if stream.peek() == ",":
+            stream.expect(",")
+        else:
+            stream.expect("}")
+            return
@@ -1,19 +1,115 @@
 """Objects related to loading the dbt manifest."""
 
-import json
 import logging
-import re
+import sys
+import threading
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Iterable, Literal, TypeAlias, Union
-
-from dbt_score.dbt_utils import dbt_ls
+from typing import Any, Callable, Iterable, Literal, TypeAlias, Union
+
+from dbt_score.cache import (
+    DEFAULT_MAX_SIZE,
+    DiskCache,
+    dbt_score_version,
+    file_digest,
+    make_key,
+)
+from dbt_score.dag import DagIndex, GraphMetrics
+from dbt_score.dbt_utils import dbt_ls, manifest_to_dict
+from dbt_score.json_codec import AUTO_BACKEND, get_codec, read_json
+from dbt_score.manifest_reader import stream_manifest
+from dbt_score.profiling import phase
+from dbt_score.selection import NodeSelector, UnsupportedSelectorException
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern a string, so that repeated values share memory, e.g. package names."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_all(values: list[Any]) -> list[Any]:
+    """Intern all strings of a list, e.g. tags."""
+    return [_intern(value) for value in values]
+
+
+class _DeferredPlaceholder:
+    """Placeholder of a field which is computed on first access."""
+
+    def __reduce__(self) -> str:
+        """Pickle the placeholder as a reference to the singleton."""
+        return "DEFERRED"
+
+
+DEFERRED: Any = _DeferredPlaceholder()
+
+
+# Reentrant, as computing a field may read other deferred fields
+_deferred_lock = threading.RLock()
+
+
+class _Deferred:
+    """Descriptor of a slotted field, computed on first access.
+
+    The descriptor wraps the member descriptor of the slot. While the slot holds
+    `DEFERRED`, reading the field computes its value with `factory` and stores it.
+    The value is computed once, even when first read from several threads.
+    """
+
+    def __init__(self, slot: Any, factory: Callable[[Any], Any]) -> None:
+        self._slot = slot
+        self._factory = factory
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = self._slot.__get__(obj, objtype)
+        if value is DEFERRED:
+            with _deferred_lock:
+                value = self._slot.__get__(obj, objtype)
+                if value is DEFERRED:
+                    value = self._factory(obj)
+                    self._slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self._slot.__set__(obj, value)
+
+
+def _getstate(obj: Any) -> dict[str, Any]:
+    """Get the fields of a slotted dataclass to pickle, without computing any."""
+    cls = type(obj)
+    state = {}
+    for obj_field in fields(obj):
+        descriptor = getattr(cls, obj_field.name, None)
+        state[obj_field.name] = (
+            descriptor._slot.__get__(obj, cls)
+            if isinstance(descriptor, _Deferred)
+            else getattr(obj, obj_field.name)
+        )
+    return state
+
+
+def _setstate(obj: Any, state: dict[str, Any]) -> None:
+    """Restore the fields of a slotted dataclass, possibly still deferred."""
+    for name, value in state.items():
+        object.__setattr__(obj, name, value)
+
+
+def _defer(cls: type, name: str, factory: Callable[[Any], Any]) -> None:
+    """Compute the slotted field `name` of a class on first access, if deferred.
+
+    Deferred fields are pickled as such, e.g. when caching evaluables.
+    """
+    setattr(cls, name, _Deferred(cls.__dict__[name], factory))
+    cls.__getstate__ = _getstate  # type: ignore[method-assign,assignment]
+    cls.__setstate__ = _setstate  # type: ignore[attr-defined]
+
+
+@dataclass(slots=True)
 class Constraint:
     """Constraint for a model or a column.
 
@@ -43,7 +139,7 @@ class Constraint:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Test:
     """Test for a column, model, source or snapshot.
 
@@ -66,14 +162,14 @@ class Test:
         """Create a test object from a test node in the manifest."""
         return cls(
             name=test_node["name"],
-            type=test_node.get("test_metadata", {}).get("name", "generic"),
+            type=_intern(test_node.get("test_metadata", {}).get("name", "generic")),
             kwargs=test_node.get("test_metadata", {}).get("kwargs", {}),
-            tags=test_node.get("tags", []),
+            tags=_intern_all(test_node.get("tags", [])),
             _raw_values=test_node,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """Represents a column.
 
@@ -109,14 +205,14 @@ class Column:
         return cls(
             name=values["name"],
             description=values["description"],
-            data_type=values["data_type"],
+            data_type=_intern(values["data_type"]),
             config=values.get("config", {}),
             meta=values["meta"],
             constraints=[
                 Constraint.from_raw_values(constraint)
                 for constraint in values["constraints"]
             ],
-            tags=values["tags"],
+            tags=_intern_all(values["tags"]),
             tests=[Test.from_node(test) for test in test_values],
             _raw_values=values,
             _raw_test_values=test_values,
@@ -126,7 +222,12 @@ class Column:
 class HasColumnsMixin:
     """Common methods for resource types that have columns."""
 
+    __slots__ = ()
+
     columns: list[Column]
+    tests: list[Test]
+    _raw_values: dict[str, Any]
+    _raw_test_values: list[dict[str, Any]]
 
     def get_column(self, column_name: str) -> Column | None:
         """Get a column by name."""
@@ -136,35 +237,96 @@ class HasColumnsMixin:
 
         return None
 
+    @staticmethod
+    def _index_tests(
+        test_values: list[dict[str, Any]],
+    ) -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+        """Index the tests of a node in a single pass.
+
+        Returns:
+            The node-level tests, and the column-level tests grouped by column name.
+        """
+        node_tests: list[dict[str, Any]] = []
+        column_tests: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for test in test_values:
+            column_name = (
+                test.get("test_metadata", {}).get("kwargs", {}).get("column_name")
+            )
+            if column_name:
+                # BigQuery connector when "quote: true"
+                column_tests[column_name.strip("`")].append(test)
+            else:
+                node_tests.append(test)
+        return node_tests, column_tests
+
     @staticmethod
     def _get_columns(
-        node_values: dict[str, Any], test_values: list[dict[str, Any]]
+        node_values: dict[str, Any], column_tests: dict[str, list[dict[str, Any]]]
     ) -> list[Column]:
-        """Get columns from a node and its tests in the manifest."""
+        """Get columns from a node and its tests indexed by column name."""
         return [
-            Column.from_node_values(
-                values,
-                [
-                    test
-                    for test in test_values
-                    if test.get("test_metadata", {})
-                    .get("kwargs", {})
-                    .get("column_name", "")
-                    .strip("`")  # BigQuery connector when "quote: true"
-                    == name
-                ],
-            )
+            Column.from_node_values(values, column_tests.get(name, []))
             for name, values in node_values.get("columns", {}).items()
         ]
 
+    def _parse_columns(self) -> list[Column]:
+        """Parse the columns from the raw values, with their tests."""
+        _, column_tests = self._index_tests(self._raw_test_values)
+        return self._get_columns(self._raw_values, column_tests)
+
+    def _parse_tests(self) -> list[Test]:
+        """Parse the node-level tests from the raw test values."""
+        node_tests, _ = self._index_tests(self._raw_test_values)
+        return [Test.from_node(test) for test in node_tests]
+
+
+class HasGraphMetricsMixin:
+    """Common methods for resource types which are part of the DAG."""
+
+    __slots__ = ()
+
+    unique_id: str
+    _dag: DagIndex | None
+
+    @property
+    def graph_metrics(self) -> GraphMetrics:
+        """The metrics of the resource in the DAG, e.g. its number of descendants.
+
+        Metrics are looked up in the index built by the `ManifestLoader`. For
+        resources created otherwise, they are computed from their relatives.
+        """
+        dag = self._dag
+        if dag is None or self.unique_id not in dag:
+            dag = _dag_from_relatives(self)
+        return dag.metrics(self.unique_id)
+
+
+def _dag_from_relatives(resource: HasGraphMetricsMixin) -> DagIndex:
+    """Build the DAG of all resources connected to a resource."""
+    resource_types: dict[str, str] = {}
+    parents: dict[str, list[str]] = defaultdict(list)
+    queue: deque[Any] = deque([resource])
+    while queue:
+        current = queue.popleft()
+        if current.unique_id in resource_types:
+            continue
+        resource_types[current.unique_id] = type(current).__name__.lower()
+        for parent in getattr(current, "parents", []):
+            parents[current.unique_id].append(parent.unique_id)
+            queue.append(parent)
+        for child in getattr(current, "children", []):
+            parents[child.unique_id].append(current.unique_id)
+            queue.append(child)
+    return DagIndex(resource_types, parents)
+
 
 # Type annotation for parent references
 ParentType = Union["Model", "Source", "Snapshot", "Seed"]
 ChildType = Union["Model", "Snapshot", "Exposure"]
 
 
-@dataclass
-class Model(HasColumnsMixin):
+@dataclass(slots=True)
+class Model(HasColumnsMixin, HasGraphMetricsMixin):
     """Represents a dbt model.
 
     Attributes:
@@ -192,6 +354,7 @@ class Model(HasColumnsMixin):
         children: The list of models and snapshots that depend on this model.
         _raw_values: The raw values of the model (node) in the manifest.
         _raw_test_values: The raw test values of the model (node) in the manifest.
+        _dag: The index of the DAG the resource belongs to.
     """
 
     unique_id: str
@@ -219,6 +382,7 @@ class Model(HasColumnsMixin):
     children: list[ChildType] = field(default_factory=list)
     _raw_values: dict[str, Any] = field(default_factory=dict)
     _raw_test_values: list[dict[str, Any]] = field(default_factory=list)
+    _dag: DagIndex | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_node(
@@ -233,24 +397,18 @@ class Model(HasColumnsMixin):
             original_file_path=node_values["original_file_path"],
             config=node_values["config"],
             meta=node_values["meta"],
-            columns=cls._get_columns(node_values, test_values),
-            package_name=node_values["package_name"],
-            database=node_values["database"],
-            schema=node_values["schema"],
+            columns=DEFERRED,  # Parsed on first access
+            package_name=_intern(node_values["package_name"]),
+            database=_intern(node_values["database"]),
+            schema=_intern(node_values["schema"]),
             raw_code=node_values["raw_code"],
-            language=node_values["language"],
-            access=node_values["access"],
-            group=node_values["group"],
+            language=_intern(node_values["language"]),
+            access=_intern(node_values["access"]),
+            group=_intern(node_values["group"]),
             alias=node_values["alias"],
             patch_path=node_values["patch_path"],
-            tags=node_values["tags"],
-            tests=[
-                Test.from_node(test)
-                for test in test_values
-                if not test.get("test_metadata", {})
-                .get("kwargs", {})
-                .get("column_name")
-            ],
+            tags=_intern_all(node_values["tags"]),
+            tests=DEFERRED,  # Parsed on first access
             depends_on=node_values["depends_on"],
             constraints=[
                 Constraint.from_raw_values(constraint)
@@ -272,30 +430,10 @@ class Model(HasColumnsMixin):
         Returns:
             int: The count of unique downstream models.
         """
-        visited: set[str] = set()
-        queue: deque[ChildType] = deque()
-        for child in self.children:
-            if child.unique_id not in visited:
-                visited.add(child.unique_id)
-                queue.append(child)
-
-        count = 0
-        while queue:
-            current = queue.popleft()
+        return self.graph_metrics.downstream_count
 
-            if isinstance(current, Model):
-                count += 1
 
-            if hasattr(current, "children"):
-                for grandchild in current.children:
-                    if grandchild.unique_id not in visited:
-                        visited.add(grandchild.unique_id)
-                        queue.append(grandchild)
-
-        return count
-
-
-@dataclass
+@dataclass(slots=True)
 class Duration:
     """Represents a duration used in SourceFreshness.
 
@@ -310,7 +448,7 @@ class Duration:
     period: Literal["minute", "hour", "day"] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceFreshness:
     """Represents a source freshness configuration.
 
@@ -330,8 +468,8 @@ class SourceFreshness:
     filter: str | None = None
 
 
-@dataclass
-class Source(HasColumnsMixin):
+@dataclass(slots=True)
+class Source(HasColumnsMixin, HasGraphMetricsMixin):
     """Represents a dbt source table.
 
     Attributes:
@@ -358,6 +496,7 @@ class Source(HasColumnsMixin):
         children: The list of models and snapshots that depend on this source.
         _raw_values: The raw values of the source definition in the manifest.
         _raw_test_values: The raw test values of the source definition in the manifest.
+        _dag: The index of the DAG the resource belongs to.
     """
 
     unique_id: str
@@ -382,6 +521,7 @@ class Source(HasColumnsMixin):
     children: list[ChildType] = field(default_factory=list)
     _raw_values: dict[str, Any] = field(default_factory=dict)
     _raw_test_values: list[dict[str, Any]] = field(default_factory=list)
+    _dag: DagIndex | None = field(default=None, repr=False, compare=False)
 
     @property
     def selector_name(self) -> str:
@@ -402,28 +542,22 @@ class Source(HasColumnsMixin):
             unique_id=node_values["unique_id"],
             name=node_values["name"],
             description=node_values["description"],
-            source_name=node_values["source_name"],
+            source_name=_intern(node_values["source_name"]),
             source_description=node_values["source_description"],
             original_file_path=node_values["original_file_path"],
             config=node_values["config"],
             meta=node_values["meta"],
             source_meta=node_values["source_meta"],
-            columns=cls._get_columns(node_values, test_values),
-            package_name=node_values["package_name"],
-            database=node_values["database"],
-            schema=node_values["schema"],
+            columns=DEFERRED,  # Parsed on first access
+            package_name=_intern(node_values["package_name"]),
+            database=_intern(node_values["database"]),
+            schema=_intern(node_values["schema"]),
             identifier=node_values["identifier"],
-            loader=node_values["loader"],
+            loader=_intern(node_values["loader"]),
             freshness=node_values["freshness"],
             patch_path=node_values["patch_path"],
-            tags=node_values["tags"],
-            tests=[
-                Test.from_node(test)
-                for test in test_values
-                if not test.get("test_metadata", {})
-                .get("kwargs", {})
-                .get("column_name")
-            ],
+            tags=_intern_all(node_values["tags"]),
+            tests=DEFERRED,  # Parsed on first access
             _raw_values=node_values,
             _raw_test_values=test_values,
         )
@@ -433,8 +567,8 @@ class Source(HasColumnsMixin):
         return hash(self.unique_id)
 
 
-@dataclass
-class Snapshot(HasColumnsMixin):
+@dataclass(slots=True)
+class Snapshot(HasColumnsMixin, HasGraphMetricsMixin):
     """Represents a dbt snapshot.
 
     Attributes:
@@ -465,6 +599,7 @@ class Snapshot(HasColumnsMixin):
         children: The list of models and snapshots that depend on this snapshot.
         _raw_values: The raw values of the snapshot (node) in the manifest.
         _raw_test_values: The raw test values of the snapshot (node) in the manifest.
+        _dag: The index of the DAG the resource belongs to.
     """
 
     unique_id: str
@@ -491,6 +626,7 @@ class Snapshot(HasColumnsMixin):
     children: list[ChildType] = field(default_factory=list)
     _raw_values: dict[str, Any] = field(default_factory=dict)
     _raw_test_values: list[dict[str, Any]] = field(default_factory=list)
+    _dag: DagIndex | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_node(
@@ -505,22 +641,16 @@ class Snapshot(HasColumnsMixin):
             original_file_path=node_values["original_file_path"],
             config=node_values["config"],
             meta=node_values["meta"],
-            columns=cls._get_columns(node_values, test_values),
-            package_name=node_values["package_name"],
-            database=node_values["database"],
-            schema=node_values["schema"],
+            columns=DEFERRED,  # Parsed on first access
+            package_name=_intern(node_values["package_name"]),
+            database=_intern(node_values["database"]),
+            schema=_intern(node_values["schema"]),
             raw_code=node_values["raw_code"],
-            language=node_values["language"],
+            language=_intern(node_values["language"]),
             alias=node_values["alias"],
             patch_path=node_values["patch_path"],
-            tags=node_values["tags"],
-            tests=[
-                Test.from_node(test)
-                for test in test_values
-                if not test.get("test_metadata", {})
-                .get("kwargs", {})
-                .get("column_name")
-            ],
+            tags=_intern_all(node_values["tags"]),
+            tests=DEFERRED,  # Parsed on first access
             depends_on=node_values["depends_on"],
             parents=[],  # Will be populated later
             _raw_values=node_values,
@@ -532,8 +662,8 @@ class Snapshot(HasColumnsMixin):
         return hash(self.unique_id)
 
 
-@dataclass
-class Exposure:
+@dataclass(slots=True)
+class Exposure(HasGraphMetricsMixin):
     """Represents a dbt exposure.
 
     Attributes:
@@ -554,6 +684,7 @@ class Exposure:
         depends_on: The depends_on of the exposure.
         parents: The list of models, sources, and snapshot this exposure depends on.
         _raw_values: The raw values of the exposure in the manifest.
+        _dag: The index of the DAG the exposure belongs to.
     """
 
     unique_id: str
@@ -571,6 +702,7 @@ class Exposure:
     depends_on: dict[str, list[str]] = field(default_factory=dict)
     parents: list[ParentType] = field(default_factory=list)
     _raw_values: dict[str, Any] = field(default_factory=dict)
+    _dag: DagIndex | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_node(cls, node_values: dict[str, Any]) -> "Exposure":
@@ -581,13 +713,13 @@ class Exposure:
             description=node_values["description"],
             label=node_values["label"],
             url=node_values["url"],
-            maturity=node_values["maturity"],
+            maturity=_intern(node_values["maturity"]),
             original_file_path=node_values["original_file_path"],
-            type=node_values["type"],
+            type=_intern(node_values["type"]),
             owner=node_values["owner"],
             config=node_values["config"],
             meta=node_values["meta"],
-            tags=node_values["tags"],
+            tags=_intern_all(node_values["tags"]),
             depends_on=node_values["depends_on"],
             _raw_values=node_values,
         )
@@ -597,8 +729,8 @@ class Exposure:
         return hash(self.unique_id)
 
 
-@dataclass
-class Seed(HasColumnsMixin):
+@dataclass(slots=True)
+class Seed(HasColumnsMixin, HasGraphMetricsMixin):
     """Represents a dbt seed.
 
     Attributes:
@@ -620,6 +752,7 @@ class Seed(HasColumnsMixin):
         children: The list of models and snapshots that depend on this seed.
         _raw_values: The raw values of the seed (node) in the manifest.
         _raw_test_values: The raw test values of the seed (node) in the manifest.
+        _dag: The index of the DAG the resource belongs to.
     """
 
     unique_id: str
@@ -640,6 +773,7 @@ class Seed(HasColumnsMixin):
     children: list[ChildType] = field(default_factory=list)
     _raw_values: dict[str, Any] = field(default_factory=dict)
     _raw_test_values: list[dict[str, Any]] = field(default_factory=list)
+    _dag: DagIndex | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_node(
@@ -654,20 +788,14 @@ class Seed(HasColumnsMixin):
             original_file_path=node_values["original_file_path"],
             config=node_values["config"],
             meta=node_values["meta"],
-            columns=cls._get_columns(node_values, test_values),
-            package_name=node_values["package_name"],
-            database=node_values["database"],
-            schema=node_values["schema"],
+            columns=DEFERRED,  # Parsed on first access
+            package_name=_intern(node_values["package_name"]),
+            database=_intern(node_values["database"]),
+            schema=_intern(node_values["schema"]),
             alias=node_values["alias"],
             patch_path=node_values["patch_path"],
-            tags=node_values["tags"],
-            tests=[
-                Test.from_node(test)
-                for test in test_values
-                if not test.get("test_metadata", {})
-                .get("kwargs", {})
-                .get("column_name")
-            ],
+            tags=_intern_all(node_values["tags"]),
+            tests=DEFERRED,  # Parsed on first access
             _raw_values=node_values,
             _raw_test_values=test_values,
         )
@@ -677,7 +805,7 @@ class Seed(HasColumnsMixin):
         return hash(self.unique_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Macro:
     """Represents a dbt macro.
 
@@ -716,10 +844,10 @@ class Macro:
             name=node_values["name"],
             description=node_values.get("description", ""),
             original_file_path=node_values["original_file_path"],
-            package_name=node_values["package_name"],
+            package_name=_intern(node_values["package_name"]),
             macro_sql=node_values["macro_sql"],
             meta=node_values.get("meta", {}),
-            tags=node_values.get("tags", []),
+            tags=_intern_all(node_values.get("tags", [])),
             depends_on=node_values.get("depends_on", {}),
             arguments=node_values.get("arguments", []),
             _raw_values=node_values,
@@ -733,14 +861,80 @@ class Macro:
 Evaluable: TypeAlias = Model | Source | Snapshot | Seed | Exposure | Macro
 
 
+@dataclass(frozen=True, slots=True)
+class ResourceLoader:
+    """Loader of a resource type from a section of the manifest.
+
+    Attributes:
+        resource_type: The `resource_type` of the manifest entries, e.g. `model`.
+        section: The section of the manifest with the entries, e.g. `nodes`.
+        evaluable_class: The class of the evaluables created.
+        attribute: The attribute of `ManifestLoader` storing the evaluables by unique
+            id, e.g. `models`.
+        load: Create an evaluable from its raw values and the raw values of its tests.
+    """
+
+    resource_type: str
+    section: str
+    evaluable_class: type[Evaluable]
+    attribute: str
+    load: Callable[[dict[str, Any], list[dict[str, Any]]], Evaluable]
+
+
+# The loaders by resource type, in the order in which evaluables are evaluated
+RESOURCE_LOADERS: dict[str, ResourceLoader] = {}
+
+
+def register_resource_loader(loader: ResourceLoader) -> None:
+    """Register the loader of a resource type."""
+    RESOURCE_LOADERS[loader.resource_type] = loader
+
+
+for _loader in (
+    ResourceLoader("model", "nodes", Model, "models", Model.from_node),
+    ResourceLoader("source", "sources", Source, "sources", Source.from_node),
+    ResourceLoader("snapshot", "nodes", Snapshot, "snapshots", Snapshot.from_node),
+    ResourceLoader(
+        "exposure",
+        "exposures",
+        Exposure,
+        "exposures",
+        lambda values, _: Exposure.from_node(values),
+    ),
+    ResourceLoader("seed", "nodes", Seed, "seeds", Seed.from_node),
+    ResourceLoader(
+        "macro", "macros", Macro, "macros", lambda values, _: Macro.from_node(values)
+    ),
+):
+    register_resource_loader(_loader)
+
+for _resource_class in (Model, Source, Snapshot, Seed):
+    _defer(_resource_class, "columns", HasColumnsMixin._parse_columns)
+    _defer(_resource_class, "tests", HasColumnsMixin._parse_tests)
+
+
 class ManifestLoader:
-    """Load the evaluables from the manifest."""
+    """Load the evaluables from the manifest.
+
+    The selection is evaluated on the raw manifest, before evaluables are created.
+    Only the selected evaluables, and their ancestors and descendants to populate
+    `parents` and `children`, are created. Their columns and tests are parsed when
+    first accessed.
+    """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         file_path: Path,
         select: Iterable[str] | None = None,
         exclude: Iterable[str] | None = None,
+        streaming: bool = False,
+        cache_dir: Path | None = None,
+        lean: bool = False,
+        keep_raw_manifest: bool = True,
+        json_backend: str = AUTO_BACKEND,
+        resource_types: Iterable[type[Evaluable]] | None = None,
+        dbt_manifest: Any = None,
+        cache_max_size: int = DEFAULT_MAX_SIZE,
     ):
         """Initialize the ManifestLoader.
 
@@ -748,182 +942,338 @@ class ManifestLoader:
             file_path: The file path of the JSON manifest.
             select: An optional dbt selection.
             exclude: An optional dbt exclusion.
+            streaming: Read the manifest incrementally, keeping only the resources
+                of the project package. `raw_manifest` then only contains those.
+            cache_dir: An optional directory where parsed evaluables are cached
+                between runs, keyed on the manifest content and dbt-score version.
+            lean: Drop the raw values of evaluables once loaded, i.e. `_raw_values`
+                and `_raw_test_values` are empty, to reduce memory usage.
+            keep_raw_manifest: Keep the decoded manifest in memory once loaded.
+                Otherwise, it's released and `raw_manifest` reads the manifest again
+                when accessed.
+            json_backend: The JSON backend used to decode the manifest.
+            resource_types: The types of evaluables to load, e.g. the types with
+                active rules. All types are loaded by default.
+            dbt_manifest: An optional dbt `Manifest` object, e.g. from `dbt parse`,
+                used instead of reading the manifest from `file_path`. It isn't
+                cached.
+            cache_max_size: The maximum total size of the cache, in bytes.
         """
-        self.raw_manifest = json.loads(file_path.read_text(encoding="utf-8"))
-        self.project_name = self.raw_manifest["metadata"]["project_name"]
-        self.raw_nodes = {
-            node_id: node_values
-            for node_id, node_values in self.raw_manifest.get("nodes", {}).items()
-            if node_values["package_name"] == self.project_name
-        }
-        self.raw_sources = {
-            source_id: source_values
-            for source_id, source_values in self.raw_manifest.get("sources", {}).items()
-            if source_values["package_name"] == self.project_name
-        }
-        self.raw_exposures = {
-            exposure_id: exposure_values
-            for exposure_id, exposure_values in self.raw_manifest.get(
-                "exposures", {}
-            ).items()
-            if exposure_values["package_name"] == self.project_name
-        }
-        self.raw_macros = {
-            macro_id: macro_values
-            for macro_id, macro_values in self.raw_manifest.get("macros", {}).items()
-            if macro_values["package_name"] == self.project_name
-        }
+        self.file_path = file_path
+        self._streaming = streaming
+        self._json_codec = get_codec(json_backend)
+        self._raw_manifest: dict[str, Any] | None = None
+        self._dbt_manifest = dbt_manifest
+        self._resource_types = sorted(
+            loader.resource_type
+            for loader in RESOURCE_LOADERS.values()
+            if resource_types is None or loader.evaluable_class in resource_types
+        )
+        # Re-reading an Iterable can exhaust generators.
+        # Materialize here
+        select = list(select or [])
+        exclude = list(exclude or [])
 
-        self.models: dict[str, Model] = {}
+        self.project_name: str
+        self.dag: DagIndex
         self.tests: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self.models: dict[str, Model] = {}
         self.sources: dict[str, Source] = {}
         self.snapshots: dict[str, Snapshot] = {}
         self.exposures: dict[str, Exposure] = {}
         self.seeds: dict[str, Seed] = {}
         self.macros: dict[str, Macro] = {}
+        for loader in RESOURCE_LOADERS.values():
+            # Evaluables of resource types registered by plugins
+            if not hasattr(self, loader.attribute):
+                setattr(self, loader.attribute, {})
+        # All the resources created, including relatives which aren't evaluated
+        self._resources: dict[str, Evaluable] = {}
+
+        cache = (
+            DiskCache(cache_dir, cache_max_size)
+            if cache_dir and dbt_manifest is None
+            else None
+        )
+        cache_key = self._cache_key(cache, select, exclude) if cache else ""
+        if cache and (cached_state := cache.get(cache_key)):
+            for name, value in cached_state.items():
+                setattr(self, name, value)
+        else:
+            deterministic = self._load(select, exclude)
+            # A selection evaluated by dbt may depend on more than the manifest
+            if cache and deterministic:
+                cache.set(cache_key, self._cached_state())
 
-        self._reindex_tests()
-        self._load_models()
-        self._load_sources()
-        self._load_snapshots()
-        self._load_exposures()
-        self._load_seeds()
-        self._load_macros()
         self._populate_relatives()
 
-        self._filter_evaluables(select, exclude)
+        if lean:
+            self._drop_raw_values()
+        if lean or not keep_raw_manifest:
+            self.release_raw_manifest()
 
-        if (
-            len(self.models)
-            + len(self.sources)
-            + len(self.snapshots)
-            + len(self.seeds)
-            + len(self.exposures)
-            + len(self.macros)
-        ) == 0:
+        if not self.evaluables:
             logger.warning("Nothing to evaluate!")
 
-    def _load_models(self) -> None:
-        """Load the models from the manifest."""
-        for node_id, node_values in self.raw_nodes.items():
-            if node_values.get("resource_type") == "model":
-                model = Model.from_node(node_values, self.tests.get(node_id, []))
-                self.models[node_id] = model
-
-    def _load_sources(self) -> None:
-        """Load the sources from the manifest."""
-        for source_id, source_values in self.raw_sources.items():
-            if source_values.get("resource_type") == "source":
-                source = Source.from_node(source_values, self.tests.get(source_id, []))
-                self.sources[source_id] = source
-
-    def _load_snapshots(self) -> None:
-        """Load the snapshots from the manifest."""
-        for node_id, node_values in self.raw_nodes.items():
-            if node_values.get("resource_type") == "snapshot":
-                snapshot = Snapshot.from_node(node_values, self.tests.get(node_id, []))
-                self.snapshots[node_id] = snapshot
-
-    def _load_exposures(self) -> None:
-        """Load the exposures from the manifest."""
-        for node_id, node_values in self.raw_exposures.items():
-            if node_values.get("resource_type") == "exposure":
-                exposure = Exposure.from_node(node_values)
-                self.exposures[node_id] = exposure
-
-    def _load_seeds(self) -> None:
-        """Load the seeds from the manifest."""
-        for node_id, node_values in self.raw_nodes.items():
-            if node_values.get("resource_type") == "seed":
-                seed = Seed.from_node(node_values, self.tests.get(node_id, []))
-                self.seeds[node_id] = seed
-
-    def _load_macros(self) -> None:
-        """Load the macros from the manifest."""
-        for macro_id, macro_values in self.raw_macros.items():
-            if macro_values.get("resource_type") == "macro":
-                macro = Macro.from_node(macro_values)
-                self.macros[macro_id] = macro
-
-    def _reindex_tests(self) -> None:
-        """Index tests based on their associated evaluable."""
-        for node_values in self.raw_nodes.values():
-            if node_values.get("resource_type") == "test":
-                # Tests for models have a non-null value for `attached_node`
-                if attached_node := node_values.get("attached_node"):
-                    self.tests[attached_node].append(node_values)
-
-                # Tests for sources or separate tests will have `attached_node` == null.
-                # They need to be attributed to the node id
-                # based on the `depends_on` field.
-                elif node_unique_id := next(
-                    iter(node_values.get("depends_on", {}).get("nodes", [])), None
-                ):
-                    self.tests[node_unique_id].append(node_values)
+    @property
+    def evaluables(self) -> list[Evaluable]:
+        """All the evaluables, grouped by resource type."""
+        return [
+            evaluable
+            for loader in RESOURCE_LOADERS.values()
+            for evaluable in getattr(self, loader.attribute).values()
+        ]
 
-    def _populate_relatives(self) -> None:
-        """Populate `parents` and `children` for all evaluables."""
-        for node in (
-            list(self.models.values())
-            + list(self.snapshots.values())
-            + list(self.exposures.values())
-        ):
-            for parent_id in node.depends_on.get("nodes", []):
-                if parent_id in self.models:
-                    node.parents.append(self.models[parent_id])
-                    self.models[parent_id].children.append(node)
-                elif parent_id in self.snapshots:
-                    node.parents.append(self.snapshots[parent_id])
-                    self.snapshots[parent_id].children.append(node)
-                elif parent_id in self.sources:
-                    node.parents.append(self.sources[parent_id])
-                    self.sources[parent_id].children.append(node)
-                elif parent_id in self.seeds:
-                    node.parents.append(self.seeds[parent_id])
-                    self.seeds[parent_id].children.append(node)
-
-    def _filter_evaluables(
-        self, select: Iterable[str] | None, exclude: Iterable[str] | None
-    ) -> None:
-        """Filter evaluables like dbt's --select and --exclude."""
-        single_model_select = re.compile(r"[a-zA-Z0-9_]+")
+    @property
+    def raw_manifest(self) -> dict[str, Any]:
+        """The decoded manifest, read on first access."""
+        if self._raw_manifest is None:
+            if self._dbt_manifest is not None:
+                # Skip the round-trip through `manifest.json`
+                self._raw_manifest = manifest_to_dict(self._dbt_manifest)
+            elif self._streaming:
+                self._raw_manifest = stream_manifest(
+                    self.file_path, sections=self._sections()
+                )
+            else:
+                self._raw_manifest = read_json(self.file_path, self._json_codec)
+        return self._raw_manifest
+
+    @raw_manifest.setter
+    def raw_manifest(self, raw_manifest: dict[str, Any]) -> None:
+        self._raw_manifest = raw_manifest
+
+    def release_raw_manifest(self) -> None:
+        """Release the decoded manifest, and the raw sections derived from it."""
+        self._raw_manifest = None
+        for name in ("raw_nodes", "raw_sources", "raw_exposures", "raw_macros"):
+            self.__dict__.pop(name, None)
+
+    def _raw_section(self, section: str) -> dict[str, Any]:
+        """Get the entries of a manifest section which belong to the project."""
+        return {
+            unique_id: values
+            for unique_id, values in self.raw_manifest.get(section, {}).items()
+            if values["package_name"] == self.project_name
+        }
 
-        # Re-reading an Iterable can exhaust generators.
-        # Materialize here
-        selected_set = set(select or [])
-        excluded_set = set(exclude or [])
+    @cached_property
+    def raw_nodes(self) -> dict[str, Any]:
+        """The raw nodes of the project."""
+        return self._raw_section("nodes")
+
+    @cached_property
+    def raw_sources(self) -> dict[str, Any]:
+        """The raw sources of the project."""
+        return self._raw_section("sources")
+
+    @cached_property
+    def raw_exposures(self) -> dict[str, Any]:
+        """The raw exposures of the project."""
+        return self._raw_section("exposures")
+
+    @cached_property
+    def raw_macros(self) -> dict[str, Any]:
+        """The raw macros of the project."""
+        return self._raw_section("macros")
+
+    def _cache_key(
+        self, cache: DiskCache, select: list[str], exclude: list[str]
+    ) -> str:
+        """Compute the cache key of the manifest and the selection.
+
+        The key is based on the manifest's content. The content hash itself is
+        cached by path, size and modification time, so an unchanged manifest isn't
+        hashed again on every run.
+        """
+        stat = self.file_path.stat()
+        stat_key = make_key(
+            "manifest-stat",
+            dbt_score_version(),
+            str(self.file_path.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+        content_hash = cache.get(stat_key)
+        if content_hash is None:
+            content_hash = file_digest(self.file_path)
+            cache.set(stat_key, content_hash)
+        return make_key(
+            "manifest",
+            dbt_score_version(),
+            content_hash,
+            select,
+            exclude,
+            self._resource_types,
+        )
+
+    def _cached_state(self) -> dict[str, Any]:
+        """The state to cache, loaded evaluables without their relatives."""
+        return {
+            "project_name": self.project_name,
+            "dag": self.dag,
+            "tests": self.tests,
+            "_resources": self._resources,
+            **{
+                loader.attribute: getattr(self, loader.attribute)
+                for loader in RESOURCE_LOADERS.values()
+            },
+        }
 
-        if not select and not exclude:
-            return
+    def _load(self, select: list[str], exclude: list[str]) -> bool:
+        """Load the selected evaluables from the manifest.
 
-        if all(
-            single_model_select.fullmatch(x) for x in selected_set.union(excluded_set)
-        ):
-            # All tokens are simple names — filter in-memory without invoking dbt
-            available = (
-                {model.name for model in self.models.values()}
-                | {source.selector_name for source in self.sources.values()}
-                | {snapshot.name for snapshot in self.snapshots.values()}
-                | {exposure.name for exposure in self.exposures.values()}
-                | {seed.name for seed in self.seeds.values()}
-                | {macro.name for macro in self.macros.values()}
+        Returns:
+            Whether the selection only depends on the manifest, i.e. it wasn't
+            evaluated by dbt.
+        """
+        self.project_name = self.raw_manifest["metadata"]["project_name"]
+        raw_resources = self._scan()
+
+        # Index the whole DAG, so metrics don't depend on the evaluables selected
+        self.dag = DagIndex(
+            {
+                unique_id: loader.resource_type
+                for unique_id, (loader, _) in raw_resources.items()
+                if issubclass(loader.evaluable_class, HasGraphMetricsMixin)
+            },
+            {
+                unique_id: values.get("depends_on", {}).get("nodes", [])
+                for unique_id, (_, values) in raw_resources.items()
+            },
+        )
+
+        with phase("select"):
+            selected_ids, deterministic = self._select(
+                {unique_id: values for unique_id, (_, values) in raw_resources.items()},
+                select,
+                exclude,
             )
+        selected_ids = {
+            unique_id
+            for unique_id in selected_ids
+            if raw_resources[unique_id][0].resource_type in self._resource_types
+        }
+        lineage_ids = selected_ids | self.dag.lineage(selected_ids)
+        # Direct relatives are loaded too, so that the parents and children of the
+        # lineage are complete, like when the whole project is loaded
+        loaded_ids = lineage_ids | self.dag.neighbours(lineage_ids)
+
+        for unique_id, (loader, values) in raw_resources.items():
+            if unique_id in loaded_ids:
+                evaluable = loader.load(values, self.tests.get(unique_id, []))
+                self._resources[unique_id] = evaluable
+                if unique_id in selected_ids:
+                    getattr(self, loader.attribute)[unique_id] = evaluable
+        return deterministic
 
-            result_list = list((selected_set or available) - excluded_set)
+    @staticmethod
+    def _sections() -> list[str]:
+        """The manifest sections to load, including `nodes` for tests."""
+        return list(
+            dict.fromkeys(
+                ["nodes", *(loader.section for loader in RESOURCE_LOADERS.values())]
+            )
+        )
 
-        else:
+    def _scan(self) -> dict[str, tuple[ResourceLoader, dict[str, Any]]]:
+        """Index tests and find resources, in a single pass over each section.
+
+        Returns:
+            The loader and raw values of the project's resources, by unique id.
+        """
+        resources: dict[str, tuple[ResourceLoader, dict[str, Any]]] = {}
+        for section in self._sections():
+            for unique_id, values in self.raw_manifest.get(section, {}).items():
+                if values["package_name"] != self.project_name:
+                    continue
+                resource_type = values.get("resource_type")
+                if resource_type == "test" and section == "nodes":
+                    self._index_test(values)
+                elif (
+                    loader := RESOURCE_LOADERS.get(resource_type)
+                ) and loader.section == section:
+                    resources[unique_id] = (loader, values)
+        return resources
+
+    def _select(
+        self,
+        raw_resources: dict[str, dict[str, Any]],
+        select: list[str],
+        exclude: list[str],
+    ) -> tuple[set[str], bool]:
+        """Evaluate the selection like dbt's --select and --exclude.
+
+        Returns:
+            The unique ids of the selected resources, and whether the selection was
+            evaluated natively.
+        """
+        try:
+            return NodeSelector(raw_resources).select(select, exclude), True
+        except UnsupportedSelectorException as e:
             # Use dbt's implementation of --select and --exclude
-            result_list = dbt_ls(select, exclude)
+            logger.debug(f"{e} Falling back to dbt ls.")
 
-        self.models = {k: m for k, m in self.models.items() if m.name in result_list}
-        self.sources = {
-            k: s for k, s in self.sources.items() if s.selector_name in result_list
-        }
-        self.snapshots = {
-            k: s for k, s in self.snapshots.items() if s.name in result_list
-        }
-        self.exposures = {
-            k: e for k, e in self.exposures.items() if e.name in result_list
-        }
-        self.seeds = {k: s for k, s in self.seeds.items() if s.name in result_list}
-        self.macros = {k: m for k, m in self.macros.items() if m.name in result_list}
+        selected_names = set(
+            dbt_ls(select or None, exclude or None, manifest=self._dbt_manifest)
+        )
+        return {
+            unique_id
+            for unique_id, values in raw_resources.items()
+            if (
+                f"{values['source_name']}.{values['name']}"
+                if values["resource_type"] == "source"
+                else values["name"]
+            )
+            in selected_names
+        }, False
+
+    def _index_test(self, test_values: dict[str, Any]) -> None:
+        """Index a test based on its associated evaluable."""
+        # Tests for models have a non-null value for `attached_node`
+        if attached_node := test_values.get("attached_node"):
+            self.tests[attached_node].append(test_values)
+
+        # Tests for sources or separate tests will have `attached_node` == null.
+        # They need to be attributed to the node id
+        # based on the `depends_on` field.
+        elif node_unique_id := next(
+            iter(test_values.get("depends_on", {}).get("nodes", [])), None
+        ):
+            self.tests[node_unique_id].append(test_values)
+
+    def _populate_relatives(self) -> None:
+        """Populate `parents` and `children` for all loaded resources."""
+        for resource_type in (Model, Snapshot, Exposure):
+            for node in self._resources.values():
+                if not isinstance(node, resource_type):
+                    continue
+                for parent_id in node.depends_on.get("nodes", []):
+                    parent = self._resources.get(parent_id)
+                    if isinstance(parent, (Model, Snapshot, Source, Seed)):
+                        node.parents.append(parent)
+                        parent.children.append(node)
+
+        for resource in self._resources.values():
+            if isinstance(resource, HasGraphMetricsMixin):
+                resource._dag = self.dag
+
+    def _drop_raw_values(self) -> None:
+        """Drop the raw values of resources, their columns, tests and constraints."""
+        for resource in self._resources.values():
+            if isinstance(resource, HasColumnsMixin):
+                # Parse deferred columns and tests before their raw values are gone
+                for test in resource.tests:
+                    test._raw_values = {}
+                for column in resource.columns:
+                    column._raw_values = {}
+                    column._raw_test_values = []
+                    for test in column.tests:
+                        test._raw_values = {}
+                    for constraint in column.constraints:
+                        constraint._raw_values = {}
+                resource._raw_test_values = []
+            for constraint in getattr(resource, "constraints", []):
+                constraint._raw_values = {}
+            resource._raw_values = {}
+        self.tests = defaultdict(list)
@@ -0,0 +1,178 @@
+"""Profile the duration of linting, by phase, rule, filter and resource type.
+
+Profiling is enabled by activating a profile with `profiling`. When no profile is
+active, instrumented code only pays for a global lookup.
+"""
+
+import heapq
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Final, Iterator
+
+# Phases of linting, in order
+PHASES: Final[tuple[str, ...]] = (
+    "parse",
+    "load",
+    "select",
+    "registry",
+    "evaluate",
+    "score",
+    "format",
+)
+
+# Number of slowest pairs of rules and evaluables to report
+SLOWEST_PAIRS: Final[int] = 10
+
+
+@dataclass
+class Timing:
+    """The number of calls of something, and their total duration in seconds."""
+
+    calls: int = 0
+    duration: float = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record a call."""
+        self.calls += 1
+        self.duration += duration
+
+
+class Profile:
+    """Durations recorded while linting."""
+
+    def __init__(self, slowest: int = SLOWEST_PAIRS) -> None:
+        """Create an empty profile.
+
+        Args:
+            slowest: The number of slowest pairs of rules and evaluables to keep.
+        """
+        self.phases: defaultdict[str, Timing] = defaultdict(Timing)
+        self.rules: defaultdict[str, Timing] = defaultdict(Timing)
+        self.filters: defaultdict[str, Timing] = defaultdict(Timing)
+        self.resource_types: defaultdict[str, Timing] = defaultdict(Timing)
+        # Min-heap of the slowest evaluations: (duration, rule, unique id)
+        self.slowest_pairs: list[tuple[float, str, str]] = []
+        self._slowest = slowest
+        # For every running phase, the duration of the phases nested in it
+        self._nested_durations: list[float] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the duration of a phase, excluding the phases nested in it."""
+        self._nested_durations.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            self.phases[name].add(duration - self._nested_durations.pop())
+            if self._nested_durations:
+                self._nested_durations[-1] += duration
+
+    def record_rule(
+        self, rule: str, resource_type: str, unique_id: str, duration: float
+    ) -> None:
+        """Record the evaluation of a rule on an evaluable."""
+        with self._lock:
+            self.rules[rule].add(duration)
+            self.resource_types[resource_type].add(duration)
+            pair = (duration, rule, unique_id)
+            if len(self.slowest_pairs) < self._slowest:
+                heapq.heappush(self.slowest_pairs, pair)
+            elif pair > self.slowest_pairs[0]:
+                heapq.heapreplace(self.slowest_pairs, pair)
+
+    def record_filter(self, rule_filter: str, duration: float) -> None:
+        """Record the evaluation of a filter on an evaluable."""
+        with self._lock:
+            self.filters[rule_filter].add(duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        """The profile as a dictionary, with the slowest items first."""
+
+        def timings(items: dict[str, Timing]) -> list[dict[str, Any]]:
+            return [
+                {"name": name, "calls": timing.calls, "duration": timing.duration}
+                for name, timing in sorted(
+                    items.items(), key=lambda item: item[1].duration, reverse=True
+                )
+            ]
+
+        return {
+            "phases": [
+                {
+                    "name": name,
+                    "calls": self.phases[name].calls,
+                    "duration": self.phases[name].duration,
+                }
+                for name in PHASES
+                if name in self.phases
+            ],
+            "rules": timings(self.rules),
+            "filters": timings(self.filters),
+            "resource_types": timings(self.resource_types),
+            "slowest_pairs": [
+                {"rule": rule, "unique_id": unique_id, "duration": duration}
+                for duration, rule, unique_id in sorted(
+                    self.slowest_pairs, reverse=True
+                )
+            ],
+        }
+
+    def summary(self) -> str:
+        """A human-readable summary of the profile, with the slowest items first."""
+        profile = self.to_dict()
+        lines = []
+        for section, title in (
+            ("phases", "Phases"),
+            ("rules", "Rules"),
+            ("filters", "Filters"),
+            ("resource_types", "Resource types"),
+        ):
+            if not profile[section]:
+                continue
+            lines.append(f"{title}:")
+            lines.extend(
+                f"  {item['duration']:10.4f}s {item['calls']:8d} calls  {item['name']}"
+                for item in profile[section]
+            )
+        if profile["slowest_pairs"]:
+            lines.append("Slowest evaluations:")
+            lines.extend(
+                f"  {pair['duration']:10.4f}s  {pair['rule']} on {pair['unique_id']}"
+                for pair in profile["slowest_pairs"]
+            )
+        return "\n".join(lines)
+
+
+_active_profile: Profile | None = None
+
+
+def active_profile() -> Profile | None:
+    """Get the active profile, if profiling is enabled."""
+    return _active_profile
+
+
+@contextmanager
+def profiling(profile: Profile | None) -> Iterator[None]:
+    """Activate a profile, or do nothing if it's None."""
+    global _active_profile  # noqa: PLW0603
+    previous, _active_profile = _active_profile, profile
+    try:
+        yield
+    finally:
+        _active_profile = previous
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the duration of a phase in the active profile, if any."""
+    if _active_profile is None:
+        yield
+    else:
+        with _active_profile.phase(name):
+            yield
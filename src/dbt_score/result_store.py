@@ -0,0 +1,174 @@
+"""Compact store of the results of an evaluation.
+
+Results are stored in columns, instead of a dictionary of results by rule for every
+evaluable: evaluables and rules are identified by integers, every result is a status
+in an array, and the messages of violations and exceptions are interned. Exceptions
+are reduced to their type and message, so their tracebacks aren't kept alive, and
+rebuilt with the same type.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from enum import IntEnum
+from typing import TYPE_CHECKING, Iterable, Iterator, MutableMapping, Type
+
+from dbt_score.exceptions import RuleFailedException
+from dbt_score.models import Evaluable
+from dbt_score.rule import Rule, RuleViolation
+
+if TYPE_CHECKING:
+    from dbt_score.evaluation import EvaluableResultsType
+
+
+class ResultStatus(IntEnum):
+    """The status of the result of a rule on an evaluable."""
+
+    OK = 0
+    WARN = 1
+    ERR = 2
+    # The rule wasn't evaluated, e.g. as a filter of the rule excluded the evaluable
+    SKIPPED = 3
+
+
+# The detail of a result, interned: the message of a violation, or the type and
+# message of an exception
+DetailType = str | None | tuple[type[Exception], str]
+
+
+def _rebuild_exception(exception_type: type[Exception], message: str) -> Exception:
+    """Rebuild an exception from its type and message, without its constructor.
+
+    Exceptions which can't be rebuilt, e.g. as their message is computed from
+    attributes, are rebuilt as `RuleFailedException`, with the same type name.
+    """
+    try:
+        exception = exception_type.__new__(exception_type)
+        exception.args = (message,)
+        rebuilt = str(exception) == message
+    except Exception:
+        rebuilt = False
+    if rebuilt:
+        return exception
+    return RuleFailedException(exception_type.__name__, message)
+
+
+class ResultStore(MutableMapping[Evaluable, "EvaluableResultsType"]):
+    """The results of rules, by evaluable, stored compactly.
+
+    The store is a mapping of every evaluable to its results, as a dictionary of
+    results by rule, which is rebuilt on access. Rebuilt exceptions have the type
+    and message of the original exception, but neither its traceback nor its other
+    attributes.
+    Aggregate queries read statuses directly, without rebuilding results.
+    """
+
+    def __init__(self, rules: Iterable[Type[Rule]]) -> None:
+        """Create an empty store.
+
+        Args:
+            rules: The rules whose results are stored, in the order of results.
+        """
+        self._rules = list(rules)
+        self._rule_ids = {rule: i for i, rule in enumerate(self._rules)}
+        # The row of the results of every evaluable
+        self._evaluable_ids: dict[Evaluable, int] = {}
+        self._row_count = 0
+        # The status and detail of every pair of evaluable and rule, by evaluable
+        self._statuses = array("B")
+        self._details = array("I")
+        self._values: list[DetailType] = [None]
+        self._value_ids: dict[DetailType, int] = {None: 0}
+
+    def _intern(self, value: DetailType) -> int:
+        """Get the id of the detail of a result, adding it if it's new."""
+        if (value_id := self._value_ids.get(value)) is None:
+            value_id = self._value_ids[value] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    def __setitem__(self, evaluable: Evaluable, results: EvaluableResultsType) -> None:
+        """Store the results of an evaluable, replacing its previous results."""
+        if (evaluable_id := self._evaluable_ids.get(evaluable)) is None:
+            evaluable_id = self._evaluable_ids[evaluable] = self._row_count
+            self._row_count += 1
+            self._statuses.extend([ResultStatus.SKIPPED] * len(self._rules))
+            self._details.extend([0] * len(self._rules))
+        offset = evaluable_id * len(self._rules)
+        for i in range(offset, offset + len(self._rules)):
+            self._statuses[i] = ResultStatus.SKIPPED
+            self._details[i] = 0
+        for rule, result in results.items():
+            i = offset + self._rule_ids[rule]
+            if result is None:
+                self._statuses[i] = ResultStatus.OK
+            elif isinstance(result, RuleViolation):
+                self._statuses[i] = ResultStatus.WARN
+                self._details[i] = self._intern(result.message)
+            else:
+                self._statuses[i] = ResultStatus.ERR
+                self._details[i] = self._intern((type(result), str(result)))
+
+    def __getitem__(self, evaluable: Evaluable) -> EvaluableResultsType:
+        """Rebuild the results of an evaluable."""
+        offset = self._evaluable_ids[evaluable] * len(self._rules)
+        results: EvaluableResultsType = {}
+        for rule_id, rule in enumerate(self._rules):
+            status = self._statuses[offset + rule_id]
+            if status == ResultStatus.SKIPPED:
+                continue
+            detail = self._values[self._details[offset + rule_id]]
+            if status == ResultStatus.OK:
+                results[rule] = None
+            elif status == ResultStatus.WARN:
+                assert not isinstance(detail, tuple)
+                results[rule] = RuleViolation(message=detail)
+            else:
+                assert isinstance(detail, tuple)
+                results[rule] = _rebuild_exception(*detail)
+        return results
+
+    def __delitem__(self, evaluable: Evaluable) -> None:
+        """Forget an evaluable. Its results keep their space until the store is gone."""
+        evaluable_id = self._evaluable_ids.pop(evaluable)
+        offset = evaluable_id * len(self._rules)
+        for i in range(offset, offset + len(self._rules)):
+            self._statuses[i] = ResultStatus.SKIPPED
+
+    def __iter__(self) -> Iterator[Evaluable]:
+        """Iterate over evaluables, in the order their results were stored."""
+        return iter(self._evaluable_ids)
+
+    def __len__(self) -> int:
+        """The number of evaluables."""
+        return len(self._evaluable_ids)
+
+    def status(self, evaluable: Evaluable, rule: Type[Rule]) -> ResultStatus:
+        """Get the status of the result of a rule on an evaluable."""
+        offset = self._evaluable_ids[evaluable] * len(self._rules)
+        return ResultStatus(self._statuses[offset + self._rule_ids[rule]])
+
+    def counts(self, rule: Type[Rule] | None = None) -> Counter[ResultStatus]:
+        """Count the results by status, of a rule or of all rules.
+
+        Pairs of rules and forgotten evaluables are counted as skipped.
+        """
+        if rule is None:
+            statuses = self._statuses
+        else:
+            statuses = self._statuses[self._rule_ids[rule] :: len(self._rules)]
+        return Counter(
+            {ResultStatus(status): count for status, count in Counter(statuses).items()}
+        )
+
+    def evaluables_with(
+        self, status: ResultStatus, rule: Type[Rule]
+    ) -> list[Evaluable]:
+        """Get the evaluables where the result of a rule has a status."""
+        rule_id = self._rule_ids[rule]
+        return [
+            evaluable
+            for evaluable, evaluable_id in self._evaluable_ids.items()
+            if self._statuses[evaluable_id * len(self._rules) + rule_id] == status
+        ]
@@ -1,23 +1,41 @@
 """Rule definitions."""
 
 import inspect
+import threading
 import typing
 from dataclasses import dataclass, field
 from enum import Enum
+from time import perf_counter
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Iterable,
+    Mapping,
+    Sequence,
     Type,
     TypeAlias,
     cast,
     overload,
 )
 
-from dbt_score.models import Evaluable, Exposure, Macro, Model, Seed, Snapshot, Source
+from dbt_score.models import (
+    RESOURCE_LOADERS,
+    Evaluable,
+    Exposure,
+    Macro,
+    Model,
+    Seed,
+    Snapshot,
+    Source,
+)
 from dbt_score.more_itertools import first_true
+from dbt_score.profiling import active_profile
 from dbt_score.rule_filter import RuleFilter
 
+# Serialize changes to the class-level state of rules
+_rule_class_lock = threading.Lock()
+
 
 class Severity(Enum):
     """The severity/weight of a rule."""
@@ -35,6 +53,7 @@ class RuleConfig:
     severity: Severity | None = None
     config: dict[str, Any] = field(default_factory=dict)
     rule_filter_names: list[str] = field(default_factory=list)
+    budget: float | None = None
 
     @staticmethod
     def from_dict(rule_config: dict[str, Any]) -> "RuleConfig":
@@ -50,9 +69,13 @@ class RuleConfig:
             if "rule_filter_names" in rule_config
             else []
         )
+        budget = config.pop("rule_budget", None)
 
         return RuleConfig(
-            severity=severity, config=config, rule_filter_names=filter_names
+            severity=severity,
+            config=config,
+            rule_filter_names=filter_names,
+            budget=budget,
         )
 
 
@@ -77,6 +100,13 @@ RuleEvaluationType: TypeAlias = (
     | SeedRuleEvaluationType
     | MacroRuleEvaluationType
 )
+# Asynchronous rules evaluate an evaluable in a coroutine
+AsyncRuleEvaluationType: TypeAlias = Callable[[Any], Awaitable[RuleViolation | None]]
+# Batch rules evaluate a sequence of evaluables of the same type, e.g. `list[Model]`,
+# and map evaluables to their violation
+BatchRuleEvaluationType: TypeAlias = Callable[
+    [Sequence[Any]], Mapping[Any, RuleViolation | None]
+]
 
 
 class Rule:
@@ -86,7 +116,24 @@ class Rule:
     severity: Severity = Severity.MEDIUM
     rule_filter_names: list[str]
     rule_filters: frozenset[RuleFilter] = frozenset()
+    # The cumulative duration of the rule's evaluations, in seconds, after which
+    # it's disabled
+    budget: float | None = None
     default_config: typing.ClassVar[dict[str, Any]] = {}
+    # Whether the rule reads relatives of evaluables, e.g. `parents`, so it must be
+    # evaluated again when they change in incremental mode
+    graph_sensitive: typing.ClassVar[bool] = False
+    # Whether the results of the rule only depend on the evaluable, so they can be
+    # cached between runs
+    cacheable: typing.ClassVar[bool] = False
+    # Whether the rule evaluates all evaluables of its resource type at once, with
+    # `evaluate_batch`
+    batch: typing.ClassVar[bool] = False
+    # Whether `evaluate` is a coroutine function, evaluated on an event loop
+    asynchronous: typing.ClassVar[bool] = False
+    # The mean duration of an evaluation of the rule, in seconds, if known, to
+    # evaluate the cheapest rules first
+    cost: typing.ClassVar[float | None] = None
     resource_type: typing.ClassVar[type[Evaluable]]
 
     def __init__(self, rule_config: RuleConfig | None = None) -> None:
@@ -102,6 +149,9 @@ class Rule:
             raise AttributeError("Subclass must define class attribute `description`.")
 
         cls.resource_type = cls._introspect_resource_type()
+        cls.asynchronous = inspect.iscoroutinefunction(cls.evaluate)
+        if cls.batch and inspect.iscoroutinefunction(cls.evaluate_batch):
+            raise TypeError("Batch rules can't be asynchronous.")
 
         cls._validate_rule_filters()
 
@@ -118,21 +168,40 @@ class Rule:
 
     @classmethod
     def _introspect_resource_type(cls) -> Type[Evaluable]:
-        evaluate_func = getattr(cls, "_orig_evaluate", cls.evaluate)
+        evaluate_func = getattr(
+            cls, "_orig_evaluate", cls.evaluate_batch if cls.batch else cls.evaluate
+        )
 
+        def evaluated_type(annotation: Any) -> Any:
+            # Batch rules are annotated with a sequence of evaluables
+            if cls.batch:
+                return next(iter(typing.get_args(annotation)), None)
+            return annotation
+
+        # Evaluables include the resource types of registered loaders
+        evaluable_classes = [
+            loader.evaluable_class for loader in RESOURCE_LOADERS.values()
+        ]
         sig = inspect.signature(evaluate_func)
         resource_type_argument = first_true(
             sig.parameters.values(),
-            pred=lambda arg: arg.annotation in typing.get_args(Evaluable),
+            pred=lambda arg: evaluated_type(arg.annotation) in evaluable_classes,
         )
 
         if not resource_type_argument:
+            if cls.batch:
+                raise TypeError(
+                    "Subclass must implement method `evaluate_batch` with an "
+                    "argument annotated as a sequence of Model or Source."
+                )
             raise TypeError(
                 "Subclass must implement method `evaluate` with an "
                 "annotated Model or Source argument."
             )
 
-        resource_type = cast(type[Evaluable], resource_type_argument.annotation)
+        resource_type = cast(
+            type[Evaluable], evaluated_type(resource_type_argument.annotation)
+        )
         return resource_type
 
     def process_config(self, rule_config: RuleConfig) -> None:
@@ -152,39 +221,80 @@ class Rule:
             rule_config.severity
         ) if rule_config.severity else rule_config.severity
         self.rule_filter_names = rule_config.rule_filter_names
+        if rule_config.budget is not None:
+            self.budget = rule_config.budget
         self.config = config
 
     def evaluate(self, evaluable: Evaluable) -> RuleViolation | None:
         """Evaluates the rule."""
         raise NotImplementedError("Subclass must implement method `evaluate`.")
 
+    def evaluate_batch(
+        self, evaluables: Sequence[Evaluable]
+    ) -> Mapping[Evaluable, RuleViolation | None]:
+        """Evaluates the rule on all evaluables of its resource type at once.
+
+        Only called for batch rules, instead of `evaluate`.
+
+        Args:
+            evaluables: The evaluables of the rule's resource type, which its
+                filters allow.
+
+        Returns:
+            The violations of evaluables. Evaluables which aren't in the mapping
+            don't violate the rule.
+        """
+        raise NotImplementedError("Batch rules must implement method `evaluate_batch`.")
+
     @classmethod
-    def should_evaluate(cls, evaluable: Evaluable) -> bool:
+    def should_evaluate(
+        cls, evaluable: Evaluable, filter_results: dict[str, bool] | None = None
+    ) -> bool:
         """Checks whether the rule should be applied against the evaluable.
 
         The evaluable must satisfy the following criteria:
             - all filters in the rule allow evaluation
             - the rule and evaluable have matching resource_types
+
+        Args:
+            evaluable: The evaluable to check.
+            filter_results: The results of filters on this evaluable, by filter
+                source. Filters already in there aren't evaluated again, and the
+                results of the others are added, so that filters shared by rules
+                are evaluated once per evaluable.
         """
         resource_types_match = cls.resource_type is type(evaluable)
 
         if not resource_types_match:
             return False
 
-        if cls.rule_filters:
-            return all(f.evaluate(evaluable) for f in cls.rule_filters)
-
+        # Read once, in case the filters are replaced concurrently
+        rule_filters = cls.rule_filters
+        if not rule_filters:
+            return True
+        if filter_results is None:
+            return all(f.evaluate(evaluable) for f in rule_filters)
+
+        for rule_filter in rule_filters:
+            name = rule_filter.source()
+            if name not in filter_results:
+                filter_results[name] = _evaluate_filter(rule_filter, evaluable)
+            if not filter_results[name]:
+                return False
         return True
 
     @classmethod
     def set_severity(cls, severity: Severity) -> None:
         """Set the severity of the rule."""
-        cls.severity = severity
+        with _rule_class_lock:
+            cls.severity = severity
 
     @classmethod
     def set_filters(cls, rule_filters: Iterable[RuleFilter]) -> None:
         """Set the filters of the rule."""
-        cls.rule_filters = frozenset(rule_filters)
+        rule_filters = frozenset(rule_filters)
+        with _rule_class_lock:
+            cls.rule_filters = rule_filters
 
     @classmethod
     def source(cls) -> str:
@@ -196,6 +306,18 @@ class Rule:
         return hash(self.source())
 
 
+def _evaluate_filter(rule_filter: RuleFilter, evaluable: Evaluable) -> bool:
+    """Evaluate a filter, recording its duration when profiling."""
+    profile = active_profile()
+    if profile is None:
+        return rule_filter.evaluate(evaluable)
+    start = perf_counter()
+    try:
+        return rule_filter.evaluate(evaluable)
+    finally:
+        profile.record_filter(rule_filter.source(), perf_counter() - start)
+
+
 # Use @overload to have proper typing for both @rule and @rule(...)
 # https://mypy.readthedocs.io/en/stable/generics.html#decorator-factories
 
@@ -224,22 +346,42 @@ def rule(__func: SeedRuleEvaluationType) -> Type[Rule]: ...
 def rule(__func: MacroRuleEvaluationType) -> Type[Rule]: ...
 
 
+@overload
+def rule(__func: AsyncRuleEvaluationType) -> Type[Rule]: ...
+
+
 @overload
 def rule(
     *,
     description: str | None = None,
     severity: Severity = Severity.MEDIUM,
     rule_filters: set[RuleFilter] | None = None,
-) -> Callable[[RuleEvaluationType], Type[Rule]]: ...
+    graph_sensitive: bool = False,
+    cacheable: bool = False,
+    batch: bool = False,
+    cost: float | None = None,
+) -> Callable[
+    [RuleEvaluationType | AsyncRuleEvaluationType | BatchRuleEvaluationType], Type[Rule]
+]: ...
 
 
 def rule(
-    __func: RuleEvaluationType | None = None,
+    __func: RuleEvaluationType | AsyncRuleEvaluationType | None = None,
     *,
     description: str | None = None,
     severity: Severity = Severity.MEDIUM,
     rule_filters: set[RuleFilter] | None = None,
-) -> Type[Rule] | Callable[[RuleEvaluationType], Type[Rule]]:
+    graph_sensitive: bool = False,
+    cacheable: bool = False,
+    batch: bool = False,
+    cost: float | None = None,
+) -> (
+    Type[Rule]
+    | Callable[
+        [RuleEvaluationType | AsyncRuleEvaluationType | BatchRuleEvaluationType],
+        Type[Rule],
+    ]
+):
     """Rule decorator.
 
     The rule decorator creates a rule class (subclass of Rule) and returns it.
@@ -248,14 +390,27 @@ def rule(
     - ``@rule``
     - ``@rule(description="...")``
 
+    The decorated function can be a coroutine function, i.e. ``async def``.
+
     Args:
         __func: The rule evaluation function being decorated.
         description: The description of the rule.
         severity: The severity of the rule.
         rule_filters: Set of RuleFilter that filters the items that the rule applies to.
+        graph_sensitive: Whether the rule reads the relatives of the items, e.g.
+            their parents, or their graph metrics.
+        cacheable: Whether the rule is a pure function of the items, so its
+            results can be cached between runs.
+        batch: Whether the rule evaluates all items of its resource type at once.
+            The function then takes a sequence of items, e.g. `list[Model]`, and
+            returns a mapping of items to their violation.
+        cost: The mean duration of an evaluation of the rule, in seconds, instead
+            of the one learned from previous runs.
     """
 
-    def decorator_rule(func: RuleEvaluationType) -> Type[Rule]:
+    def decorator_rule(
+        func: RuleEvaluationType | AsyncRuleEvaluationType | BatchRuleEvaluationType,
+    ) -> Type[Rule]:
         """Decorator function."""
         if func.__doc__ is None and description is None:
             raise AttributeError("Rule must define `description` or `func.__doc__`.")
@@ -265,10 +420,14 @@ def rule(
             func.__doc__.split("\n")[0] if func.__doc__ else None
         )
 
-        def wrapped_func(self: Rule, *args: Any, **kwargs: Any) -> RuleViolation | None:
+        def wrapped_func(self: Rule, *args: Any, **kwargs: Any) -> Any:
             """Wrap func to add `self`."""
             return func(*args, **kwargs)
 
+        async def wrapped_async_func(self: Rule, *args: Any, **kwargs: Any) -> Any:
+            """Wrap the coroutine function func to add `self`."""
+            return await cast(AsyncRuleEvaluationType, func)(*args, **kwargs)
+
         # Get default parameters from the rule definition
         default_config = {
             key: val.default
@@ -284,8 +443,16 @@ def rule(
                 "description": rule_description,
                 "severity": severity,
                 "rule_filters": rule_filters or frozenset(),
+                "graph_sensitive": graph_sensitive,
+                "cacheable": cacheable,
+                "batch": batch,
+                "cost": cost,
                 "default_config": default_config,
-                "evaluate": wrapped_func,
+                "evaluate_batch" if batch else "evaluate": (
+                    wrapped_async_func
+                    if inspect.iscoroutinefunction(func)
+                    else wrapped_func
+                ),
                 # Save provided evaluate function
                 "_orig_evaluate": func,
                 # Forward origin of the decorated function
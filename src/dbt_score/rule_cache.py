@@ -0,0 +1,116 @@
+"""Persistent cache of the results of cacheable rules.
+
+Rules declared with `cacheable=True` must be pure functions of the evaluable. Their
+results are stored by evaluable fingerprint, for every version of the rule's code
+and configuration, so unchanged evaluables aren't evaluated again by these rules.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Final, Iterable
+
+from dbt_score.cache import DiskCache, make_key
+from dbt_score.incremental import evaluable_fingerprint, rule_fingerprint
+from dbt_score.models import Evaluable
+from dbt_score.rule import Rule, RuleViolation
+
+DEFAULT_MAX_ENTRIES: Final[int] = 100_000
+
+# Placeholder of the result of a rule which isn't cached
+MISSING: Final[Any] = object()
+
+
+class RuleResultCache:
+    """The results of cacheable rules, by rule and evaluable fingerprint.
+
+    The results of every rule are stored in their own cache entry, read when first
+    needed. Within an entry, the least recently used results are evicted when it
+    exceeds its maximum number of results.
+
+    Results are read while rules are evaluated, possibly concurrently, and written
+    by the evaluation, so reads and writes are serialized by a lock. Only entries
+    with new or changed results are written back to the cache.
+    """
+
+    def __init__(
+        self,
+        cache: DiskCache,
+        rules: Iterable[Rule],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Instantiate the cache.
+
+        Args:
+            cache: The cache where results are stored.
+            rules: The active rules, of which only cacheable ones are cached.
+            max_entries: The maximum number of results of a rule.
+        """
+        self._cache = cache
+        self._max_entries = max_entries
+        self._keys = {
+            rule.source(): make_key("rule", rule_fingerprint(rule))
+            for rule in rules
+            if rule.cacheable
+        }
+        self._results: dict[str, OrderedDict[str, RuleViolation | None]] = {}
+        self._fingerprints: dict[tuple[str, bool], str | None] = {}
+        self._modified: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _rule_results(self, rule: type[Rule]) -> OrderedDict[str, RuleViolation | None]:
+        """Get the cached results of a rule, by evaluable fingerprint.
+
+        Must be called with the lock held.
+        """
+        name = rule.source()
+        if name not in self._results:
+            self._results[name] = self._cache.get(self._keys[name]) or OrderedDict()
+        return self._results[name]
+
+    def _fingerprint(self, rule: type[Rule], evaluable: Evaluable) -> str | None:
+        """Get the fingerprint of an evaluable, as read by a rule."""
+        key = (evaluable.unique_id, rule.graph_sensitive)
+        if key not in self._fingerprints:
+            self._fingerprints[key] = evaluable_fingerprint(
+                evaluable, graph_sensitive=rule.graph_sensitive
+            )
+        return self._fingerprints[key]
+
+    def get(self, rule: type[Rule], evaluable: Evaluable) -> Any:
+        """Get the cached result of a rule on an evaluable, or `MISSING`."""
+        if not rule.cacheable or rule.source() not in self._keys:
+            return MISSING
+        fingerprint = self._fingerprint(rule, evaluable)
+        if fingerprint is None:
+            return MISSING
+        with self._lock:
+            return self._rule_results(rule).get(fingerprint, MISSING)
+
+    def set(
+        self, rule: type[Rule], evaluable: Evaluable, result: RuleViolation | None
+    ) -> None:
+        """Cache the result of a rule on an evaluable, marking it as recently used.
+
+        Recency is only persisted along with new or changed results.
+        """
+        if not rule.cacheable or rule.source() not in self._keys:
+            return
+        fingerprint = self._fingerprint(rule, evaluable)
+        if fingerprint is None:
+            return
+        with self._lock:
+            results = self._rule_results(rule)
+            changed = results.get(fingerprint, MISSING) != result
+            results[fingerprint] = result
+            results.move_to_end(fingerprint)
+            while len(results) > self._max_entries:
+                results.popitem(last=False)
+            if changed:
+                self._modified.add(rule.source())
+
+    def save(self) -> None:
+        """Persist the results of rules with new or changed results."""
+        with self._lock:
+            for name in self._modified:
+                self._cache.set(self._keys[name], self._results[name])
+            self._modified.clear()
@@ -0,0 +1,85 @@
+"""Costs of rules, to evaluate the cheapest rules first.
+
+The cost of a rule is its mean duration per evaluation, in seconds. It's either
+declared by the rule, or learned from the durations measured in previous runs.
+"""
+
+import threading
+from typing import Final, Iterable
+
+from dbt_score.cache import DiskCache, dbt_score_version, make_key
+from dbt_score.profiling import Timing
+from dbt_score.rule import Rule, Severity
+
+# Weight of the durations of the latest run in learned costs
+LEARNING_RATE: Final[float] = 0.5
+
+
+class RuleCosts:
+    """The costs of rules, learned from the durations of their evaluations.
+
+    Durations are measured while rules are evaluated, possibly concurrently, and
+    learned once the evaluation is done.
+    """
+
+    def __init__(self, cache: DiskCache | None = None) -> None:
+        """Load the costs learned from previous runs.
+
+        Args:
+            cache: The cache where learned costs are stored. Without it, only
+                declared costs are known.
+        """
+        self._cache = cache
+        self._key = make_key("rule_costs", dbt_score_version())
+        self._learned: dict[str, float] = (cache.get(self._key) if cache else {}) or {}
+        self._measured: dict[str, Timing] = {}
+        self._lock = threading.Lock()
+
+    def cost(self, rule: Rule) -> float:
+        """Get the cost of a rule, declared or learned, or 0 if it's unknown."""
+        if rule.cost is not None:
+            return rule.cost
+        return self._learned.get(rule.source(), 0.0)
+
+    def order(self, rules: Iterable[Rule]) -> list[Rule]:
+        """Order rules by cost, with CRITICAL rules first.
+
+        CRITICAL violations decide the score of an evaluable, so they come first
+        whatever their cost. Rules of the same cost keep their order.
+        """
+        return sorted(
+            rules,
+            key=lambda rule: (rule.severity != Severity.CRITICAL, self.cost(rule)),
+        )
+
+    def record(self, rule_name: str, duration: float) -> None:
+        """Record the duration of an evaluation of a rule."""
+        with self._lock:
+            self._measured.setdefault(rule_name, Timing()).add(duration)
+
+    def pop_measurements(self) -> dict[str, Timing]:
+        """Get the durations measured so far, and forget them."""
+        with self._lock:
+            measured, self._measured = self._measured, {}
+        return measured
+
+    def merge(self, measurements: dict[str, Timing]) -> None:
+        """Add durations measured elsewhere, e.g. in a worker process."""
+        with self._lock:
+            for rule_name, timing in measurements.items():
+                measured = self._measured.setdefault(rule_name, Timing())
+                measured.calls += timing.calls
+                measured.duration += timing.duration
+
+    def save(self) -> None:
+        """Learn the costs of rules from the measured durations, and persist them."""
+        for rule_name, timing in self.pop_measurements().items():
+            cost = timing.duration / timing.calls
+            previous_cost = self._learned.get(rule_name)
+            self._learned[rule_name] = (
+                cost
+                if previous_cost is None
+                else LEARNING_RATE * cost + (1 - LEARNING_RATE) * previous_cost
+            )
+        if self._cache:
+            self._cache.set(self._key, self._learned)
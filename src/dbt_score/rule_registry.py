@@ -12,6 +12,7 @@ from typing import Iterator, Type
 
 from dbt_score.config import Config
 from dbt_score.exceptions import DuplicatedRuleException
+from dbt_score.models import Evaluable
 from dbt_score.rule import Rule, RuleConfig
 from dbt_score.rule_filter import RuleFilter
 
@@ -26,12 +27,28 @@ class RuleRegistry:
         self.config = config
         self._rules: dict[str, Rule] = {}
         self._rule_filters: dict[str, RuleFilter] = {}
+        self._rules_by_resource_type: dict[type[Evaluable], list[Rule]] | None = None
 
     @property
     def rules(self) -> dict[str, Rule]:
         """Get all rules."""
         return self._rules
 
+    @property
+    def rules_by_resource_type(self) -> dict[type[Evaluable], list[Rule]]:
+        """Get the rules applying to each resource type, in registration order.
+
+        The table is built once, so evaluating an evaluable never involves the
+        rules of other resource types.
+        """
+        if self._rules_by_resource_type is None:
+            self._rules_by_resource_type = {}
+            for rule in self._rules.values():
+                self._rules_by_resource_type.setdefault(rule.resource_type, []).append(
+                    rule
+                )
+        return self._rules_by_resource_type
+
     @property
     def rule_filters(self) -> dict[str, RuleFilter]:
         """Get all filters."""
@@ -82,6 +99,7 @@ class RuleRegistry:
         if rule_name not in self.config.disabled_rules:
             rule_config = self.config.rules_config.get(rule_name, RuleConfig())
             self._rules[rule_name] = rule(rule_config=rule_config)
+            self._rules_by_resource_type = None
 
     def _add_filter(self, rule_filter: Type[RuleFilter]) -> None:
         """Initialize and add a filter."""
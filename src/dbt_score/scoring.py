@@ -7,6 +7,7 @@ import typing
 from dataclasses import dataclass
 
 from dbt_score.config import Config
+from dbt_score.exceptions import RuleDisabledException, RuleTimeoutException
 
 if typing.TYPE_CHECKING:
     from dbt_score.evaluation import EvaluableResultsType
@@ -26,6 +27,26 @@ class Score:
         return math.floor(self.value * 10) / 10
 
 
+@dataclass
+class ScoreAggregate:
+    """A running aggregate of the scores of evaluables, to score a project.
+
+    Only the number and the sum of scores are kept, not the scores themselves.
+    """
+
+    min_score: float
+    count: int = 0
+    total: float = 0.0
+    # Whether any evaluable has the minimum score, e.g. with a CRITICAL violation
+    min_score_reached: bool = False
+
+    def add(self, score: Score) -> None:
+        """Add the score of an evaluable."""
+        self.count += 1
+        self.total += score.value
+        self.min_score_reached |= score.value == self.min_score
+
+
 class Scorer:
     """Logic for computing scores."""
 
@@ -44,7 +65,15 @@ class Scorer:
         self._config = config
 
     def score_evaluable(self, evaluable_results: EvaluableResultsType) -> Score:
-        """Compute the score of a given evaluable."""
+        """Compute the score of a given evaluable.
+
+        Rules interrupted or disabled by the circuit breaker aren't scored.
+        """
+        evaluable_results = {
+            rule: result
+            for rule, result in evaluable_results.items()
+            if not isinstance(result, (RuleDisabledException, RuleTimeoutException))
+        }
         rule_count = len(evaluable_results)
 
         if rule_count == 0:
@@ -74,16 +103,28 @@ class Scorer:
 
         return Score(score, self._badge(score))
 
-    def score_aggregate_evaluables(self, scores: list[Score]) -> Score:
-        """Compute the score of a list of evaluables."""
-        actual_scores = [s.value for s in scores]
-        if 0.0 in actual_scores:
+    def aggregate(self) -> ScoreAggregate:
+        """Create an empty running aggregate of the scores of evaluables."""
+        return ScoreAggregate(self.min_score)
+
+    def score_aggregate_evaluables(
+        self, scores: typing.Iterable[Score] | ScoreAggregate
+    ) -> Score:
+        """Compute the score of evaluables, from their scores or their aggregate."""
+        if isinstance(scores, ScoreAggregate):
+            aggregate = scores
+        else:
+            aggregate = self.aggregate()
+            for evaluable_score in scores:
+                aggregate.add(evaluable_score)
+
+        if aggregate.min_score_reached:
             # Any evaluable with a CRITICAL violation makes the project score 0
             score = Score(self.min_score, self._badge(self.min_score))
-        elif len(actual_scores) == 0:
+        elif aggregate.count == 0:
             score = Score(self.max_score, self._badge(self.max_score))
         else:
-            average_score = sum(actual_scores) / len(actual_scores)
+            average_score = aggregate.total / aggregate.count
             score = Score(average_score, self._badge(average_score))
         return score
 
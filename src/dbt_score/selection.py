@@ -0,0 +1,319 @@
+"""Native implementation of dbt's node selection syntax.
+
+This module evaluates `--select` and `--exclude` directly against the resources of
+the manifest, without running `dbt ls`. It supports the commonly used parts of the
+grammar described in https://docs.getdbt.com/reference/node-selection/syntax:
+
+- unions (space-separated selectors) and intersections (comma-separated selectors)
+- graph operators: `+model`, `2+model`, `model+`, `model+3`, `@model`
+- the methods `fqn`, `tag`, `path`, `file`, `package`, `config`, `resource_type`,
+  `source`, `exposure`, `access`, `group` and `unique_id`, as well as the implicit
+  method when none is given
+
+Other methods, e.g. `state` or `result`, raise `UnsupportedSelectorException` so that
+callers can fall back to dbt's own implementation.
+
+Unlike dbt, the graph only contains the resources of the project itself, so graph
+operators don't traverse resources of installed packages.
+"""
+
+import re
+from collections import defaultdict, deque
+from fnmatch import fnmatch
+from pathlib import PurePosixPath
+from typing import Any, Callable, Final, Iterable, Mapping, TypeAlias
+
+SELECTOR_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\A"
+    r"(?P<childrens_parents>@)?"
+    r"(?P<parents>(?P<parents_depth>\d*)\+)?"
+    r"((?P<method>[\w.]+):)?(?P<value>.*?)"
+    r"(?P<children>\+(?P<children_depth>\d*))?"
+    r"\Z"
+)
+FILE_EXTENSIONS: Final[tuple[str, ...]] = (".sql", ".py", ".csv", ".yml", ".yaml")
+
+# A method matches a resource, given its unique id, raw values, method arguments
+# (e.g. `materialized` for `config.materialized`) and the selector value.
+MethodType: TypeAlias = Callable[[str, Mapping[str, Any], list[str], str], bool]
+
+
+class UnsupportedSelectorException(Exception):
+    """Raised when a selector can't be evaluated natively."""
+
+
+def _is_glob(value: str) -> bool:
+    return any(char in value for char in "*?[]")
+
+
+def _fqn(values: Mapping[str, Any]) -> list[str]:
+    """The fully qualified name of a resource, defaulted when missing."""
+    if fqn := values.get("fqn"):
+        return list(fqn)
+    if values.get("resource_type") == "source":
+        return [values["package_name"], values["source_name"], values["name"]]
+    return [values["package_name"], values["name"]]
+
+
+def _fqn_matches(fqn: list[str], selector: str) -> bool:
+    """Whether a fully qualified name matches a selector, like dbt does.
+
+    The name of the resource must equal the selector, unless the selector is a glob.
+    Otherwise, the selector is matched part by part, and from its first glob on,
+    against the rest of the name.
+    """
+    if fqn[-1] == selector or (_is_glob(selector) and fnmatch(fqn[-1], selector)):
+        return True
+
+    # Dots in names act as namespace separators
+    flat_fqn = [part for segment in fqn for part in segment.split(".")]
+    selector_parts = selector.split(".")
+    if len(flat_fqn) < len(selector_parts):
+        return False
+
+    for i, selector_part in enumerate(selector_parts):
+        if _is_glob(selector_part):
+            return fnmatch(".".join(flat_fqn[i:]), ".".join(selector_parts[i:]))
+        if flat_fqn[i] != selector_part:
+            return False
+    return True
+
+
+def _match_fqn(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    if values.get("resource_type") == "macro":
+        # dbt doesn't select macros, they can only be selected by name
+        return bool(values["name"] == selector)
+    fqn = _fqn(values)
+    # The fqn can be matched with or without the package name
+    return _fqn_matches(fqn, selector) or (
+        len(fqn) > 1 and _fqn_matches(fqn[1:], selector)
+    )
+
+
+def _match_tag(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    return any(fnmatch(tag, selector) for tag in values.get("tags", []))
+
+
+def _match_path(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    path = PurePosixPath(values.get("original_file_path", "").replace("\\", "/"))
+    selector = selector.replace("\\", "/").rstrip("/")
+    if _is_glob(selector):
+        return fnmatch(str(path), selector)
+    selector_path = PurePosixPath(selector)
+    return path == selector_path or selector_path in path.parents
+
+
+def _match_file(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    path = PurePosixPath(values.get("original_file_path", "").replace("\\", "/"))
+    return fnmatch(path.name, selector) or fnmatch(path.stem, selector)
+
+
+def _match_package(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    return fnmatch(values.get("package_name", ""), selector)
+
+
+def _match_config(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    value: Any = values.get("config", {})
+    for key in args:
+        if not isinstance(value, Mapping) or key not in value:
+            return False
+        value = value[key]
+
+    if isinstance(value, list):
+        return any(str(item) == selector for item in value)
+    if isinstance(value, bool):
+        return str(value).lower() == selector.lower()
+    return value is not None and str(value) == selector
+
+
+def _match_resource_type(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    return bool(values.get("resource_type") == selector)
+
+
+def _match_source(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    if values.get("resource_type") != "source":
+        return False
+    target = [values["package_name"], values["source_name"], values["name"]]
+    parts = selector.split(".")
+    if len(parts) > len(target):
+        return False
+    # `source_name`, `source_name.table_name` or `package.source_name.table_name`
+    offset = 0 if len(parts) == len(target) else 1
+    return all(fnmatch(target[offset + i], part) for i, part in enumerate(parts))
+
+
+def _match_exposure(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    if values.get("resource_type") != "exposure":
+        return False
+    parts = selector.split(".")
+    if len(parts) == 2:  # noqa: PLR2004 [magic-value-comparison]
+        return fnmatch(values["package_name"], parts[0]) and fnmatch(
+            values["name"], parts[1]
+        )
+    return fnmatch(values["name"], selector)
+
+
+def _match_access(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    return bool(values.get("access") == selector)
+
+
+def _match_group(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    group = values.get("group") or values.get("config", {}).get("group")
+    return group is not None and fnmatch(group, selector)
+
+
+def _match_unique_id(
+    unique_id: str, values: Mapping[str, Any], args: list[str], selector: str
+) -> bool:
+    return fnmatch(unique_id, selector)
+
+
+METHODS: Final[dict[str, MethodType]] = {
+    "fqn": _match_fqn,
+    "tag": _match_tag,
+    "path": _match_path,
+    "file": _match_file,
+    "package": _match_package,
+    "config": _match_config,
+    "resource_type": _match_resource_type,
+    "source": _match_source,
+    "exposure": _match_exposure,
+    "access": _match_access,
+    "group": _match_group,
+    "unique_id": _match_unique_id,
+}
+
+
+def _default_method(value: str) -> str:
+    """The method used when a selector doesn't specify one."""
+    if "/" in value or "\\" in value:
+        return "path"
+    if value.lower().endswith(FILE_EXTENSIONS):
+        return "file"
+    return "fqn"
+
+
+class NodeSelector:
+    """Select resources of a manifest using dbt's selection syntax."""
+
+    def __init__(self, resources: Mapping[str, Mapping[str, Any]]) -> None:
+        """Instantiate a selector.
+
+        Args:
+            resources: The raw values of the selectable resources, by unique id.
+        """
+        self._resources = resources
+        self._parents: dict[str, list[str]] = defaultdict(list)
+        self._children: dict[str, list[str]] = defaultdict(list)
+        for unique_id, values in resources.items():
+            for parent_id in values.get("depends_on", {}).get("nodes", []):
+                if parent_id in resources:
+                    self._parents[unique_id].append(parent_id)
+                    self._children[parent_id].append(unique_id)
+
+    def select(
+        self, select: Iterable[str] | None, exclude: Iterable[str] | None = None
+    ) -> set[str]:
+        """Get the unique ids of the selected resources.
+
+        Args:
+            select: The selection, all resources are selected when empty.
+            exclude: The exclusion.
+
+        Raises:
+            UnsupportedSelectorException: A selector can't be evaluated natively.
+        """
+        selected = self._union(select) if select else set(self._resources)
+        if exclude:
+            selected -= self._union(exclude)
+        return selected
+
+    def _union(self, selectors: Iterable[str]) -> set[str]:
+        """Evaluate space-separated selectors."""
+        selected: set[str] = set()
+        for selector in selectors:
+            for token in selector.split():
+                selected |= self._intersection(token)
+        return selected
+
+    def _intersection(self, token: str) -> set[str]:
+        """Evaluate comma-separated selectors."""
+        parts = [self._evaluate(part) for part in token.split(",") if part]
+        return set.intersection(*parts) if parts else set()
+
+    def _evaluate(self, selector: str) -> set[str]:
+        """Evaluate a single selector, including its graph operators."""
+        match = SELECTOR_PATTERN.match(selector)
+        if not match or not match["value"]:
+            raise UnsupportedSelectorException(f"Invalid selector: {selector}.")
+
+        method_name, *args = (match["method"] or _default_method(match["value"])).split(
+            "."
+        )
+        method = METHODS.get(method_name)
+        if method is None:
+            raise UnsupportedSelectorException(
+                f"Selector method `{method_name}` is not supported natively."
+            )
+
+        value = match["value"]
+        selected = {
+            unique_id
+            for unique_id, values in self._resources.items()
+            # dbt doesn't select macros, they can only be selected by name
+            if (method is _match_fqn or values.get("resource_type") != "macro")
+            and method(unique_id, values, args, value)
+        }
+
+        result = set(selected)
+        if match["childrens_parents"]:
+            descendants = self._traverse(selected, self._children, None)
+            result |= descendants | self._traverse(
+                selected | descendants, self._parents, None
+            )
+        if match["parents"]:
+            depth = int(match["parents_depth"]) if match["parents_depth"] else None
+            result |= self._traverse(selected, self._parents, depth)
+        if match["children"]:
+            depth = int(match["children_depth"]) if match["children_depth"] else None
+            result |= self._traverse(selected, self._children, depth)
+        return result
+
+    @staticmethod
+    def _traverse(
+        start: set[str], edges: Mapping[str, list[str]], depth: int | None
+    ) -> set[str]:
+        """Get the resources reachable from `start`, up to a depth if provided."""
+        visited: set[str] = set()
+        queue = deque((unique_id, 0) for unique_id in start)
+        while queue:
+            unique_id, distance = queue.popleft()
+            if depth is not None and distance >= depth:
+                continue
+            for neighbour in edges.get(unique_id, []):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    queue.append((neighbour, distance + 1))
+        return visited
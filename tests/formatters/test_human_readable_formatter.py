@@ -215,3 +215,23 @@ def test_human_readable_formatter_low_project_score_high_model_score(
     Error: project score too low, fail_project_under = 5.0
     """
     assert stdout == dedent(expected)
+
+
+def test_human_readable_formatter_disabled_rules(
+    capsys, default_config, manifest_loader, rule_severity_low
+):
+    """Ensure the formatter reports disabled rules."""
+    formatter = HumanReadableFormatter(
+        manifest_loader=manifest_loader, config=default_config
+    )
+    formatter.rules_disabled({rule_severity_low: "it was too slow"})
+    formatter.project_evaluated(Score(10.0, "🥇"))
+    stdout = capsys.readouterr().out
+
+    expected = """\
+    Disabled rules:
+        \x1b[1;31mERR \x1b[0m tests.conftest.rule_severity_low: it was too slow
+
+    Project score: \x1b[1m10.0\x1b[0m 🥇
+    """
+    assert stdout == dedent(expected)
@@ -135,3 +135,17 @@ def test_json_formatter_name_collision_prevention(
     assert exposure_data["type"] == "exposure"
     assert exposure_data["score"] == 7.0
     assert exposure_data["badge"] == "🥇"
+
+
+def test_json_formatter_compact(
+    capsys, default_config, manifest_loader, model1, rule_severity_low
+):
+    """Ensure the output is on a single line in compact mode."""
+    default_config.overload({"compact_output": True})
+    formatter = JSONFormatter(manifest_loader=manifest_loader, config=default_config)
+    formatter.evaluable_evaluated(model1, {rule_severity_low: None}, Score(10.0, "🥇"))
+    formatter.project_evaluated(Score(10.0, "🥇"))
+
+    stdout = capsys.readouterr().out
+    assert stdout.count("\n") == 1
+    assert json.loads(stdout)["project"]["score"] == 10.0
@@ -87,3 +87,20 @@ def test_manifest_formatter_project(
         new_manifest["sources"]["source.package.my_source.table2"]["meta"]["badge"]
         == "🥇"
     )
+
+
+def test_manifest_formatter_missing_evaluable(
+    capsys, caplog, default_config, manifest_loader, model1, model2
+):
+    """Evaluables missing from the manifest are skipped, with a warning."""
+    formatter = ManifestFormatter(
+        manifest_loader=manifest_loader, config=default_config
+    )
+    model2.unique_id = "model.package.missing"
+    formatter.evaluable_evaluated(model1, {}, Score(10.0, "🥇"))
+    formatter.evaluable_evaluated(model2, {}, Score(10.0, "🥇"))
+    formatter.project_evaluated(Score(10.0, "🥇"))
+
+    new_manifest = json.loads(capsys.readouterr().out)
+    assert new_manifest["nodes"]["model.package.model1"]["meta"]["score"] == 10.0
+    assert "model.package.missing isn't in the manifest" in caplog.text
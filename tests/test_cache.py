@@ -0,0 +1,72 @@
+"""Test the on-disk cache."""
+
+import os
+
+from dbt_score.cache import DiskCache, file_digest, make_key
+
+
+def test_disk_cache_get_set(tmp_path):
+    """Values are persisted between cache instances."""
+    DiskCache(tmp_path).set("key", {"a": [1, 2]})
+
+    assert DiskCache(tmp_path).get("key") == {"a": [1, 2]}
+    assert DiskCache(tmp_path).get("other_key") is None
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    """The least recently used entries are evicted first."""
+    cache = DiskCache(tmp_path, max_size=10_000)
+    for i, key in enumerate(["a", "b"]):
+        cache.set(key, "x" * 4_000)
+        os.utime(tmp_path / f"{key}.pickle", ns=(i * 10**9, i * 10**9))
+    # Reading `a` makes it the most recently used entry
+    assert cache.get("a") is not None
+
+    cache.set("c", "x" * 4_000)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_disk_cache_keep_new_entry(tmp_path):
+    """An entry larger than the cap is kept, while older entries are evicted."""
+    cache = DiskCache(tmp_path, max_size=1_000)
+    cache.set("a", "x" * 100)
+    cache.set("b", "x" * 4_000)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+
+
+def test_disk_cache_unreadable_entry(tmp_path):
+    """A corrupted entry is a cache miss."""
+    (tmp_path / "key.pickle").write_bytes(b"not a pickle")
+
+    assert DiskCache(tmp_path).get("key") is None
+
+
+def test_disk_cache_clear(tmp_path):
+    """All entries are removed."""
+    cache = DiskCache(tmp_path)
+    cache.set("key", 1)
+    cache.clear()
+
+    assert cache.get("key") is None
+
+
+def test_make_key():
+    """Keys are stable and depend on all parts."""
+    assert make_key("a", 1) == make_key("a", 1)
+    assert make_key("a", 1) != make_key("a", 2)
+    assert make_key("a1") != make_key("a", 1)
+
+
+def test_file_digest(tmp_path):
+    """The digest depends on the file content only."""
+    (tmp_path / "a").write_text("content")
+    (tmp_path / "b").write_text("content")
+    (tmp_path / "c").write_text("other content")
+
+    assert file_digest(tmp_path / "a") == file_digest(tmp_path / "b")
+    assert file_digest(tmp_path / "a") != file_digest(tmp_path / "c")
@@ -0,0 +1,165 @@
+"""Test the circuit breaker of rules."""
+
+import pickle
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from dbt_score.circuit_breaker import CircuitBreaker
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.exceptions import RuleDisabledException, RuleTimeoutException
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.rule import Rule, RuleConfig, RuleViolation, rule
+from dbt_score.rule_registry import RuleRegistry
+
+
+def _evaluation(manifest_path, rules, **options):
+    """Evaluate rules with the given configuration."""
+    config = Config()
+    config.overload(options)
+    rule_registry = RuleRegistry(config)
+    for rule_class in rules:
+        rule_registry._add_rule(rule_class)
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=ManifestLoader(manifest_path),
+        formatter=Mock(),
+        scorer=Mock(),
+        config=config,
+    )
+    evaluation.evaluate()
+    return evaluation
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_circuit_breaker_failures(manifest_path, rule_error, rule_severity_low, jobs):
+    """A rule failing on consecutive evaluables is disabled."""
+    evaluation = _evaluation(
+        manifest_path, [rule_error, rule_severity_low], max_rule_failures=1, jobs=jobs
+    )
+    results = [
+        evaluable_results
+        for evaluable, evaluable_results in evaluation.results.items()
+        if isinstance(evaluable, Model)
+    ]
+
+    assert not isinstance(results[0][rule_error], RuleDisabledException)
+    assert results[0][rule_error].__traceback__ is None
+    disabled = [
+        evaluable_results[rule_error]
+        for evaluable_results in results
+        if isinstance(evaluable_results[rule_error], RuleDisabledException)
+    ]
+    assert disabled
+    assert str(disabled[0]) == (
+        f"Rule {rule_error.source()} was disabled: "
+        "it failed on 1 consecutive evaluables."
+    )
+    assert all(result is disabled[0] for result in disabled)
+    assert not any(
+        isinstance(evaluable_results[rule_severity_low], Exception)
+        for evaluable_results in results
+    )
+    assert evaluation.disabled_rules == {
+        rule_error: "it failed on 1 consecutive evaluables"
+    }
+    evaluation._formatter.rules_disabled.assert_called_once_with(
+        evaluation.disabled_rules
+    )
+
+
+def test_circuit_breaker_budget(manifest_path):
+    """A rule exceeding its budget is interrupted, then disabled."""
+
+    @rule
+    def slow_rule(model: Model) -> RuleViolation | None:
+        """Slow rule."""
+        time.sleep(10)
+
+    config = RuleConfig.from_dict({"rule_budget": 0.05})
+    assert config.budget == 0.05
+    assert not config.config
+
+    start = time.perf_counter()
+    # Timeouts aren't counted as failures
+    evaluation = _evaluation(
+        manifest_path,
+        [slow_rule],
+        rules_config={slow_rule.source(): config},
+        max_rule_failures=1,
+    )
+    assert time.perf_counter() - start < 5
+
+    results = [
+        evaluable_results[slow_rule]
+        for evaluable, evaluable_results in evaluation.results.items()
+        if isinstance(evaluable, Model)
+    ]
+    assert isinstance(results[0], RuleTimeoutException)
+    assert all(isinstance(result, RuleDisabledException) for result in results[1:])
+    assert evaluation.disabled_rules == {
+        slow_rule: "it exceeded its time budget of 0.05s"
+    }
+
+
+def test_circuit_breaker_budget_not_swallowed(model1):
+    """A rule catching every exception is still interrupted."""
+
+    @rule
+    def stubborn_rule(model: Model) -> RuleViolation | None:
+        """Stubborn rule."""
+        deadline = time.perf_counter() + 5
+        while time.perf_counter() < deadline:
+            try:
+                time.sleep(0.01)
+            except Exception:
+                pass
+
+    circuit_breaker = CircuitBreaker([stubborn_rule()], rule_budget=0.05)
+    start = time.perf_counter()
+    with pytest.raises(RuleTimeoutException):
+        circuit_breaker.evaluate(
+            stubborn_rule(), lambda: stubborn_rule().evaluate(model1)
+        )
+    assert time.perf_counter() - start < 4
+
+
+def test_rule_budget_config():
+    """The budget of a rule class is kept unless configured."""
+
+    class BudgetRule(Rule):
+        description = "Rule with a budget."
+        budget = 1.0
+
+        def evaluate(self, model: Model) -> RuleViolation | None:  # type: ignore[override]
+            """Evaluate model."""
+
+    assert BudgetRule(RuleConfig.from_dict({})).budget == 1.0
+    assert BudgetRule(RuleConfig.from_dict({"rule_budget": 2.0})).budget == 2.0
+
+    # Rules can still have a parameter named `budget`
+    @rule
+    def budget_param_rule(model: Model, budget: int = 1) -> RuleViolation | None:
+        """Rule with a budget parameter."""
+
+    budget_rule = budget_param_rule(RuleConfig.from_dict({"budget": 2}))
+    assert budget_rule.config == {"budget": 2}
+    assert budget_rule.budget is None
+
+
+def test_circuit_breaker_max_duration(decorator_rule, model1):
+    """All rules are disabled once the maximum duration is exceeded."""
+    circuit_breaker = CircuitBreaker([decorator_rule()], max_duration=0.01)
+    assert circuit_breaker.evaluate(decorator_rule(), lambda: None) is None
+
+    time.sleep(0.02)
+    result = circuit_breaker.evaluate(decorator_rule(), Mock())
+    assert isinstance(result, RuleDisabledException)
+    assert circuit_breaker.disabled_rules == {
+        decorator_rule.source(): "the evaluation exceeded its maximum duration of 0.01s"
+    }
+
+    # Results are sent back by worker processes
+    assert str(pickle.loads(pickle.dumps(result))) == str(result)
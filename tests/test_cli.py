@@ -1,7 +1,10 @@
 """Test the CLI."""
 
+import json
+import pstats
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from dbt_score.cli import lint
@@ -137,6 +140,7 @@ def test_lint_fail_thresholds_zero(manifest_path):
     mock_eval = MagicMock()
     mock_eval.project_score = Score(0.0, "🚧")
     mock_eval.scores = {MagicMock(): Score(0.0, "🚧")}
+    mock_eval.incomplete = False
 
     with (
         patch("dbt_score.cli.lint_dbt_project") as mock_lint,
@@ -157,3 +161,151 @@ def test_lint_fail_thresholds_zero(manifest_path):
         )
     # With thresholds at 0 and scores at 0, nothing is strictly under -> pass.
     assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    "args,write_json", [(["-p"], True), (["-p", "--no-write-json"], False)]
+)
+def test_lint_dbt_parse_in_memory(manifest_path, args, write_json):
+    """Test lint with the manifest parsed by dbt in memory, and written if needed."""
+    runner = CliRunner()
+
+    with (
+        patch("dbt_score.cli.Config._load_toml_file"),
+        patch("dbt_score.cli.dbt_parse") as mock_dbt_parse,
+        patch("dbt_score.cli.lint_dbt_project") as mock_lint_dbt_project,
+    ):
+        mock_lint_dbt_project.return_value.project_score = Score(10, "🥇")
+        mock_lint_dbt_project.return_value.scores = {}
+        mock_lint_dbt_project.return_value.incomplete = False
+        result = runner.invoke(lint, args, catch_exceptions=False)
+
+    assert result.exit_code == 0
+    mock_dbt_parse.assert_called_once_with(write_json=write_json)
+    assert (
+        mock_lint_dbt_project.call_args.kwargs["dbt_manifest"]
+        is mock_dbt_parse.return_value.result
+    )
+
+
+def test_lint_profile(manifest_path, tmp_path):
+    """Test lint with a profile written as JSON."""
+    runner = CliRunner()
+    profile_path = tmp_path / "profile.json"
+
+    with patch("dbt_score.cli.Config._load_toml_file"):
+        result = runner.invoke(
+            lint,
+            [
+                "--manifest",
+                manifest_path,
+                "--no-cache",
+                "--profile-output",
+                profile_path,
+            ],
+            catch_exceptions=False,
+        )
+
+    assert "Phases:" in result.stderr
+    assert "Phases:" not in result.stdout
+    profile = json.loads(profile_path.read_text())
+    assert [phase["name"] for phase in profile["phases"]] == [
+        "load",
+        "select",
+        "registry",
+        "evaluate",
+        "score",
+        "format",
+    ]
+    assert profile["rules"]
+    assert profile["slowest_pairs"]
+
+
+def test_lint_cprofile(manifest_path, tmp_path):
+    """Test lint with a cProfile statistics file."""
+    runner = CliRunner()
+    stats_path = tmp_path / "lint.prof"
+
+    with patch("dbt_score.cli.Config._load_toml_file"):
+        runner.invoke(
+            lint,
+            ["--manifest", manifest_path, "--cprofile", stats_path],
+            catch_exceptions=False,
+        )
+
+    stats = pstats.Stats(str(stats_path))
+    assert any(
+        function == "lint_dbt_project"
+        for _, _, function in stats.stats  # type: ignore[attr-defined]
+    )
+
+
+def test_lint_cprofile_and_collapsed_stacks(manifest_path, tmp_path):
+    """Test that cProfile and collapsed stacks can't be combined."""
+    runner = CliRunner()
+    with patch("dbt_score.cli.Config._load_toml_file"):
+        result = runner.invoke(
+            lint,
+            [
+                "--cprofile",
+                tmp_path / "lint.prof",
+                "--collapsed-stacks",
+                tmp_path / "stacks.txt",
+            ],
+        )
+    assert result.exit_code == 2
+
+
+def test_lint_fail_fast(manifest_path):
+    """Test lint stopping as soon as it fails."""
+    runner = CliRunner()
+    with patch("dbt_score.cli.Config._load_toml_file"):
+        result = runner.invoke(
+            lint,
+            [
+                "--manifest",
+                manifest_path,
+                "--no-cache",
+                "--fail-fast",
+                "--fail-any-item-under",
+                "10.0",
+            ],
+        )
+
+    assert result.exit_code == 1
+    assert "Linting stopped after 1 items" in result.stderr
+    assert "model2" not in result.stdout
+
+
+def test_lint_rules_interrupted(manifest_path):
+    """Linting fails when rules are interrupted or disabled, which aren't scored."""
+    runner = CliRunner()
+    with patch("dbt_score.cli.Config._load_toml_file"):
+        result = runner.invoke(
+            lint,
+            [
+                "--manifest",
+                manifest_path,
+                "--no-cache",
+                "--format",
+                "json",
+                "--rule-budget",
+                "1e-7",
+                "--max-rule-failures",
+                "1",
+                "--fail-project-under",
+                "0",
+                "--fail-any-item-under",
+                "0",
+            ],
+        )
+
+    assert result.exit_code == 1
+    assert "Linting is incomplete" in result.stderr
+    report = json.loads(result.stdout)
+    assert report["disabled_rules"]
+    # Results of interrupted or disabled rules aren't scored as passes, they're
+    # not scored at all
+    evaluable = report["evaluables"]["model.package.model1"]
+    assert {result["result"] for result in evaluable["results"].values()} == {"ERR"}
+    assert evaluable["score"] == 10.0
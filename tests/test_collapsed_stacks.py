@@ -0,0 +1,47 @@
+"""Test the collapsed stack profiler."""
+
+from dbt_score.collapsed_stacks import ROOT, CollapsedStackProfiler
+from dbt_score.models import Model
+from dbt_score.rule import Rule, RuleViolation, rule
+
+
+def _busy() -> int:
+    """Spend some time."""
+    return sum(range(10_000))
+
+
+def test_collapsed_stacks_grouped_by_rule(model1, tmp_path):
+    """Stacks of rule evaluations start with the rule."""
+
+    @rule
+    def decorated_rule(model: Model) -> RuleViolation | None:
+        """Decorated rule."""
+        _busy()
+
+    class ClassRule(Rule):
+        description = "Class rule."
+
+        def evaluate(self, model: Model) -> RuleViolation | None:  # type: ignore[override]
+            _busy()
+            return None
+
+    profiler = CollapsedStackProfiler()
+    with profiler.profiling():
+        decorated_rule().evaluate(model1)
+        ClassRule().evaluate(model1)
+        _busy()
+
+    roots = {stack.split(";")[0] for stack in profiler.stacks}
+    assert decorated_rule.source() in roots
+    assert ClassRule.source() in roots
+    assert ROOT in roots
+    assert any(
+        stack.startswith(ClassRule.source()) and "_busy" in stack
+        for stack in profiler.stacks
+    )
+
+    output_path = tmp_path / "stacks.txt"
+    profiler.write(output_path)
+    for line in output_path.read_text().splitlines():
+        _, duration = line.rsplit(" ", 1)
+        assert int(duration) > 0
@@ -0,0 +1,73 @@
+"""Test the DAG index."""
+
+from dbt_score.dag import DagIndex, GraphMetrics
+from dbt_score.models import ManifestLoader
+
+
+def test_dag_metrics_diamond():
+    """Shared descendants and ancestors are counted once."""
+    dag = DagIndex(
+        {
+            "source.s": "source",
+            "model.a": "model",
+            "model.b": "model",
+            "model.c": "model",
+            "model.d": "model",
+            "exposure.e": "exposure",
+        },
+        {
+            "model.a": ["source.s"],
+            "model.b": ["model.a"],
+            "model.c": ["model.a"],
+            "model.d": ["model.b", "model.c"],
+            "exposure.e": ["model.d"],
+        },
+    )
+    assert len(dag) == 6
+    assert dag.metrics("source.s") == GraphMetrics(
+        downstream_count=4,
+        upstream_count=0,
+        depth=0,
+        fan_in=0,
+        fan_out=1,
+        exposure_distance=4,
+    )
+    assert dag.metrics("model.d") == GraphMetrics(
+        downstream_count=0,
+        upstream_count=4,
+        depth=3,
+        fan_in=2,
+        fan_out=1,
+        exposure_distance=1,
+    )
+    assert dag.metrics("exposure.e").exposure_distance is None
+
+
+def test_dag_unknown_and_duplicate_parents():
+    """Parents outside of the index are ignored, duplicates are counted once."""
+    dag = DagIndex(
+        {"model.a": "model", "model.b": "model"},
+        {"model.b": ["model.a", "model.a", "macro.m"], "model.unknown": ["model.a"]},
+    )
+    assert "model.unknown" not in dag
+    assert dag.metrics("model.a").fan_out == 1
+    assert dag.metrics("model.b").fan_in == 1
+
+
+def test_dag_cycle():
+    """Cycles don't prevent metrics from being computed."""
+    dag = DagIndex(
+        {"model.a": "model", "model.b": "model"},
+        {"model.a": ["model.b"], "model.b": ["model.a"]},
+    )
+    assert dag.metrics("model.a").fan_in == 1
+
+
+def test_manifest_loader_dag(manifest_path):
+    """The loader indexes the DAG, regardless of the selection."""
+    manifest_loader = ManifestLoader(manifest_path, select=["model2"])
+    model2 = manifest_loader.models["model.package.model2"]
+    assert model2._dag is manifest_loader.dag
+    assert "model.package.model1" in manifest_loader.dag
+    assert model2.downstream_count == 2
+    assert model2.graph_metrics.upstream_count == 1
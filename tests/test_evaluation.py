@@ -1,13 +1,20 @@
 """Unit tests for the evaluation module."""
 
+import asyncio
+import threading
+from typing import Any, Mapping, Sequence
 from unittest.mock import Mock
 
+import pytest
+
 from dbt_score.config import Config
-from dbt_score.evaluation import Evaluation
-from dbt_score.models import ManifestLoader
-from dbt_score.rule import RuleViolation
+from dbt_score.evaluation import Evaluation, EvaluationStats
+from dbt_score.exceptions import RuleFailedException, RuleTimeoutException
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.rule import RuleViolation, rule
+from dbt_score.rule_filter import rule_filter
 from dbt_score.rule_registry import RuleRegistry
-from dbt_score.scoring import Score
+from dbt_score.scoring import Score, Scorer
 
 
 def test_evaluation_low_medium_high(
@@ -385,3 +392,308 @@ def test_evaluation_with_models_and_sources(
     assert decorator_rule not in evaluation.results[exposure1]
     assert decorator_rule_source not in evaluation.results[exposure1]
     assert decorator_rule_snapshot not in evaluation.results[exposure1]
+
+
+def _evaluated(manifest_path, rules, **options):
+    """The evaluables and results passed to the formatter, in order."""
+    config = Config()
+    config.overload(options)
+    rule_registry = RuleRegistry(config)
+    for rule_class in rules:
+        rule_registry._add_rule(rule_class)
+
+    mock_formatter = Mock()
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=ManifestLoader(manifest_path),
+        formatter=mock_formatter,
+        scorer=Mock(),
+        config=config,
+    )
+    evaluation.evaluate()
+    return [
+        (call.args[0].unique_id, call.args[1])
+        for call in mock_formatter.evaluable_evaluated.call_args_list
+    ]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+def test_evaluation_parallel(
+    manifest_path,
+    rule_severity_low,
+    rule_severity_high,
+    rule_error,
+    decorator_rule_source,
+    executor,
+):
+    """Rules evaluated in parallel have the same results, in the same order."""
+    rules = [rule_severity_low, rule_severity_high, rule_error, decorator_rule_source]
+    serial = _evaluated(manifest_path, rules)
+    parallel = _evaluated(manifest_path, rules, jobs=2, executor=executor)
+
+    assert [unique_id for unique_id, _ in parallel] == [
+        unique_id for unique_id, _ in serial
+    ]
+    for (_, serial_results), (_, parallel_results) in zip(
+        serial, parallel, strict=True
+    ):
+        assert list(parallel_results) == list(serial_results)
+        for rule_class, result in parallel_results.items():
+            if isinstance(result, Exception):
+                assert str(result) == str(serial_results[rule_class])
+            else:
+                assert result == serial_results[rule_class]
+
+    assert isinstance(dict(parallel)["model.package.model2"][rule_error], Exception)
+
+
+class _UnpicklableError(Exception):
+    """An exception which pickles, but can't be unpickled."""
+
+    def __init__(self, code: int, reason: str):
+        super().__init__(f"Error {code}: {reason}")
+
+
+def test_evaluation_parallel_unpicklable_exception(manifest_path):
+    """Exceptions which can't be unpickled are sent back as their type and message."""
+
+    @rule
+    def failing_rule(model: Model) -> RuleViolation | None:
+        """Rule raising an exception which can't be unpickled."""
+        raise _UnpicklableError(42, "unexpected")
+
+    evaluated: list[list[tuple[str, Any]]] = []
+    # The evaluation hung when results couldn't be unpickled
+    thread = threading.Thread(
+        target=lambda: evaluated.append(
+            _evaluated(manifest_path, [failing_rule], jobs=2)
+        ),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive()
+    results = dict(evaluated[0])["model.package.model1"]
+    assert isinstance(results[failing_rule], RuleFailedException)
+    assert results[failing_rule].type_name == "_UnpicklableError"
+    assert str(results[failing_rule]) == "Error 42: unexpected"
+
+
+def test_evaluation_stats(
+    manifest_path, model_rule_with_filter, decorator_rule_source, default_config
+):
+    """Rules of other resource types are skipped, and filtered rules counted."""
+    manifest_loader = ManifestLoader(manifest_path)
+    rule_registry = RuleRegistry(default_config)
+    rule_registry._add_rule(model_rule_with_filter)
+    rule_registry._add_rule(decorator_rule_source)
+
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=manifest_loader,
+        formatter=Mock(),
+        scorer=Mock(),
+        config=default_config,
+    )
+    evaluation.evaluate()
+
+    evaluables = len(manifest_loader.evaluables)
+    models = len(manifest_loader.models)
+    sources = len(manifest_loader.sources)
+    assert evaluation.stats == EvaluationStats(
+        pairs=2 * evaluables,
+        skipped=2 * evaluables - models - sources,
+        filtered=1,  # model1
+        evaluated=models + sources - 1,
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_evaluation_batch_rule(manifest_path, rule_severity_low, jobs):
+    """Batch rules are evaluated once, and their results scattered in rule order."""
+    batches = []
+
+    @rule_filter
+    def skip_model1(model: Model) -> bool:
+        """Skips model1."""
+        return model.name != "model1"
+
+    @rule(batch=True, rule_filters={skip_model1()})
+    def unique_descriptions(
+        models: Sequence[Model],
+    ) -> Mapping[Model, RuleViolation | None]:
+        """Descriptions must be unique."""
+        batches.append([model.name for model in models])
+        return {
+            model: RuleViolation("Duplicated description.")
+            for model in models
+            if model.name == "model2"
+        }
+
+    results = dict(
+        _evaluated(manifest_path, [unique_descriptions, rule_severity_low], jobs=jobs)
+    )
+
+    assert batches == [["model2", "collision_test"]]
+    assert results["model.package.model1"] == {rule_severity_low: None}
+    assert list(results["model.package.model2"]) == [
+        unique_descriptions,
+        rule_severity_low,
+    ]
+    assert results["model.package.model2"][unique_descriptions] == RuleViolation(
+        "Duplicated description."
+    )
+    assert results["model.package.collision_test"][unique_descriptions] is None
+
+
+def test_evaluation_async_rules(manifest_path, rule_severity_low, rule_error):
+    """Async rules are evaluated concurrently, with the same results as sync rules."""
+    running = []
+    max_running = 0
+
+    @rule
+    async def async_rule(model: Model) -> RuleViolation | None:
+        """Async rule."""
+        nonlocal max_running
+        running.append(model)
+        max_running = max(max_running, len(running))
+        await asyncio.sleep(0.01)
+        running.remove(model)
+        if model.name == "model2":
+            return RuleViolation("Model2 is a violation.")
+        return None
+
+    @rule
+    def sync_rule(model: Model) -> RuleViolation | None:
+        """Sync rule."""
+        if model.name == "model2":
+            return RuleViolation("Model2 is a violation.")
+        return None
+
+    assert async_rule.asynchronous
+    assert not sync_rule.asynchronous
+
+    async_results = _evaluated(
+        manifest_path,
+        [rule_severity_low, async_rule, rule_error],
+        async_concurrency=2,
+    )
+    sync_results = _evaluated(manifest_path, [rule_severity_low, sync_rule, rule_error])
+
+    assert max_running == 2
+    assert [unique_id for unique_id, _ in async_results] == [
+        unique_id for unique_id, _ in sync_results
+    ]
+    for (_, results), (_, expected_results) in zip(
+        async_results, sync_results, strict=True
+    ):
+        assert [
+            rule_class.__name__ if rule_class.__name__ != "async_rule" else "sync_rule"
+            for rule_class in results
+        ] == [rule_class.__name__ for rule_class in expected_results]
+        assert results.get(async_rule) == expected_results.get(sync_rule)
+
+
+def test_evaluation_async_rules_running_loop(manifest_path):
+    """Async rules are evaluated when an event loop is already running."""
+
+    @rule
+    async def async_rule(model: Model) -> RuleViolation | None:
+        """Async rule."""
+        await asyncio.sleep(0)
+        return RuleViolation("Async violation.")
+
+    async def main() -> Any:
+        return _evaluated(manifest_path, [async_rule])
+
+    results = dict(asyncio.run(main()))
+
+    assert results["model.package.model1"][async_rule] == RuleViolation(
+        "Async violation."
+    )
+
+
+def test_evaluation_async_rule_timeout(manifest_path):
+    """Async rules exceeding the timeout are interrupted."""
+
+    @rule
+    async def slow_rule(model: Model) -> RuleViolation | None:
+        """Slow rule."""
+        await asyncio.sleep(10)
+
+    results = dict(_evaluated(manifest_path, [slow_rule], async_timeout=0.01))
+
+    assert isinstance(results["model.package.model1"][slow_rule], RuleTimeoutException)
+
+
+@pytest.mark.parametrize(
+    "options,evaluated_count",
+    [
+        # Linting can't fail
+        ({"fail_any_item_under": 0.0, "fail_project_under": 0.0}, None),
+        # model2 is under the threshold
+        ({"fail_any_item_under": 10.0, "fail_project_under": 0.0}, 2),
+        # model2 has a CRITICAL violation, making the project score 0
+        ({"fail_any_item_under": 0.0, "fail_project_under": 1.0}, 2),
+    ],
+)
+def test_evaluation_fail_fast(
+    manifest_path, rule_severity_low, rule_severity_critical, options, evaluated_count
+):
+    """Evaluation stops as soon as linting fails anyway."""
+    config = Config()
+    config.overload({"fail_fast": True, **options})
+    rule_registry = RuleRegistry(config)
+    rule_registry._add_rule(rule_severity_low)
+    rule_registry._add_rule(rule_severity_critical)
+    manifest_loader = ManifestLoader(manifest_path)
+
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=manifest_loader,
+        formatter=Mock(),
+        scorer=Scorer(config),
+        config=config,
+    )
+    evaluation.evaluate()
+
+    evaluable_count = len(manifest_loader.evaluables)
+    assert evaluation.stopped_early == (evaluated_count is not None)
+    assert len(evaluation.scores) == (evaluated_count or evaluable_count)
+    assert evaluation._formatter.evaluable_evaluated.call_count == len(  # type: ignore[attr-defined]
+        evaluation.scores
+    )
+    evaluation._formatter.project_evaluated.assert_called_once()  # type: ignore[attr-defined]
+
+
+def test_evaluation_iter_evaluate(
+    manifest_path, rule_severity_low, rule_severity_critical
+):
+    """Results are streamed one evaluable at a time, without being kept."""
+    config = Config()
+    rule_registry = RuleRegistry(config)
+    rule_registry._add_rule(rule_severity_low)
+    rule_registry._add_rule(rule_severity_critical)
+    manifest_loader = ManifestLoader(manifest_path)
+
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=manifest_loader,
+        formatter=Mock(),
+        scorer=Scorer(config),
+        config=config,
+    )
+    streamed = list(evaluation.iter_evaluate())
+
+    assert [evaluable for evaluable, _, _ in streamed] == manifest_loader.evaluables
+    model2 = manifest_loader.models["model.package.model2"]
+    results, score = next((r, s) for e, r, s in streamed if e is model2)
+    assert isinstance(results[rule_severity_critical], RuleViolation)
+    assert score.value == 0.0
+    assert evaluation.project_score.value == 0.0
+    assert not evaluation.results
+    assert not evaluation.scores
+    evaluation._formatter.project_evaluated.assert_called_once_with(  # type: ignore[attr-defined]
+        evaluation.project_score
+    )
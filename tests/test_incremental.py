@@ -0,0 +1,119 @@
+"""Test the incremental evaluation."""
+
+from unittest.mock import Mock
+
+from dbt_score.cache import DiskCache
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.incremental import (
+    IncrementalState,
+    evaluable_fingerprint,
+    rules_fingerprint,
+)
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.rule import RuleConfig, RuleViolation, rule
+from dbt_score.rule_registry import RuleRegistry
+
+
+def _evaluate(manifest_loader, rule_registry, cache_dir):
+    """Evaluate rules incrementally."""
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=manifest_loader,
+        formatter=Mock(),
+        scorer=Mock(),
+        config=Config(),
+        incremental_state=IncrementalState(
+            DiskCache(cache_dir), rule_registry.rules.values()
+        ),
+    )
+    evaluation.evaluate()
+    return evaluation
+
+
+def test_evaluable_fingerprint(manifest_path):
+    """The fingerprint changes with the evaluable, or its parents if needed."""
+    model2 = ManifestLoader(manifest_path).models["model.package.model2"]
+    fingerprint = evaluable_fingerprint(model2, graph_sensitive=False)
+    graph_fingerprint = evaluable_fingerprint(model2, graph_sensitive=True)
+
+    model2._raw_values["created_at"] = 0.0
+    assert evaluable_fingerprint(model2, graph_sensitive=False) == fingerprint
+
+    model2.parents[0]._raw_values["description"] = "Changed."
+    assert evaluable_fingerprint(model2, graph_sensitive=False) == fingerprint
+    assert evaluable_fingerprint(model2, graph_sensitive=True) != graph_fingerprint
+
+    model2._raw_values["description"] = "Changed."
+    assert evaluable_fingerprint(model2, graph_sensitive=False) != fingerprint
+
+    model2._raw_values = {}
+    assert evaluable_fingerprint(model2, graph_sensitive=False) is None
+
+
+def test_rules_fingerprint(default_config, rule_with_config, decorator_rule):
+    """The fingerprint changes with the rules and their configuration."""
+    fingerprint = rules_fingerprint([decorator_rule(), rule_with_config()])
+
+    assert rules_fingerprint([decorator_rule(), rule_with_config()]) == fingerprint
+    assert rules_fingerprint([decorator_rule()]) != fingerprint
+    configured_rule = rule_with_config(RuleConfig(config={"model_name": "model2"}))
+    assert rules_fingerprint([decorator_rule(), configured_rule]) != fingerprint
+
+
+def test_evaluation_incremental(manifest_path, tmp_path, default_config):
+    """Only changed evaluables are evaluated, the results of others are reused."""
+    evaluated = []
+
+    @rule
+    def counted_rule(model: Model) -> RuleViolation | None:
+        """Rule counting its evaluations."""
+        evaluated.append(model.name)
+        if model.description == "Changed.":
+            return RuleViolation("Changed.")
+        return None
+
+    rule_registry = RuleRegistry(default_config)
+    rule_registry._add_rule(counted_rule)
+
+    manifest_loader = ManifestLoader(manifest_path)
+    _evaluate(manifest_loader, rule_registry, tmp_path)
+    assert len(evaluated) == len(manifest_loader.models)
+
+    evaluated.clear()
+    manifest_loader = ManifestLoader(manifest_path)
+    manifest_loader.models["model.package.model2"]._raw_values["description"] = (
+        "Changed."
+    )
+    manifest_loader.models["model.package.model2"].description = "Changed."
+    evaluation = _evaluate(manifest_loader, rule_registry, tmp_path)
+
+    assert evaluated == ["model2"]
+    assert evaluation.stats.reused == len(manifest_loader.models) - 1
+    assert evaluation.stats.evaluated == 1
+    model1 = manifest_loader.models["model.package.model1"]
+    model2 = manifest_loader.models["model.package.model2"]
+    assert evaluation.results[model1] == {counted_rule: None}
+    assert evaluation.results[model2] == {counted_rule: RuleViolation("Changed.")}
+
+
+def test_incremental_state_pruned(tmp_path, decorator_rule, rule_severity_low):
+    """Results of unknown evaluables and of previous rules are dropped."""
+    cache = DiskCache(tmp_path)
+    state = IncrementalState(cache, [decorator_rule()])
+    for unique_id in ("seen", "known", "deleted"):
+        state.set(unique_id, "fingerprint", {})
+    state.save()
+
+    state = IncrementalState(cache, [decorator_rule()])
+    state.get("seen", "fingerprint")
+    state.save(known_ids={"known"})
+
+    state = IncrementalState(cache, [decorator_rule()])
+    assert state.get("seen", "fingerprint") == {}
+    assert state.get("known", "fingerprint") == {}
+    assert state.get("deleted", "fingerprint") is None
+
+    previous_key = state._key
+    IncrementalState(cache, [rule_severity_low()]).save()
+    assert cache.get(previous_key) is None
@@ -0,0 +1,96 @@
+"""Test the JSON codecs."""
+
+import json
+
+import pytest
+
+from dbt_score.json_codec import BACKENDS, StdlibCodec, get_codec, read_json
+
+DOCUMENT = {"name": "modèle", "values": [1, 2.5, None, True], "nested": {}}
+
+
+def _installed_backends() -> list[str]:
+    backends = []
+    for name in BACKENDS:
+        try:
+            get_codec(name)
+        except ValueError:
+            continue
+        backends.append(name)
+    return backends
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_codec_roundtrip(backend):
+    """All backends decode and encode like the standard library."""
+    codec = get_codec(backend)
+    encoded = json.dumps(DOCUMENT).encode("utf-8")
+    assert codec.loads(encoded) == DOCUMENT
+    assert codec.loads(memoryview(encoded)) == DOCUMENT
+    assert json.loads(codec.dumps(DOCUMENT)) == DOCUMENT
+    assert json.loads(codec.dumps(DOCUMENT, indent=False)) == DOCUMENT
+
+
+def test_stdlib_codec_output():
+    """The output is either indented by 2 spaces, or compact."""
+    codec = StdlibCodec()
+    assert codec.dumps({"a": [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+    assert codec.dumps({"a": "é"}, indent=False) == '{"a":"\\u00e9"}'
+    assert codec.dumps({"a": "é"}, indent=False, ensure_ascii=False) == '{"a":"é"}'
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+def test_codec_ensure_ascii(backend):
+    """Non-ASCII characters are escaped like the standard library by default."""
+    codec = get_codec(backend)
+    document = {"name": "modèle 😀"}
+    assert codec.dumps(document, indent=False) == json.dumps(
+        document, separators=(",", ":")
+    )
+    assert json.loads(codec.dumps(document, ensure_ascii=False)) == document
+
+
+@pytest.mark.parametrize("backend", _installed_backends())
+@pytest.mark.parametrize("indent", [True, False])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_codec_output(backend, indent, ensure_ascii):
+    """All backends encode the same output as the standard library."""
+    document = {
+        "path": "models/a.sql",
+        "name": "modèle",
+        "values": [1, 2.5, None, True, "a"],
+        "nested": {"score": 10.0},
+    }
+    assert get_codec(backend).dumps(
+        document, indent=indent, ensure_ascii=ensure_ascii
+    ) == StdlibCodec().dumps(document, indent=indent, ensure_ascii=ensure_ascii)
+
+
+def test_stdlib_codec_loads_bom():
+    """UTF-8 documents are decoded from buffers, with or without a BOM."""
+    codec = StdlibCodec()
+    encoded = json.dumps(DOCUMENT).encode("utf-8")
+    assert codec.loads(memoryview(encoded)) == DOCUMENT
+    assert codec.loads(b"\xef\xbb\xbf" + encoded) == DOCUMENT
+
+
+def test_get_codec_auto():
+    """A backend is always available."""
+    assert get_codec().name in BACKENDS
+
+
+def test_get_codec_unknown():
+    """Unknown backends are rejected."""
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_codec("yaml")
+
+
+def test_read_json(manifest_path, raw_manifest, tmp_path):
+    """Files are decoded through a memory-mapped buffer."""
+    assert read_json(manifest_path) == raw_manifest
+    assert read_json(manifest_path, StdlibCodec()) == raw_manifest
+
+    empty_path = tmp_path / "empty.json"
+    empty_path.touch()
+    with pytest.raises(ValueError):
+        read_json(empty_path, StdlibCodec())
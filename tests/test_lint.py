@@ -2,8 +2,11 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from dbt_score.config import Config
 from dbt_score.lint import lint_dbt_project
+from dbt_score.models import Source
 
 
 @patch("dbt_score.lint.Evaluation")
@@ -15,3 +18,42 @@ def test_lint_dbt_project(mock_evaluation, manifest_path):
     lint_dbt_project(manifest_path=manifest_path, config=Config(), format="plain")
 
     mock_evaluation.evaluate.assert_called_once()
+
+
+@patch("dbt_score.lint.Evaluation")
+def test_lint_dbt_project_stream(mock_evaluation, manifest_path):
+    """The evaluation isn't run when streamed."""
+    mock_evaluation.return_value = mock_evaluation
+
+    evaluation = lint_dbt_project(
+        manifest_path=manifest_path, config=Config(), format="plain", stream=True
+    )
+
+    assert evaluation is mock_evaluation
+    mock_evaluation.evaluate.assert_not_called()  # type: ignore[attr-defined]
+
+
+def test_lint_dbt_project_score(manifest_path, capsys):
+    """Resource types without any active rule are still scored."""
+    config = Config()
+    config.overload({"cache": False})
+
+    evaluation = lint_dbt_project(
+        manifest_path=manifest_path, config=config, format="json"
+    )
+
+    # The project score with the default rules, as of dbt-score 0.16.0
+    assert evaluation.project_score.value == pytest.approx(8.8148, abs=1e-4)
+    assert any(isinstance(evaluable, Source) for evaluable in evaluation.scores)
+
+
+def test_lint_dbt_project_incremental_no_cache(manifest_path, tmp_path):
+    """Nothing is written next to the manifest without the cache."""
+    new_manifest_path = tmp_path / "manifest.json"
+    new_manifest_path.write_text(manifest_path.read_text())
+    config = Config()
+    config.overload({"cache": False, "incremental": True})
+
+    lint_dbt_project(manifest_path=new_manifest_path, config=config, format="ascii")
+
+    assert list(tmp_path.iterdir()) == [new_manifest_path]
@@ -0,0 +1,79 @@
+"""Test the streaming manifest reader."""
+
+import json
+
+import pytest
+
+from dbt_score.manifest_reader import stream_manifest
+from dbt_score.models import ManifestLoader
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1024 * 1024])
+def test_stream_manifest(manifest_path, raw_manifest, chunk_size):
+    """Only the project's resources are kept, whatever the chunk size."""
+    manifest = stream_manifest(manifest_path, chunk_size=chunk_size)
+
+    project_name = raw_manifest["metadata"]["project_name"]
+    assert manifest["metadata"] == raw_manifest["metadata"]
+    for section in ["nodes", "sources", "exposures", "macros"]:
+        assert manifest[section] == {
+            unique_id: values
+            for unique_id, values in raw_manifest[section].items()
+            if values["package_name"] == project_name
+        }
+    assert "model.package2.model1" not in manifest["nodes"]
+
+
+def test_stream_manifest_skips_other_sections(tmp_path):
+    """Unused sections are skipped, and metadata may come after the nodes."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "nodes": {
+                    "model.package.a": {"package_name": "package", "value": 1.5e3},
+                    "model.other.b": {"package_name": "other"},
+                },
+                "docs": {"doc.package.x": {"block_contents": "{ not a brace }"}},
+                "parent_map": {"model.package.a": []},
+                "disabled": [],
+                "metadata": {"project_name": "package"},
+            }
+        )
+    )
+
+    manifest = stream_manifest(manifest_path, chunk_size=3)
+
+    assert manifest == {
+        "metadata": {"project_name": "package"},
+        "nodes": {"model.package.a": {"package_name": "package", "value": 1.5e3}},
+        "sources": {},
+        "exposures": {},
+        "macros": {},
+    }
+
+
+def test_stream_manifest_invalid(tmp_path):
+    """An invalid manifest raises a ValueError."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text('{"nodes": {"model.package.a": {}')
+
+    with pytest.raises(ValueError):
+        stream_manifest(manifest_path)
+
+
+def test_manifest_loader_streaming(manifest_path):
+    """The streaming loader yields the same evaluables as the default one."""
+    loader = ManifestLoader(manifest_path)
+    streaming_loader = ManifestLoader(manifest_path, streaming=True)
+
+    assert streaming_loader.models.keys() == loader.models.keys()
+    assert streaming_loader.sources.keys() == loader.sources.keys()
+    assert streaming_loader.snapshots.keys() == loader.snapshots.keys()
+    assert streaming_loader.exposures.keys() == loader.exposures.keys()
+    assert streaming_loader.seeds.keys() == loader.seeds.keys()
+    assert streaming_loader.macros.keys() == loader.macros.keys()
+    assert (
+        streaming_loader.models["model.package.model1"].tests
+        == loader.models["model.package.model1"].tests
+    )
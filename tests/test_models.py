@@ -1,15 +1,33 @@
 """Test models."""
 
+import json
 from pathlib import Path
-from unittest.mock import patch
-
-from dbt_score.models import Exposure, ManifestLoader, Model, Snapshot
-
-
-@patch("dbt_score.models.Path.read_text")
-def test_manifest_load(mock_read_text, raw_manifest):
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.formatters.manifest_formatter import ManifestFormatter
+from dbt_score.models import (
+    DEFERRED,
+    RESOURCE_LOADERS,
+    Column,
+    Exposure,
+    ManifestLoader,
+    Model,
+    ResourceLoader,
+    Snapshot,
+    register_resource_loader,
+)
+from dbt_score.rule import RuleViolation, rule
+from dbt_score.rule_registry import RuleRegistry
+from dbt_score.scoring import Scorer
+
+
+def test_manifest_load(raw_manifest):
     """Test loading a manifest."""
-    with patch("dbt_score.models.json.loads", return_value=raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=raw_manifest):
         loader = ManifestLoader(Path("some.json"))
         assert len(loader.models) == len(
             [
@@ -108,43 +126,58 @@ def test_manifest_load(mock_read_text, raw_manifest):
         assert len(macro2.arguments) == 2
 
 
-@patch("dbt_score.models.Path.read_text")
-def test_manifest_select_models_simple(mock_read_text, raw_manifest):
+def test_manifest_select_models_simple(raw_manifest):
     """Test a simple selection in a manifest."""
-    with patch("dbt_score.models.json.loads", return_value=raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=raw_manifest):
         manifest_loader = ManifestLoader(Path("some.json"), select=["model1"])
 
     assert [x.name for x in manifest_loader.models.values()] == ["model1"]
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_select_models_dbt_ls(mock_dbt_ls, mock_read_text, raw_manifest):
-    """Test a complex selection in a manifest, which uses dbt ls."""
-    mock_dbt_ls.return_value = ["model1"]
-    with patch("dbt_score.models.json.loads", return_value=raw_manifest):
+def test_manifest_select_models_graph(mock_dbt_ls, raw_manifest):
+    """Test a selection with a graph operator, which doesn't use dbt ls."""
+    with patch("dbt_score.models.read_json", return_value=raw_manifest):
         manifest_loader = ManifestLoader(Path("some.json"), select=["+model1"])
 
+    assert sorted(x.name for x in manifest_loader.models.values()) == [
+        "model1",
+        "model2",
+    ]
+    assert list(manifest_loader.sources) == ["source.package.my_source.table1"]
+    assert list(manifest_loader.snapshots) == ["snapshot.package.snapshot2"]
+    assert list(manifest_loader.seeds) == ["seed.package.seed1"]
+    assert len(manifest_loader.exposures) == 0
+    assert len(manifest_loader.macros) == 0
+    mock_dbt_ls.assert_not_called()
+
+
+@patch("dbt_score.models.dbt_ls")
+def test_manifest_select_models_dbt_ls(mock_dbt_ls, raw_manifest):
+    """Test a selection which isn't supported natively, which uses dbt ls."""
+    mock_dbt_ls.return_value = ["model1", "my_source.table1"]
+    with patch("dbt_score.models.read_json", return_value=raw_manifest):
+        manifest_loader = ManifestLoader(Path("some.json"), select=["state:modified"])
+
     assert [x.name for x in manifest_loader.models.values()] == ["model1"]
-    mock_dbt_ls.assert_called_once_with(["+model1"], None)
+    assert list(manifest_loader.sources) == ["source.package.my_source.table1"]
+    mock_dbt_ls.assert_called_once_with(["state:modified"], None, manifest=None)
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_no_model(mock_dbt_ls, mock_read_text, raw_manifest, caplog):
+def test_manifest_no_model(mock_dbt_ls, raw_manifest, caplog):
     """Test the lack of model in a manifest."""
-    with patch("dbt_score.models.json.loads", return_value=raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=raw_manifest):
         manifest_loader = ManifestLoader(Path("some.json"), select=["non_existing"])
 
     assert len(manifest_loader.models) == 0
     assert "Nothing to evaluate!" in caplog.text
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_exclude_simple(mock_dbt_ls, mock_read_text, chain_raw_manifest):
+def test_manifest_exclude_simple(mock_dbt_ls, chain_raw_manifest):
     """Exclude model1 — model1 is excluded, the rest are included."""
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(Path("some.json"), exclude=["model1"])
 
     assert sorted(m.name for m in loader.models.values()) == sorted(
@@ -153,42 +186,37 @@ def test_manifest_exclude_simple(mock_dbt_ls, mock_read_text, chain_raw_manifest
     mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_exclude_ancestors(mock_dbt_ls, mock_read_text, chain_raw_manifest):
+def test_manifest_exclude_ancestors(mock_dbt_ls, chain_raw_manifest):
     """Exclude +model1 — model0 and model1 are excluded, the rest are included."""
-    mock_dbt_ls.return_value = ["model2", "model3", "standalone"]
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(Path("some.json"), exclude=["+model1"])
 
     assert sorted(m.name for m in loader.models.values()) == sorted(
         ["model2", "model3", "standalone"]
     )
-    mock_dbt_ls.assert_called_once_with(None, ["+model1"])
+    mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_exclude_descendants(mock_dbt_ls, mock_read_text, chain_raw_manifest):
+def test_manifest_exclude_descendants(mock_dbt_ls, chain_raw_manifest):
     """Exclude model1+ — model0 and standalone are kept.
 
     model1, model2 and model3 are descendants of model1 (or model1 itself), so excluded.
     """
-    mock_dbt_ls.return_value = ["model0", "standalone"]
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(Path("some.json"), exclude=["model1+"])
 
     assert sorted(m.name for m in loader.models.values()) == sorted(
         ["model0", "standalone"]
     )
-    mock_dbt_ls.assert_called_once_with(None, ["model1+"])
+    mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_exclude_non_existing(mock_dbt_ls, mock_read_text, chain_raw_manifest):
+def test_manifest_exclude_non_existing(mock_dbt_ls, chain_raw_manifest):
     """Exclude non_existing — all models are included since the model does not exist."""
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(Path("some.json"), exclude=["non_existing"])
 
     assert sorted(m.name for m in loader.models.values()) == sorted(
@@ -197,13 +225,10 @@ def test_manifest_exclude_non_existing(mock_dbt_ls, mock_read_text, chain_raw_ma
     mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_select_and_exclude_simple(
-    mock_dbt_ls, mock_read_text, chain_raw_manifest
-):
+def test_manifest_select_and_exclude_simple(mock_dbt_ls, chain_raw_manifest):
     """Select model2 and exclude model1 — only model2 is included."""
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(
             Path("some.json"), select=["model2"], exclude=["model1"]
         )
@@ -212,13 +237,10 @@ def test_manifest_select_and_exclude_simple(
     mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_select_and_exclude_same_model(
-    mock_dbt_ls, mock_read_text, chain_raw_manifest
-):
+def test_manifest_select_and_exclude_same_model(mock_dbt_ls, chain_raw_manifest):
     """Select model1 and exclude model1 — no models are included."""
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(
             Path("some.json"), select=["model1"], exclude=["model1"]
         )
@@ -227,39 +249,31 @@ def test_manifest_select_and_exclude_same_model(
     mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_select_and_exclude_ancestors_complex(
-    mock_dbt_ls, mock_read_text, chain_raw_manifest
-):
+def test_manifest_select_and_exclude_ancestors_complex(mock_dbt_ls, chain_raw_manifest):
     """Select +model1 and exclude +model1 — no models are included."""
-    mock_dbt_ls.return_value = []
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(
             Path("some.json"), select=["+model1"], exclude=["+model1"]
         )
 
     assert len(loader.models) == 0
-    mock_dbt_ls.assert_called_once()
+    mock_dbt_ls.assert_not_called()
 
 
-@patch("dbt_score.models.Path.read_text")
 @patch("dbt_score.models.dbt_ls")
-def test_manifest_select_simple_exclude_descendants(
-    mock_dbt_ls, mock_read_text, chain_raw_manifest
-):
+def test_manifest_select_simple_exclude_descendants(mock_dbt_ls, chain_raw_manifest):
     """Select model2 and exclude model1+ — no models included.
 
     model2 is a descendant of model1, so it is excluded.
     """
-    mock_dbt_ls.return_value = []
-    with patch("dbt_score.models.json.loads", return_value=chain_raw_manifest):
+    with patch("dbt_score.models.read_json", return_value=chain_raw_manifest):
         loader = ManifestLoader(
             Path("some.json"), select=["model2"], exclude=["model1+"]
         )
 
     assert len(loader.models) == 0
-    mock_dbt_ls.assert_called_once()
+    mock_dbt_ls.assert_not_called()
 
 
 def create_dummy_model(unique_id: str, name: str = "dummy", children=None) -> Model:
@@ -386,3 +400,292 @@ def test_downstream_count_with_non_model_descendants():
 
     # Only model should be counted (1), snapshot and exposure are not Model type
     assert parent.downstream_count == 1
+
+
+def test_manifest_load_from_cache(manifest_path, tmp_path):
+    """A cached manifest is not parsed again."""
+    cache_dir = tmp_path / ".dbt-score"
+    loader = ManifestLoader(manifest_path, cache_dir=cache_dir)
+
+    with patch.object(ManifestLoader, "_load") as mock_load:
+        cached_loader = ManifestLoader(manifest_path, cache_dir=cache_dir)
+
+    mock_load.assert_not_called()
+    assert cached_loader.project_name == loader.project_name
+    assert cached_loader.models.keys() == loader.models.keys()
+    assert cached_loader.sources.keys() == loader.sources.keys()
+    assert cached_loader.macros.keys() == loader.macros.keys()
+    # Relatives are linked between the cached evaluables
+    model1 = cached_loader.models["model.package.model1"]
+    assert model1.parents[0] is cached_loader.models["model.package.model2"]
+    # The raw manifest is still available on demand
+    assert cached_loader.raw_manifest == loader.raw_manifest
+
+
+def test_manifest_cache_deferred_fields(manifest_path, tmp_path):
+    """Deferred fields are cached unparsed, and parsed once loaded from the cache."""
+    cache_dir = tmp_path / ".dbt-score"
+    loader = ManifestLoader(manifest_path, cache_dir=cache_dir)
+    cached_loader = ManifestLoader(manifest_path, cache_dir=cache_dir)
+
+    model1 = cached_loader.models["model.package.model1"]
+    assert vars(Model)["columns"]._slot.__get__(model1, Model) is DEFERRED
+    assert model1.columns == loader.models["model.package.model1"].columns
+
+
+def test_manifest_cache_invalidation(manifest_path, tmp_path):
+    """A changed manifest is parsed again."""
+    cache_dir = tmp_path / ".dbt-score"
+    new_manifest_path = tmp_path / "manifest.json"
+    new_manifest_path.write_text(manifest_path.read_text())
+    ManifestLoader(new_manifest_path, cache_dir=cache_dir)
+
+    new_manifest_path.write_text(
+        manifest_path.read_text().replace('"model1"', '"model1_renamed"')
+    )
+    loader = ManifestLoader(new_manifest_path, cache_dir=cache_dir)
+
+    assert loader.models["model.package.model1"].name == "model1_renamed"
+
+
+def test_tests_indexed_by_column(raw_manifest):
+    """Tests are attached to their column, or to the node without a column."""
+    node_values = raw_manifest["nodes"]["model.package.model1"]
+    test_values = [
+        {"name": "model_test", "test_metadata": {"name": "unique_combination"}},
+        {
+            "name": "quoted_test",
+            "test_metadata": {
+                "name": "unique",
+                "kwargs": {"column_name": "`a`"},
+            },
+        },
+        {
+            "name": "column_test",
+            "test_metadata": {
+                "name": "not_null",
+                "kwargs": {"column_name": "a"},
+            },
+        },
+        {
+            "name": "unknown_column_test",
+            "test_metadata": {"name": "not_null", "kwargs": {"column_name": "unknown"}},
+        },
+    ]
+
+    model = Model.from_node(node_values, test_values)
+
+    assert [test.name for test in model.tests] == ["model_test"]
+    column_a = model.get_column("column_a")
+    assert column_a is not None
+    assert [test.name for test in column_a.tests] == ["quoted_test", "column_test"]
+    assert all(not column.tests for column in model.columns if column is not column_a)
+
+
+def test_evaluables_are_slotted(manifest_loader):
+    """Evaluables don't have a per-instance `__dict__`."""
+    model1 = manifest_loader.models["model.package.model1"]
+    assert not hasattr(model1, "__dict__")
+    assert not hasattr(model1.columns[0], "__dict__")
+    assert not hasattr(model1.tests[0], "__dict__")
+
+
+def test_repeated_strings_interned(manifest_loader):
+    """Repeated strings like package names are shared between evaluables."""
+    model1 = manifest_loader.models["model.package.model1"]
+    model2 = manifest_loader.models["model.package.model2"]
+    assert model1.package_name is model2.package_name
+
+
+def test_manifest_load_lean(manifest_path):
+    """The lean mode drops raw values, but keeps typed fields."""
+    loader = ManifestLoader(manifest_path, select=["model1"], lean=True)
+
+    model1 = loader.models["model.package.model1"]
+    assert model1._raw_values == {}
+    assert model1._raw_test_values == []
+    assert all(column._raw_values == {} for column in model1.columns)
+    assert all(test._raw_values == {} for test in model1.tests)
+    # Relatives, which aren't selected, are dropped too
+    assert model1.parents[0]._raw_values == {}
+    assert model1.tests
+    assert loader._raw_manifest is None
+
+
+def test_manifest_release_raw_manifest(manifest_path):
+    """The raw manifest is released, and read again on demand."""
+    loader = ManifestLoader(manifest_path, keep_raw_manifest=False)
+
+    assert loader._raw_manifest is None
+    assert "raw_nodes" not in loader.__dict__
+    assert loader.models["model.package.model1"]._raw_values
+    assert loader.raw_manifest["metadata"]["project_name"] == "package"
+
+
+def test_manifest_load_selected_lineage(manifest_path):
+    """Only selected resources and their ancestors and descendants are loaded."""
+    loader = ManifestLoader(manifest_path, select=["model2"])
+
+    assert loader.models.keys() == {"model.package.model2"}
+    assert loader.sources == {}
+    # Relatives are loaded, but not evaluated
+    model2 = loader.models["model.package.model2"]
+    assert [parent.unique_id for parent in model2.parents] == ["seed.package.seed1"]
+    assert "model.package.model1" in [child.unique_id for child in model2.children]
+    # Unrelated resources are not loaded at all
+    assert "seed.package.seed2" not in loader._resources
+    assert "source.package.my_source.table2" not in loader._resources
+
+
+def test_manifest_load_selected_lineage_relatives(manifest_path):
+    """Relatives of the lineage of selected resources are the same as without it."""
+    loader = ManifestLoader(manifest_path, select=["snapshot1"])
+    full_loader = ManifestLoader(manifest_path)
+    lineage_ids = {"snapshot.package.snapshot1"} | loader.dag.lineage(
+        ["snapshot.package.snapshot1"]
+    )
+
+    for unique_id in lineage_ids:
+        resource = loader._resources[unique_id]
+        full_resource = full_loader._resources[unique_id]
+        for relatives in ("parents", "children"):
+            assert [r.unique_id for r in getattr(resource, relatives, [])] == [
+                r.unique_id for r in getattr(full_resource, relatives, [])
+            ]
+    # e.g. a sibling of the selected snapshot's ancestor, outside of the lineage
+    model2 = loader._resources["model.package.model2"]
+    assert isinstance(model2, Model)
+    assert "model.package.collision_test" in [c.unique_id for c in model2.children]
+
+
+def test_manifest_load_resource_types(manifest_path):
+    """Only resource types to evaluate are loaded, relatives are still linked."""
+    loader = ManifestLoader(manifest_path, resource_types=[Model])
+
+    assert loader.models
+    assert not loader.sources
+    assert not loader.snapshots
+    assert not loader.macros
+    model2 = loader.models["model.package.model2"]
+    assert model2.parents[0].unique_id == "seed.package.seed1"
+
+
+def test_columns_and_tests_parsed_on_access(raw_manifest):
+    """Columns and tests are parsed when first accessed."""
+    node_values = raw_manifest["nodes"]["model.package.model1"]
+    with patch(
+        "dbt_score.models.Column.from_node_values", wraps=Column.from_node_values
+    ) as mock_from_node_values:
+        model = Model.from_node(node_values, [])
+        mock_from_node_values.assert_not_called()
+
+        assert model.columns[0].name == "column_a"
+        assert mock_from_node_values.call_count == len(node_values["columns"])
+        assert model.columns is model.columns
+        assert model.tests == []
+
+
+def test_manifest_evaluables(manifest_loader):
+    """All evaluables are available, grouped by resource type."""
+    evaluables = manifest_loader.evaluables
+    assert evaluables[: len(manifest_loader.models)] == list(
+        manifest_loader.models.values()
+    )
+    assert len(evaluables) == (
+        len(manifest_loader.models)
+        + len(manifest_loader.sources)
+        + len(manifest_loader.snapshots)
+        + len(manifest_loader.exposures)
+        + len(manifest_loader.seeds)
+        + len(manifest_loader.macros)
+    )
+
+
+def test_register_resource_loader(raw_manifest, tmp_path):
+    """Resource types can be loaded by registering a loader."""
+    analysis = {
+        **raw_manifest["nodes"]["model.package.model1"],
+        "unique_id": "analysis.package.analysis1",
+        "name": "analysis1",
+        "resource_type": "analysis",
+    }
+    raw_manifest["nodes"][analysis["unique_id"]] = analysis
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(raw_manifest))
+
+    register_resource_loader(
+        ResourceLoader("analysis", "nodes", Model, "analyses", Model.from_node)
+    )
+    try:
+        loader = ManifestLoader(manifest_path)
+        assert loader.evaluables[-1].unique_id == "analysis.package.analysis1"
+    finally:
+        del RESOURCE_LOADERS["analysis"]
+    assert "analysis.package.analysis1" not in loader.models
+
+
+class Analysis(Model):
+    """A resource type registered by a plugin."""
+
+
+def test_register_resource_loader_rule(raw_manifest, tmp_path, capsys):
+    """Rules can target registered resource types, scored in the manifest."""
+    analysis = {
+        **raw_manifest["nodes"]["model.package.model1"],
+        "unique_id": "analysis.package.analysis1",
+        "name": "analysis1",
+        "resource_type": "analysis",
+    }
+    raw_manifest["nodes"][analysis["unique_id"]] = analysis
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(raw_manifest))
+
+    register_resource_loader(
+        ResourceLoader("analysis", "nodes", Analysis, "analyses", Analysis.from_node)
+    )
+    try:
+
+        @rule  # type: ignore[arg-type]
+        def analysis_rule(analysis: Analysis) -> RuleViolation | None:
+            """Rule on analyses."""
+            return RuleViolation("Analysis.")
+
+        assert analysis_rule.resource_type is Analysis
+        config = Config()
+        manifest_loader = ManifestLoader(manifest_path)
+        rule_registry = RuleRegistry(config)
+        rule_registry._add_rule(analysis_rule)
+        Evaluation(
+            rule_registry=rule_registry,
+            manifest_loader=manifest_loader,
+            formatter=ManifestFormatter(manifest_loader, config),
+            scorer=Scorer(config),
+            config=config,
+        ).evaluate()
+    finally:
+        del RESOURCE_LOADERS["analysis"]
+
+    manifest = json.loads(capsys.readouterr().out)
+    meta = manifest["nodes"]["analysis.package.analysis1"]["meta"]
+    assert meta["score"] == pytest.approx(10 / 3)
+    assert manifest["nodes"]["model.package.model1"]["meta"]["score"] == 10.0
+
+
+@patch("dbt_score.models.dbt_ls")
+@patch("dbt_score.models.read_json")
+def test_manifest_load_dbt_manifest(mock_read_json, mock_dbt_ls, raw_manifest):
+    """A manifest parsed by dbt is used in memory, and reused by dbt ls."""
+    dbt_manifest = MagicMock()
+    dbt_manifest.writable_manifest.return_value.to_dict.return_value = raw_manifest
+    mock_dbt_ls.return_value = ["model1"]
+
+    loader = ManifestLoader(
+        Path("missing.json"),
+        select=["state:modified"],
+        dbt_manifest=dbt_manifest,
+        cache_dir=Path("unused"),
+    )
+
+    mock_read_json.assert_not_called()
+    mock_dbt_ls.assert_called_once_with(["state:modified"], None, manifest=dbt_manifest)
+    assert list(loader.models) == ["model.package.model1"]
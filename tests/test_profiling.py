@@ -0,0 +1,51 @@
+"""Test the profiling of linting."""
+
+import pytest
+
+from dbt_score.profiling import Profile, active_profile, phase, profiling
+
+
+def test_profile_nested_phases():
+    """Phases exclude the duration of phases nested in them."""
+    profile = Profile()
+    with profiling(profile):
+        assert active_profile() is profile
+        with phase("evaluate"):
+            for _ in range(3):
+                with phase("score"):
+                    pass
+    assert active_profile() is None
+
+    assert profile.phases["evaluate"].calls == 1
+    assert profile.phases["score"].calls == 3
+    assert [item["name"] for item in profile.to_dict()["phases"]] == [
+        "evaluate",
+        "score",
+    ]
+
+
+def test_phase_without_profile():
+    """Phases are ignored when no profile is active."""
+    with phase("evaluate"):
+        pass
+    assert active_profile() is None
+
+
+def test_profile_slowest_pairs():
+    """Only the slowest pairs are kept, slowest first."""
+    profile = Profile(slowest=2)
+    for i, duration in enumerate([0.3, 0.1, 0.5, 0.2]):
+        profile.record_rule("rule", "Model", f"model.package.model{i}", duration)
+    profile.record_filter("filter", 0.1)
+
+    result = profile.to_dict()
+    assert result["slowest_pairs"] == [
+        {"rule": "rule", "unique_id": "model.package.model2", "duration": 0.5},
+        {"rule": "rule", "unique_id": "model.package.model0", "duration": 0.3},
+    ]
+    assert result["rules"] == [
+        {"name": "rule", "calls": 4, "duration": pytest.approx(1.1)}
+    ]
+    assert result["resource_types"][0]["calls"] == 4
+    assert result["filters"] == [{"name": "filter", "calls": 1, "duration": 0.1}]
+    assert "rule on model.package.model2" in profile.summary()
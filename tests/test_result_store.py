@@ -0,0 +1,123 @@
+"""Test the compact store of results."""
+
+from unittest.mock import Mock
+
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.exceptions import RuleFailedException, RuleTimeoutException
+from dbt_score.models import ManifestLoader
+from dbt_score.result_store import ResultStatus, ResultStore
+from dbt_score.rule import RuleViolation
+from dbt_score.rule_registry import RuleRegistry
+from dbt_score.scoring import Scorer
+
+
+def test_result_store(
+    model1, model2, rule_severity_low, rule_severity_medium, rule_error
+):
+    """Results are rebuilt from their statuses and interned details."""
+    store = ResultStore([rule_severity_low, rule_severity_medium, rule_error])
+    store[model1] = {rule_severity_low: None, rule_error: ValueError("Oops.")}
+    store[model2] = {
+        rule_severity_low: RuleViolation("Linting error"),
+        rule_severity_medium: RuleViolation("Linting error"),
+    }
+
+    results = store[model1]
+    assert list(results) == [rule_severity_low, rule_error]
+    assert results[rule_severity_low] is None
+    error = results[rule_error]
+    assert type(error) is ValueError
+    assert str(error) == "Oops."
+    assert store[model2] == {
+        rule_severity_low: RuleViolation("Linting error"),
+        rule_severity_medium: RuleViolation("Linting error"),
+    }
+    assert list(store) == [model1, model2]
+    # The message is interned, as well as None
+    assert len(store._values) == 3
+
+    assert store.status(model1, rule_severity_medium) == ResultStatus.SKIPPED
+    assert store.counts() == {
+        ResultStatus.OK: 1,
+        ResultStatus.WARN: 2,
+        ResultStatus.ERR: 1,
+        ResultStatus.SKIPPED: 2,
+    }
+    assert store.counts(rule_severity_low) == {
+        ResultStatus.OK: 1,
+        ResultStatus.WARN: 1,
+    }
+    assert store.evaluables_with(ResultStatus.WARN, rule_severity_low) == [model2]
+
+    store[model1] = {rule_severity_low: RuleViolation()}
+    assert store[model1] == {rule_severity_low: RuleViolation()}
+    del store[model2]
+    assert list(store) == [model1]
+
+
+class _AttributeError(Exception):
+    """An exception whose message is computed from its attributes."""
+
+    def __init__(self, code: int):
+        super().__init__(code)
+        self.code = code
+
+    def __str__(self) -> str:
+        return f"Error {self.code}."
+
+
+def test_result_store_exception_types(model1, rule_severity_low, rule_error):
+    """Exceptions survive a round trip through the store with their type."""
+    store = ResultStore([rule_severity_low, rule_error])
+    timeout = RuleTimeoutException("rule", 1.0)
+    store[model1] = {rule_severity_low: timeout, rule_error: _AttributeError(1)}
+
+    results = store[model1]
+    assert type(results[rule_severity_low]) is RuleTimeoutException
+    assert str(results[rule_severity_low]) == str(timeout)
+    # Exceptions which can't be rebuilt keep their type name
+    error = results[rule_error]
+    assert isinstance(error, RuleFailedException)
+    assert error.type_name == "_AttributeError"
+    assert str(error) == "Error 1."
+
+
+def test_evaluation_compact_results(
+    manifest_path, rule_severity_low, rule_severity_critical, rule_error
+):
+    """The results of an evaluation can be stored compactly."""
+    evaluations = []
+    for compact in (False, True):
+        config = Config()
+        config.overload({"compact_results": compact})
+        rule_registry = RuleRegistry(config)
+        for rule_class in (rule_severity_low, rule_severity_critical, rule_error):
+            rule_registry._add_rule(rule_class)
+        evaluation = Evaluation(
+            rule_registry=rule_registry,
+            manifest_loader=ManifestLoader(manifest_path),
+            formatter=Mock(),
+            scorer=Scorer(config),
+            config=config,
+        )
+        evaluation.evaluate()
+        evaluations.append(evaluation)
+
+    evaluation, compact_evaluation = evaluations
+    assert isinstance(compact_evaluation.results, ResultStore)
+    assert [e.unique_id for e in compact_evaluation.results] == [
+        e.unique_id for e in evaluation.results
+    ]
+    for results, compact_results in zip(
+        evaluation.results.values(), compact_evaluation.results.values(), strict=True
+    ):
+        assert list(compact_results) == list(results)
+        for rule_class, result in results.items():
+            compact_result = compact_results[rule_class]
+            if isinstance(result, Exception):
+                assert type(compact_result) is type(result)
+                assert str(compact_result) == str(result)
+            else:
+                assert compact_result == result
+    assert compact_evaluation.project_score == evaluation.project_score
@@ -1,5 +1,8 @@
 """Test rule."""
 
+import asyncio
+from typing import Mapping, Sequence
+
 import pytest
 
 from dbt_score import (
@@ -77,6 +80,77 @@ def test_missing_evaluate_rule_class(model1):
             description = "Description of the rule."
 
 
+def test_batch_rule_decorator_and_class(model1, model2, source1):
+    """Test batch rule creation with the rule decorator and class."""
+
+    @rule(batch=True)
+    def decorator_batch_rule(
+        models: Sequence[Model],
+    ) -> Mapping[Model, RuleViolation | None]:
+        """Description of the rule."""
+        return {
+            model: RuleViolation("Model1 is a violation.")
+            for model in models
+            if model.name == "model1"
+        }
+
+    class ClassBatchRule(Rule):
+        description = "Description of the rule."
+        batch = True
+
+        def evaluate_batch(  # type: ignore[override]
+            self, sources: list[Source]
+        ) -> Mapping[Source, RuleViolation | None]:
+            """Evaluate sources."""
+            return {}
+
+    assert decorator_batch_rule.batch
+    assert decorator_batch_rule.resource_type is Model
+    assert decorator_batch_rule().evaluate_batch([model1, model2]) == {
+        model1: RuleViolation("Model1 is a violation.")
+    }
+    assert ClassBatchRule.resource_type is Source
+    assert ClassBatchRule().evaluate_batch([source1]) == {}
+
+    with pytest.raises(TypeError):
+
+        class BadBatchRule(Rule):
+            description = "Description of the rule."
+            batch = True
+
+            def evaluate_batch(  # type: ignore[override]
+                self, model: Model
+            ) -> Mapping[Model, RuleViolation | None]:
+                """Evaluate a single model."""
+                return {}
+
+    with pytest.raises(TypeError, match="asynchronous"):
+
+        @rule(batch=True)  # type: ignore[arg-type]
+        async def async_batch_rule(
+            models: Sequence[Model],
+        ) -> Mapping[Model, RuleViolation | None]:
+            """Description of the rule."""
+            return {}
+
+
+def test_async_rule_class(source1):
+    """Test async rule creation with the rule class."""
+
+    class ClassAsyncRule(Rule):
+        description = "Description of the rule."
+
+        async def evaluate(self, source: Source) -> RuleViolation | None:  # type: ignore[override]
+            """Evaluate source."""
+            return RuleViolation("Violation.")
+
+    assert ClassAsyncRule.asynchronous
+    assert ClassAsyncRule.resource_type is Source
+    assert asyncio.run(ClassAsyncRule().evaluate(source1)) == RuleViolation(
+        "Violation."
+    )
+
+
 @pytest.mark.parametrize(
     "rule_fixture,expected_type",
     [
@@ -202,3 +276,31 @@ def test_should_evaluate(model1, source1):
     rule1 = model_rule()
     assert rule1.should_evaluate(model1) is True
     assert rule1.should_evaluate(source1) is False
+
+
+def test_should_evaluate_shared_filter(model1, model2):
+    """Test that a filter shared by rules is evaluated once per evaluable."""
+    calls = []
+
+    @rule_filter
+    def model_filter(model: Model) -> bool:
+        """Filter out model1."""
+        calls.append(model.name)
+        return model.name != "model1"
+
+    @rule(rule_filters={model_filter()})
+    def rule_a(model: Model) -> RuleViolation | None:
+        """Rule that always returns None."""
+        return None
+
+    @rule(rule_filters={model_filter()})
+    def rule_b(model: Model) -> RuleViolation | None:
+        """Rule that always returns None."""
+        return None
+
+    for model, expected in ((model1, False), (model2, True)):
+        filter_results: dict[str, bool] = {}
+        assert rule_a().should_evaluate(model, filter_results) is expected
+        assert rule_b().should_evaluate(model, filter_results) is expected
+        assert filter_results == {model_filter.source(): expected}
+    assert calls == ["model1", "model2"]
@@ -0,0 +1,144 @@
+"""Test the cache of rule results."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from dbt_score.cache import DiskCache
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.rule import RuleConfig, RuleViolation, rule
+from dbt_score.rule_cache import MISSING, RuleResultCache
+from dbt_score.rule_registry import RuleRegistry
+
+
+def test_rule_cache_get_set(tmp_path, model1, model2):
+    """Results are persisted by rule configuration and evaluable fingerprint."""
+
+    @rule(cacheable=True)
+    def cacheable_rule(model: Model, max_length: int = 10) -> RuleViolation | None:
+        """Cacheable rule."""
+
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [cacheable_rule()])
+    rule_cache.set(cacheable_rule, model1, RuleViolation("Too long."))
+    rule_cache.set(cacheable_rule, model2, None)
+    rule_cache.save()
+
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [cacheable_rule()])
+    assert rule_cache.get(cacheable_rule, model1) == RuleViolation("Too long.")
+    assert rule_cache.get(cacheable_rule, model2) is None
+
+    model2._raw_values = {**model2._raw_values, "description": "Changed."}
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [cacheable_rule()])
+    assert rule_cache.get(cacheable_rule, model2) is MISSING
+
+    configured_rule = cacheable_rule(RuleConfig(config={"max_length": 20}))
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [configured_rule])
+    assert rule_cache.get(cacheable_rule, model1) is MISSING
+
+
+def test_rule_cache_unchanged_not_written(tmp_path, model1):
+    """Entries are only written when their results change."""
+
+    @rule(cacheable=True)
+    def cacheable_rule(model: Model) -> RuleViolation | None:
+        """Cacheable rule."""
+
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [cacheable_rule()])
+    rule_cache.set(cacheable_rule, model1, None)
+    rule_cache.save()
+
+    cache = DiskCache(tmp_path)
+    rule_cache = RuleResultCache(cache, [cacheable_rule()])
+    with patch.object(cache, "set", wraps=cache.set) as mock_set:
+        rule_cache.set(cacheable_rule, model1, None)
+        rule_cache.save()
+        mock_set.assert_not_called()
+
+        rule_cache.set(cacheable_rule, model1, RuleViolation("Changed."))
+        rule_cache.save()
+        mock_set.assert_called_once()
+
+
+def test_rule_cache_concurrent_load(tmp_path, model1):
+    """The results of a rule are loaded once, even when first read concurrently."""
+
+    @rule(cacheable=True)
+    def cacheable_rule(model: Model) -> RuleViolation | None:
+        """Cacheable rule."""
+
+    cache = DiskCache(tmp_path)
+    rule_cache = RuleResultCache(cache, [cacheable_rule()])
+    with (
+        patch.object(cache, "get", wraps=cache.get) as mock_get,
+        ThreadPoolExecutor(max_workers=8) as executor,
+    ):
+        results = list(
+            executor.map(lambda _: rule_cache.get(cacheable_rule, model1), range(64))
+        )
+
+    assert all(result is MISSING for result in results)
+    mock_get.assert_called_once()
+
+
+def test_rule_cache_not_cacheable(tmp_path, model1, decorator_rule):
+    """Results of rules which aren't cacheable aren't cached."""
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [decorator_rule()])
+    rule_cache.set(decorator_rule, model1, None)
+
+    assert rule_cache.get(decorator_rule, model1) is MISSING
+
+
+def test_rule_cache_lru_eviction(tmp_path, model1, model2):
+    """The least recently used results are evicted first."""
+
+    @rule(cacheable=True)
+    def cacheable_rule(model: Model) -> RuleViolation | None:
+        """Cacheable rule."""
+
+    rule_cache = RuleResultCache(DiskCache(tmp_path), [cacheable_rule()], max_entries=2)
+    rule_cache.set(cacheable_rule, model1, None)
+    rule_cache.set(cacheable_rule, model2, None)
+    rule_cache.set(cacheable_rule, model1, None)  # Most recently used
+    model3 = Model.from_node(
+        {**model2._raw_values, "unique_id": "model.package.model3"}, []
+    )
+    rule_cache.set(cacheable_rule, model3, RuleViolation())
+
+    assert rule_cache.get(cacheable_rule, model1) is None
+    assert rule_cache.get(cacheable_rule, model2) is MISSING
+    assert rule_cache.get(cacheable_rule, model3) == RuleViolation()
+
+
+def test_evaluation_rule_cache(manifest_path, tmp_path, default_config):
+    """Cached results are reused by later evaluations."""
+    evaluated = []
+
+    @rule(cacheable=True)
+    def counted_rule(model: Model) -> RuleViolation | None:
+        """Rule counting its evaluations."""
+        evaluated.append(model.name)
+        return RuleViolation("Expensive violation.")
+
+    rule_registry = RuleRegistry(default_config)
+    rule_registry._add_rule(counted_rule)
+
+    for _ in range(2):
+        manifest_loader = ManifestLoader(manifest_path)
+        evaluation = Evaluation(
+            rule_registry=rule_registry,
+            manifest_loader=manifest_loader,
+            formatter=Mock(),
+            scorer=Mock(),
+            config=Config(),
+            rule_cache=RuleResultCache(
+                DiskCache(tmp_path), rule_registry.rules.values()
+            ),
+        )
+        evaluation.evaluate()
+
+    assert len(evaluated) == len(manifest_loader.models)
+    model1 = manifest_loader.models["model.package.model1"]
+    assert evaluation.results[model1] == {
+        counted_rule: RuleViolation("Expensive violation.")
+    }
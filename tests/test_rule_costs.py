@@ -0,0 +1,90 @@
+"""Test the costs of rules."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from dbt_score.cache import DiskCache
+from dbt_score.config import Config
+from dbt_score.evaluation import Evaluation
+from dbt_score.models import ManifestLoader, Model
+from dbt_score.profiling import Timing
+from dbt_score.rule import RuleViolation, rule
+from dbt_score.rule_costs import RuleCosts
+from dbt_score.rule_registry import RuleRegistry
+from dbt_score.scoring import Scorer
+
+
+def test_rule_costs_order(rule_severity_low, rule_severity_critical):
+    """CRITICAL rules come first, then the cheapest rules."""
+
+    @rule(cost=0.1)
+    def expensive_rule(model: Model) -> RuleViolation | None:
+        """Expensive rule."""
+
+    @rule(cost=0.001)
+    def cheap_rule(model: Model) -> RuleViolation | None:
+        """Cheap rule."""
+
+    rules = [expensive_rule(), rule_severity_low(), cheap_rule()]
+    critical_rule = rule_severity_critical()
+    ordered = RuleCosts().order([*rules, critical_rule])
+
+    # rule_severity_low has an unknown cost
+    assert ordered == [critical_rule, rules[1], rules[2], rules[0]]
+
+
+def test_rule_costs_learned(tmp_path, decorator_rule):
+    """Costs are learned from the durations measured in previous runs."""
+    rule_name = decorator_rule.source()
+    rule_costs = RuleCosts(DiskCache(tmp_path))
+    rule_costs.record(rule_name, 1.0)
+    rule_costs.merge({rule_name: Timing(calls=2, duration=2.0)})
+    rule_costs.save()
+
+    rule_costs = RuleCosts(DiskCache(tmp_path))
+    assert rule_costs.cost(decorator_rule()) == 1.0
+    rule_costs.record(rule_name, 3.0)
+    rule_costs.save()
+
+    assert RuleCosts(DiskCache(tmp_path)).cost(decorator_rule()) == 2.0
+
+
+@pytest.mark.parametrize("requires_results", [True, False])
+def test_evaluation_rule_order_cost(
+    manifest_path, rule_severity_low, rule_severity_critical, requires_results
+):
+    """Rules are evaluated by cost, and skipped once a CRITICAL violation is found.
+
+    Rules are only skipped when the formatter doesn't need their results, which are
+    reported in registry order whatever the evaluation order.
+    """
+    config = Config()
+    config.overload({"rule_order": "cost"})
+    rule_registry = RuleRegistry(config)
+    rule_registry._add_rule(rule_severity_low)
+    rule_registry._add_rule(rule_severity_critical)
+    manifest_loader = ManifestLoader(manifest_path)
+    formatter = Mock(requires_results=requires_results)
+
+    evaluation = Evaluation(
+        rule_registry=rule_registry,
+        manifest_loader=manifest_loader,
+        formatter=formatter,
+        scorer=Scorer(config),
+        config=config,
+    )
+    evaluation.evaluate()
+
+    model1 = manifest_loader.models["model.package.model1"]
+    model2 = manifest_loader.models["model.package.model2"]
+    assert list(evaluation.results[model1]) == [
+        rule_severity_low,
+        rule_severity_critical,
+    ]
+    assert list(evaluation.results[model2]) == (
+        [rule_severity_low, rule_severity_critical]
+        if requires_results
+        else [rule_severity_critical]
+    )
+    assert evaluation.scores[model2].value == 0.0
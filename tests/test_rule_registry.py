@@ -5,6 +5,7 @@ import pytest
 from dbt_score import Severity
 from dbt_score.config import Config
 from dbt_score.exceptions import DuplicatedRuleException
+from dbt_score.models import Model, Source
 from dbt_score.rule_registry import RuleRegistry
 
 
@@ -67,3 +68,22 @@ def test_rule_registry_rule_filters(valid_config_path, model1, model2):
 
     assert not r.rules["tests.rules.rules.rule_test_example"].should_evaluate(model1)
     assert r.rules["tests.rules.rules.rule_test_example"].should_evaluate(model2)
+
+
+def test_rule_registry_rules_by_resource_type(
+    default_config, decorator_rule, decorator_rule_source, model_rule_with_filter
+):
+    """Ensure rules are dispatched by resource type, in registration order."""
+    r = RuleRegistry(default_config)
+    r._add_rule(decorator_rule)
+    r._add_rule(decorator_rule_source)
+    assert {
+        resource_type: [type(rule) for rule in rules]
+        for resource_type, rules in r.rules_by_resource_type.items()
+    } == {Model: [decorator_rule], Source: [decorator_rule_source]}
+
+    r._add_rule(model_rule_with_filter)
+    assert [type(rule) for rule in r.rules_by_resource_type[Model]] == [
+        decorator_rule,
+        model_rule_with_filter,
+    ]
@@ -1,5 +1,6 @@
 """Unit tests for the scoring module."""
 
+from dbt_score.exceptions import RuleDisabledException, RuleTimeoutException
 from dbt_score.rule import RuleViolation
 from dbt_score.scoring import Score, Scorer
 
@@ -23,6 +24,21 @@ def test_scorer_model_severity_low(default_config, rule_severity_low):
     )
 
 
+def test_scorer_model_interrupted_rules(
+    default_config, rule_severity_low, rule_severity_medium, rule_severity_high
+):
+    """Rules interrupted or disabled by the circuit breaker aren't scored."""
+    scorer = Scorer(config=default_config)
+    score = scorer.score_evaluable(
+        {
+            rule_severity_low: RuleViolation("error"),
+            rule_severity_medium: RuleTimeoutException("rule", 1.0),
+            rule_severity_high: RuleDisabledException("rule", "reason"),
+        }
+    )
+    assert score == scorer.score_evaluable({rule_severity_low: RuleViolation("error")})
+
+
 def test_scorer_model_severity_medium(default_config, rule_severity_medium):
     """Test scorer with a model and one medium severity rule."""
     scorer = Scorer(config=default_config)
@@ -171,3 +187,14 @@ def test_scorer_badge(default_config):
     assert scorer._badge(8.0) == scorer._config.badge_config.second.icon
     assert scorer._badge(7.0) == scorer._config.badge_config.third.icon
     assert scorer._badge(1.0) == scorer._config.badge_config.wip.icon
+
+
+def test_scorer_aggregate_running(default_config):
+    """Test scorer aggregation with a running aggregate of scores."""
+    scorer = Scorer(config=default_config)
+    aggregate = scorer.aggregate()
+    for value in (1.0, 7.4, 4.2):
+        aggregate.add(Score(value, ""))
+    assert scorer.score_aggregate_evaluables(aggregate).value == 4.2
+    aggregate.add(Score(0.0, ""))
+    assert scorer.score_aggregate_evaluables(aggregate).value == 0.0
@@ -0,0 +1,230 @@
+"""Test the native node selection."""
+
+from typing import Any
+
+import pytest
+
+from dbt_score.selection import (
+    NodeSelector,
+    UnsupportedSelectorException,
+    _match_fqn,
+)
+
+
+def _node(
+    name: str,
+    parents: list[str] | None = None,
+    resource_type: str = "model",
+    path: str | None = None,
+    **kwargs,
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "resource_type": resource_type,
+        "package_name": "package",
+        "fqn": ["package", "staging" if name.startswith("stg") else "marts", name],
+        "original_file_path": path or f"models/{name}.sql",
+        "depends_on": {"nodes": parents or []},
+        "tags": [],
+        "config": {},
+        **kwargs,
+    }
+
+
+@pytest.fixture
+def selector() -> NodeSelector:
+    """A selector over a small project.
+
+    source.package.raw.orders_table -> stg_orders -> orders -> report (exposure)
+                                               ^
+    stg_customers -----------------------------+
+    """
+    return NodeSelector(
+        {
+            "source.package.raw.orders_table": {
+                "name": "orders_table",
+                "source_name": "raw",
+                "resource_type": "source",
+                "package_name": "package",
+                "fqn": ["package", "raw", "orders_table"],
+                "original_file_path": "models/sources.yml",
+            },
+            "model.package.stg_orders": _node(
+                "stg_orders",
+                ["source.package.raw.orders_table"],
+                path="models/staging/stg_orders.sql",
+                tags=["daily", "staging"],
+                config={"materialized": "view"},
+            ),
+            "model.package.stg_customers": _node(
+                "stg_customers",
+                path="models/staging/stg_customers.sql",
+                tags=["staging"],
+                config={"materialized": "view", "meta": {"owner": "a"}},
+            ),
+            "model.package.orders": _node(
+                "orders",
+                ["model.package.stg_orders", "model.package.stg_customers"],
+                tags=["daily"],
+                config={"materialized": "table", "contract": {"enforced": True}},
+                access="public",
+            ),
+            "exposure.package.report": _node(
+                "report", ["model.package.orders"], resource_type="exposure"
+            ),
+            "macro.package.my_macro": {
+                "name": "my_macro",
+                "resource_type": "macro",
+                "package_name": "package",
+                "original_file_path": "macros/my_macro.sql",
+                "tags": ["daily"],
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "select,expected",
+    [
+        (["stg_orders"], {"model.package.stg_orders"}),
+        (["my_macro"], {"macro.package.my_macro"}),
+        (["staging"], {"model.package.stg_orders", "model.package.stg_customers"}),
+        (["package.marts.orders"], {"model.package.orders"}),
+        (["stg_*"], {"model.package.stg_orders", "model.package.stg_customers"}),
+        (["marts.ord*"], {"model.package.orders"}),
+        (["tag:daily"], {"model.package.stg_orders", "model.package.orders"}),
+        (
+            ["path:models/staging"],
+            {"model.package.stg_orders", "model.package.stg_customers"},
+        ),
+        (["models/staging/stg_orders.sql"], {"model.package.stg_orders"}),
+        (["stg_orders.sql"], {"model.package.stg_orders"}),
+        (["file:stg_orders"], {"model.package.stg_orders"}),
+        (["config.materialized:table"], {"model.package.orders"}),
+        (["config.meta.owner:a"], {"model.package.stg_customers"}),
+        (["config.contract.enforced:true"], {"model.package.orders"}),
+        (["resource_type:exposure"], {"exposure.package.report"}),
+        (["source:raw"], {"source.package.raw.orders_table"}),
+        (["source:raw.orders_table"], {"source.package.raw.orders_table"}),
+        (["exposure:report"], {"exposure.package.report"}),
+        (["access:public"], {"model.package.orders"}),
+        (
+            ["unique_id:model.package.stg_*"],
+            {"model.package.stg_orders", "model.package.stg_customers"},
+        ),
+        (["tag:daily,config.materialized:view"], {"model.package.stg_orders"}),
+        (
+            ["stg_orders stg_customers"],
+            {"model.package.stg_orders", "model.package.stg_customers"},
+        ),
+        (
+            ["stg_orders", "stg_customers"],
+            {"model.package.stg_orders", "model.package.stg_customers"},
+        ),
+        (
+            ["+orders"],
+            {
+                "model.package.orders",
+                "model.package.stg_orders",
+                "model.package.stg_customers",
+                "source.package.raw.orders_table",
+            },
+        ),
+        (
+            ["1+orders"],
+            {
+                "model.package.orders",
+                "model.package.stg_orders",
+                "model.package.stg_customers",
+            },
+        ),
+        (
+            ["stg_orders+"],
+            {
+                "model.package.stg_orders",
+                "model.package.orders",
+                "exposure.package.report",
+            },
+        ),
+        (["stg_orders+1"], {"model.package.stg_orders", "model.package.orders"}),
+        (
+            ["@stg_orders"],
+            {
+                "source.package.raw.orders_table",
+                "model.package.stg_orders",
+                "model.package.stg_customers",
+                "model.package.orders",
+                "exposure.package.report",
+            },
+        ),
+        (["non_existing"], set()),
+    ],
+)
+def test_select(selector, select, expected):
+    """Test selection methods and graph operators."""
+    assert selector.select(select) == expected
+
+
+@pytest.mark.parametrize(
+    "fqn",
+    [
+        ["package", "marts", "orders"],
+        ["package", "staging", "stg_orders"],
+        ["package", "staging", "finance", "stg_orders.v2"],
+        ["package", "orders"],
+    ],
+)
+@pytest.mark.parametrize(
+    "select",
+    [
+        "orders",
+        "Orders",
+        "stg_orders",
+        "marts",
+        "marts.orders",
+        "staging.finance",
+        "finance.stg_orders",
+        "stg_orders.v2",
+        "v2",
+        "package",
+        "package.orders.extra",
+    ],
+)
+def test_match_fqn_like_dbt(fqn, select):
+    """Names are selected like dbt does.
+
+    Globs aren't compared, as their matching differs between versions of dbt.
+    """
+    selector_methods = pytest.importorskip("dbt.graph.selector_methods")
+
+    def dbt_match(fqn: list[str]) -> bool:
+        return bool(selector_methods.is_selected_node(fqn, select, False))
+
+    values = {"resource_type": "model", "package_name": fqn[0], "fqn": fqn}
+    assert _match_fqn("model.package.name", values, [], select) == (
+        dbt_match(fqn) or dbt_match(fqn[1:])
+    )
+
+
+def test_select_all_with_exclude(selector):
+    """Without selection, everything is selected but exclusions."""
+    assert selector.select(None, ["tag:staging", "resource_type:source"]) == {
+        "model.package.orders",
+        "exposure.package.report",
+        "macro.package.my_macro",
+    }
+
+
+def test_select_and_exclude(selector):
+    """Exclusions are removed from the selection."""
+    assert selector.select(["+orders"], ["+stg_orders"]) == {
+        "model.package.orders",
+        "model.package.stg_customers",
+    }
+
+
+@pytest.mark.parametrize("select", ["state:modified", "result:error", "+"])
+def test_select_unsupported(selector, select):
+    """Unsupported selectors raise an exception."""
+    with pytest.raises(UnsupportedSelectorException):
+        selector.select([select])